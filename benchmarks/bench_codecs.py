@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+# This script measures the output codecs (see py2srcml/sinks.py) on
+# a corpus of Python source files.  The corpus is converted to a
+# srcML archive once (in memory).  The archive is then written to a
+# file with each codec, in chunks of the emitter's buffer size as
+# done by py2srcml, and the time taken and size of the file are
+# recorded.  For each codec, the compression ratio, the throughput
+# (MB of XML per second), and the throughput of converting and
+# compressing the corpus together are reported.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/bench_codecs.py benchmarks/clcdsa/AtCoder
+#    $ python3 benchmarks/bench_codecs.py --codec gzip --level 1 --level 9 DIR
+#
+# A table is printed to stdout. Use -o to also save a JSON report.
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import typing
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import cli, emitter, scanner, sinks
+
+def convertCorpus(roots: typing.List[str]) -> typing.Tuple[bytes, float]:
+    """Converts the source files in the given directories (or files)
+    to a srcML archive.
+
+    Returns:
+        The archive and the time taken to generate it.
+    """
+    paths = list(scanner.findSources(roots))
+    sink = io.BytesIO()
+    start = time.perf_counter()
+    out = emitter.Emitter(sink)
+    cli.convertArchive(paths, out)
+    return sink.getvalue(), time.perf_counter() - start
+
+def timeCodec(archive: bytes, codec: str, level: typing.Optional[int],
+              bufferSize: int, directory: str, repeat: int) -> dict:
+    """Writes the archive with the given codec (best of repeat runs).
+
+    Returns:
+        The measurements for the codec.
+    """
+    path = os.path.join(directory, "archive.xml")
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sink = sinks.openSink(path, codec, level)
+        try:
+            for pos in range(0, len(archive), bufferSize):
+                sink.write(archive[pos:pos + bufferSize])
+                sink.flush()
+        finally:
+            sink.close()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    size = os.path.getsize(path)
+    return {"codec": codec, "level": level if codec != "none" else None,
+            "seconds": best, "outBytes": size,
+            "ratio": len(archive) / size if size else 0.0,
+            "mbPerSec": len(archive) / 1e6 / best if best else 0.0}
+
+def parseArgs(argv: typing.List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure the output "
+        "codecs of py2srcml on a corpus of Python source files")
+    parser.add_argument("roots", nargs="+", metavar="DIR",
+        help="Directories (or files) with the Python sources")
+    parser.add_argument("--codec", action="append", choices=sinks.CODECS,
+        help="Codec to be measured. May be repeated (default: all)")
+    parser.add_argument("--level", action="append", type=int, metavar="N",
+        help="Compression level to be measured. May be repeated "
+        "(default: the default level of each codec)")
+    parser.add_argument("--buffer-size", type=int,
+        default=emitter.BUFFER_SIZE, metavar="N",
+        help="Size of the chunks written to the sink")
+    parser.add_argument("--repeat", type=int, default=3, metavar="N",
+        help="Number of runs for each codec; the best is used (default: 3)")
+    parser.add_argument("-o", "--output", metavar="FILE",
+        help="Also write the JSON report to this file")
+    return parser.parse_args(argv)
+
+def main():
+    args = parseArgs(sys.argv[1:])
+    archive, convertTime = convertCorpus(args.roots)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in args.codec or sinks.CODECS:
+            levels = [None] if codec == "none" else args.level or [None]
+            for level in levels:
+                if codec != "none" and level is None:
+                    level = sinks.DEFAULT_LEVELS[codec]
+                results.append(timeCodec(archive, codec, level,
+                    args.buffer_size, directory, args.repeat))
+
+    print("Archive: {} bytes of XML converted in {:.3f} s".format(
+        len(archive), convertTime))
+    fmt = "{:<6}{:>6}{:>14}{:>9}{:>10}{:>16}"
+    print(fmt.format("Codec", "Level", "Bytes", "Ratio", "MB/s",
+                     "Convert+MB/s"))
+    for result in results:
+        total = convertTime + result["seconds"]
+        result["endToEndMbPerSec"] = len(archive) / 1e6 / total
+        print(fmt.format(result["codec"],
+            "-" if result["level"] is None else result["level"],
+            result["outBytes"], "{:.2f}".format(result["ratio"]),
+            "{:.1f}".format(result["mbPerSec"]),
+            "{:.2f}".format(result["endToEndMbPerSec"])))
+    if args.output:
+        with open(args.output, "w") as outFile:
+            json.dump({"xmlBytes": len(archive), "convertSeconds": convertTime,
+                       "codecs": results}, outFile, indent=1)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/python3
+
+# This script benchmarks py2srcml on a corpus of Python source files
+# (such as the CLCDSA AtCoder and CodeJamData directories).  Unlike
+# running py2srcml.py once per file, all the files are converted in
+# this process.  For each file, the time to read, parse (ast.parse),
+# convert, and validate (check that the srcML is well-formed XML) is
+# recorded along with the input and output sizes.  The script
+# produces a JSON report with latency percentiles, files/sec, and
+# MB/sec for each directory and for the whole corpus.  With
+# --positions, each file is also converted with position attributes
+# (see py2srcml/positions.py) and the added cost is reported.
+#
+# The conversion coverage is reported as well: the files that could
+# not be converted are counted by the reason for the failure, usually
+# the type of the (first) node that is not handled by the converter.
+# With --stdlib the .py files of the standard library of the running
+# interpreter (excluding site-packages) are used as the corpus, which
+# is large, realistic, and available without downloading anything.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/bench_corpus.py AtCoder CodeJamData -o report.json
+#    $ python3 benchmarks/bench_corpus.py --stdlib -o report.json
+#
+# A summary table is printed to stderr.
+
+import argparse
+import ast
+import io
+import json
+import os
+import re
+import sys
+import sysconfig
+import time
+import typing
+import xml.parsers.expat
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import cli, emitter, positions, scanner
+
+# The phases of processing a file that are timed
+PHASES = ("read", "parse", "convert", "validate", "total")
+
+# The directories of the standard library that are not part of it.
+STDLIB_EXCLUDE = ["site-packages", "dist-packages"]
+
+# The type of the node in the exceptions raised for nodes that are not
+# handled (eg: "Unhandled expression Starred(value=...)").
+UNHANDLED_RE = re.compile(r"\b([A-Z]\w*)\(")
+
+# The descriptions in such exceptions that add nothing to the type.
+GENERIC = ("", "statement", "expression", "name node")
+
+def failureReason(exp: Exception) -> str:
+    """Returns the reason a file could not be converted: the type of
+    the node that is not handled (eg: "Starred" or "For (for-else)"),
+    or else the type of the exception and its message (with numbers,
+    such as line numbers, replaced by N so that similar failures are
+    counted together).
+    """
+    message = str(exp)
+    if isinstance(exp, SyntaxError):
+        return "SyntaxError"
+    match = UNHANDLED_RE.search(message)
+    if "handled" in message[:12] and match:
+        nodeType = match.group(1)
+        # The text between "Unhandled" and the dump of the node
+        description = message[:match.start()].strip("('\", ").split(" ", 1)
+        description = description[1].replace("{}", "").strip() \
+            if len(description) > 1 else ""
+        if description in GENERIC or description.lower() == nodeType.lower():
+            return nodeType
+        return "{} ({})".format(nodeType, description)
+    message = re.sub(r"\d+", "N", message.split("\n")[0])
+    return "{}: {}".format(type(exp).__name__, message[:60])
+
+def validate(xmlData: bytes) -> None:
+    """Raises an exception if the given XML is not well-formed."""
+    xml.parsers.expat.ParserCreate().Parse(xmlData, True)
+
+def convertWithPositions(source: bytes, path: str) -> float:
+    """Converts a source file with position attributes and returns the
+    time taken (excluding parsing).
+    """
+    srcAST = ast.parse(source)
+    start = time.perf_counter()
+    positions.ENABLED = True
+    try:
+        out = emitter.Emitter(io.BytesIO())
+        cli.convertTree(srcAST, path, out, source)
+        out.flush()
+    finally:
+        positions.ENABLED = False
+    return time.perf_counter() - start
+
+def measureFile(path: str, group: str, check: bool = True,
+                withPositions: bool = False) -> dict:
+    """Converts a source file and records the time taken by each phase.
+
+    Arguments:
+        path: The source file to be converted.
+        group: The directory (group) to which the file belongs.
+        check: If True the generated srcML is validated.
+        withPositions: If True the time to convert the file with
+        position attributes is also recorded (as "positions").
+
+    Returns:
+        A dictionary with the measurements for the file.
+    """
+    rec = {"path": path, "group": group, "inBytes": 0, "outBytes": 0,
+           "generated": False, "valid": False, "error": None,
+           "reason": None}
+    for phase in PHASES:
+        rec[phase] = 0.0
+    rec["positions"] = None
+    try:
+        start = time.perf_counter()
+        with open(path, "rb") as srcFile:
+            source = srcFile.read()
+        rec["inBytes"] = len(source)
+        rec["read"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        srcAST = ast.parse(source)
+        rec["parse"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sink = io.BytesIO()
+        out = emitter.Emitter(sink)
+        cli.convertTree(srcAST, path, out)
+        out.flush()
+        xmlData = sink.getvalue()
+        rec["convert"] = time.perf_counter() - start
+        rec["outBytes"] = len(xmlData)
+        rec["generated"] = True
+
+        if check:
+            start = time.perf_counter()
+            validate(xmlData)
+            rec["validate"] = time.perf_counter() - start
+            rec["valid"] = True
+
+        if withPositions:
+            rec["positions"] = convertWithPositions(source, path)
+    except Exception as exp:
+        rec["error"] = "{}: {}".format(type(exp).__name__, exp)[:500]
+        rec["reason"] = failureReason(exp)
+    rec["total"] = sum(rec[phase] for phase in PHASES[:-1])
+    return rec
+
+def percentile(values: typing.List[float], q: float) -> float:
+    """Returns the q-th percentile (nearest rank) of sorted values."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, int(round(q / 100 * len(values))) - 1))
+    return values[rank]
+
+def summarize(records: typing.List[dict]) -> dict:
+    """Computes the summary statistics for a list of file measurements."""
+    seconds  = sum(rec["total"] for rec in records)
+    inBytes  = sum(rec["inBytes"] for rec in records)
+    summary = {
+        "files": len(records),
+        "generated": sum(1 for rec in records if rec["generated"]),
+        "valid": sum(1 for rec in records if rec["valid"]),
+        "inBytes": inBytes,
+        "outBytes": sum(rec["outBytes"] for rec in records),
+        "seconds": seconds,
+        "filesPerSec": len(records) / seconds if seconds else 0.0,
+        "mbPerSec": inBytes / 1e6 / seconds if seconds else 0.0,
+        "latency": {},
+    }
+    # The cost of positions relative to the conversion without them
+    timed = [rec for rec in records if rec["positions"] is not None]
+    convert = sum(rec["convert"] for rec in timed)
+    if timed and convert:
+        summary["positionsOverhead"] = \
+            sum(rec["positions"] for rec in timed) / convert - 1
+    for phase in PHASES:
+        values = sorted(rec[phase] for rec in records)
+        summary["latency"][phase] = {
+            "p50": percentile(values, 50), "p95": percentile(values, 95),
+            "p99": percentile(values, 99), "max": values[-1] if values else 0.0,
+            "sum": sum(values)}
+    return summary
+
+def coverage(records: typing.List[dict], examples: int = 3) -> dict:
+    """Computes the conversion coverage: the fraction of the files
+    converted (to valid srcML, if validated) without errors and, for
+    each reason for a failure (see failureReason), the number of files
+    and a few of the paths.
+    """
+    reasons: typing.Dict[str, dict] = {}
+    for rec in records:
+        if rec["reason"] is not None:
+            entry = reasons.setdefault(rec["reason"], {"files": 0, "paths": []})
+            entry["files"] += 1
+            if len(entry["paths"]) < examples:
+                entry["paths"].append(rec["path"])
+    converted = sum(1 for rec in records if rec["error"] is None)
+    return {"files": len(records), "converted": converted,
+            "rate": converted / len(records) if records else 0.0,
+            "reasons": dict(sorted(reasons.items(),
+                                   key=lambda item: -item[1]["files"]))}
+
+def groupOf(path: str, root: str, depth: int) -> str:
+    """Returns the group (directory) for a file: root followed by the
+    first depth components of the file's directory relative to root.
+    """
+    if not os.path.isdir(root):
+        return os.path.dirname(path) or "."
+    relDir = os.path.relpath(os.path.dirname(path), root)
+    parts = [part for part in relDir.split(os.sep) if part != "."]
+    return os.path.join(root, *parts[:depth])
+
+def runCorpus(roots: typing.List[str], srcFilter: scanner.SourceFilter,
+              depth: int = 1, check: bool = True,
+              progress: bool = False, withPositions: bool = False,
+              rootFilters: typing.Dict[str, scanner.SourceFilter] = None) -> dict:
+    """Benchmarks all the source files in the given directories (or files).
+
+    Arguments:
+        rootFilters: The filters used for some roots instead of srcFilter
+        (eg: to skip site-packages only in the standard library).
+
+    Returns:
+        The report with the overall and per-directory summaries.
+    """
+    records = []
+    for root in roots:
+        rootFilter = (rootFilters or {}).get(root, srcFilter)
+        for path in scanner.findSources([root], rootFilter):
+            records.append(measureFile(path, groupOf(path, root, depth),
+                                       check, withPositions))
+            if progress and len(records) % 1000 == 0:
+                print("{} files...".format(len(records)), file=sys.stderr)
+    groups: typing.Dict[str, list] = {}
+    for rec in records:
+        groups.setdefault(rec["group"], []).append(rec)
+    return {
+        "python": sys.version.split()[0],
+        "roots": roots,
+        "overall": summarize(records),
+        "directories": {group: summarize(recs)
+                        for group, recs in sorted(groups.items())},
+        "coverage": coverage(records),
+        "failures": [{"path": rec["path"], "error": rec["error"],
+                      "reason": rec["reason"]}
+                     for rec in records if rec["error"]],
+    }
+
+def printSummary(report: dict, out=sys.stderr) -> None:
+    """Prints a table with the number of files, generated, and valid
+    units along with the throughput and latency for each directory.
+    """
+    fmt = "{:>8}{:>8}{:>8}{:>10}{:>10}{:>10}{:>10}{:>10}  {}"
+    print(fmt.format("#Files", "#Gen", "#Valid", "Files/s", "MB/s",
+                     "p50 ms", "p95 ms", "p99 ms", "Dir"), file=out)
+    rows = list(report["directories"].items()) + [("(overall)", report["overall"])]
+    for name, summ in rows:
+        lat = summ["latency"]["total"]
+        print(fmt.format(summ["files"], summ["generated"], summ["valid"],
+            "{:.1f}".format(summ["filesPerSec"]), "{:.3f}".format(summ["mbPerSec"]),
+            "{:.2f}".format(lat["p50"] * 1e3), "{:.2f}".format(lat["p95"] * 1e3),
+            "{:.2f}".format(lat["p99"] * 1e3), name), file=out)
+    cover = report["coverage"]
+    print("Converted {} of {} files ({:.1f}%)".format(cover["converted"],
+        cover["files"], 100 * cover["rate"]), file=out)
+    for reason, entry in cover["reasons"].items():
+        print("{:>8}  {}  (eg: {})".format(entry["files"], reason,
+                                          entry["paths"][0]), file=out)
+    if "positionsOverhead" in report["overall"]:
+        print("Positions add {:.1f}% to the conversion time".format(
+            100 * report["overall"]["positionsOverhead"]), file=out)
+
+def parseArgs(argv: typing.List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark py2srcml on "
+        "a corpus of Python source files")
+    parser.add_argument("roots", nargs="*", metavar="DIR",
+        help="Directories (or files) with the Python sources")
+    parser.add_argument("--stdlib", action="store_true",
+        help="Also use the standard library of this interpreter "
+        "(excluding site-packages) as the corpus")
+    parser.add_argument("-o", "--output", metavar="FILE",
+        help="Write the JSON report to this file (default: stdout)")
+    parser.add_argument("--group-depth", type=int, default=1, metavar="N",
+        help="Number of directory levels used to group files (default: 1)")
+    parser.add_argument("--no-validate", action="store_true",
+        help="Do not check that the generated srcML is well-formed")
+    parser.add_argument("--include", action="append", metavar="GLOB",
+        help="Glob for source files (default: *.py)")
+    parser.add_argument("--exclude", action="append", default=[],
+        metavar="GLOB", help="Glob for files or directories to be skipped")
+    parser.add_argument("--positions", action="store_true",
+        help="Also measure the cost of generating position attributes")
+    parser.add_argument("--progress", action="store_true",
+        help="Print progress to stderr")
+    return parser.parse_args(argv)
+
+def main():
+    args = parseArgs(sys.argv[1:])
+    if not args.roots and not args.stdlib:
+        sys.exit("Specify the directories with the corpus or --stdlib")
+    include = args.include or scanner.DEFAULT_INCLUDE
+    srcFilter = scanner.SourceFilter(include, args.exclude)
+    rootFilters = {}
+    if args.stdlib:
+        # The packages installed in the standard library are skipped
+        # only there, not in the other roots.
+        stdlib = sysconfig.get_paths()["stdlib"]
+        args.roots.append(stdlib)
+        rootFilters[stdlib] = scanner.SourceFilter(include,
+                                                   args.exclude + STDLIB_EXCLUDE)
+    report = runCorpus(args.roots, srcFilter, args.group_depth,
+                       not args.no_validate, args.progress, args.positions,
+                       rootFilters)
+    printSummary(report)
+    if args.output:
+        with open(args.output, "w") as outFile:
+            json.dump(report, outFile, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+
+# This script measures how the time to convert a statement scales
+# with the depth of the expressions in it, for each of the engines
+# in iterative.ENGINES.  The statements are generated, eg: a chain
+# "x = a0 + a1 + ... + aN" is a left-deep tree of depth N.  The
+# recursive engine fails (RecursionError) once the depth exceeds what
+# the recursion limit allows.  The output of the iterative engine is
+# checked against the recursive engine whenever both succeed.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/bench_depth.py [-o report.json]
+#
+# Note that ast.parse also limits the depth of trees (based on the
+# recursion limit).  The limit is raised only while parsing the
+# generated statements.
+
+import argparse
+import ast
+import json
+import os
+import sys
+import time
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import iterative
+from py2srcml import stmt2srcml
+
+# Generators for statements with expressions of a given depth. Nested
+# parentheses are limited (to 200) by the parser. Chained calls such
+# as f(0)(1)(2) are not used as their srcML grows exponentially.
+SHAPES = {
+    "binop": lambda n: "x = " + " + ".join("a{}".format(i) for i in range(n)),
+    "attribute": lambda n: "x = " + ".".join("a{}".format(i) for i in range(n)),
+    "subscript": lambda n: "x = a" + "".join("[{}]".format(i) for i in range(n)),
+    "unary": lambda n: "x = " + "-" * n + "a",
+    "nested-call": lambda n: "x = " + "f(" * n + "a" + ")" * n,
+}
+
+# The maximum depth the parser supports for some shapes
+MAX_DEPTH = {"nested-call": 190}
+
+DEPTHS = (50, 100, 200, 400, 800, 1600, 3200)
+
+def parse(src: str, depth: int) -> ast.Module:
+    """Parses source code with a recursion limit sufficient for depth."""
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 4 * depth + 1000))
+    try:
+        return ast.parse(src)
+    finally:
+        sys.setrecursionlimit(limit)
+
+def timeEngine(tree: ast.Module, engine: str, repeat: int = 3):
+    """Returns the best time (in seconds) and the XML from converting
+    the statements in the tree with the given engine. The time is None
+    if the engine raised RecursionError.
+    """
+    stmt2srcml.ENGINE = engine
+    best, xml = None, None
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            xml = "".join([stmt2srcml.convertStmt(stmt) for stmt in tree.body])
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    except RecursionError:
+        return None, None
+    finally:
+        stmt2srcml.ENGINE = "auto"
+    return best, xml
+
+def run(shapes: list, depths: list) -> list:
+    """Runs the benchmark and prints a table with the time per level."""
+    rows = []
+    print("{:<12}{:>7}".format("Shape", "Depth") +
+          "".join("{:>13}".format(engine + " us") for engine in iterative.ENGINES) +
+          "  Same")
+    for shape in shapes:
+        for depth in depths:
+            if depth > MAX_DEPTH.get(shape, depth):
+                continue
+            tree = parse(SHAPES[shape](depth), depth)
+            row = {"shape": shape, "depth": depth}
+            outputs = {}
+            for engine in iterative.ENGINES:
+                seconds, outputs[engine] = timeEngine(tree, engine)
+                row[engine] = seconds
+            same = all(outputs[engine] == outputs["iterative"]
+                       for engine in iterative.ENGINES if outputs[engine])
+            row["same"] = same
+            rows.append(row)
+            print("{:<12}{:>7}".format(shape, depth) + "".join(
+                "{:>13}".format("{:.2f}".format(row[engine] * 1e6 / depth)
+                                if row[engine] is not None else "RecursionErr")
+                for engine in iterative.ENGINES) + "  " + ("yes" if same else "NO"))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the conversion "
+        "of deeply nested expressions (time per level, in microseconds)")
+    parser.add_argument("--shape", action="append", choices=sorted(SHAPES),
+        help="The shapes of expressions to be used (default: all)")
+    parser.add_argument("--depth", action="append", type=int, metavar="N",
+        help="The depths to be used (default: {})".format(
+            ", ".join(map(str, DEPTHS))))
+    parser.add_argument("-o", "--output", metavar="FILE",
+        help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    rows = run(args.shape or list(SHAPES), args.depth or list(DEPTHS))
+    if args.output:
+        with open(args.output, "w") as outFile:
+            json.dump(rows, outFile, indent=1)
+    if not all(row["same"] for row in rows):
+        sys.exit(1)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
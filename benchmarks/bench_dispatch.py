@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+
+# This script measures the per-node cost of finding the converter for
+# an AST node.  It compares the isinstance ladders that were used
+# in stmt2srcml.convertStmt and expr2srcml.convertExprValue (before)
+# with the type-keyed lookup in registry.py (after).  Only the
+# dispatch is timed; the converters themselves are not invoked.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/bench_dispatch.py [file.py ...]
+#
+# If no files are specified the sources in the tests directory are used.
+
+import argparse
+import ast
+import glob
+import os
+import sys
+import time
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import registry
+from py2srcml import stmt2srcml  # Importing the converters populates the registries
+
+# The order of the isinstance checks in the original ladders.
+STMT_LADDER = [ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+    ast.Return, ast.Delete, ast.Assign, ast.AugAssign, ast.AnnAssign,
+    ast.For, ast.AsyncFor, ast.While, ast.If, ast.With, ast.AsyncWith,
+    ast.Raise, ast.Try, ast.Assert, ast.Import, ast.ImportFrom,
+    ast.Global, ast.Nonlocal, ast.Expr, ast.Pass, ast.Break, ast.Continue]
+
+EXPR_LADDER = [ast.BoolOp, ast.NamedExpr, ast.BinOp, ast.UnaryOp,
+    ast.Lambda, ast.IfExp, ast.Dict, ast.Set, ast.ListComp, ast.SetComp,
+    ast.DictComp, ast.GeneratorExp, ast.Await, ast.Yield, ast.YieldFrom,
+    ast.Compare, ast.Call, ast.FormattedValue, ast.JoinedStr,
+    ast.Constant, ast.Attribute, ast.Subscript, ast.Starred, ast.Name,
+    ast.List, ast.Tuple, ast.Slice]
+
+def makeLadder(name: str, classes: list):
+    """Generates an if-elif chain of isinstance checks (in the same
+    order as the original converters) that returns the index of the
+    matching class.
+    """
+    src = ["def {}(node):".format(name)]
+    for i, cls in enumerate(classes):
+        src.append("    {} isinstance(node, ast.{}):".format(
+            "if" if i == 0 else "elif", cls.__name__))
+        src.append("        return {}".format(i))
+    src.append("    return None")
+    env = {"ast": ast}
+    exec("\n".join(src), env)
+    return env[name]
+
+def collectNodes(paths: list) -> tuple:
+    """Returns the statement and expression nodes in the given files."""
+    stmts, exprs = [], []
+    for path in paths:
+        with open(path, "rb") as srcFile:
+            tree = ast.parse(srcFile.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.stmt):
+                stmts.append(node)
+            elif isinstance(node, ast.expr):
+                exprs.append(node)
+    return stmts, exprs
+
+def timeDispatch(nodes: list, dispatch, byClass: bool, repeat: int = 5) -> dict:
+    """Returns the best (over repeat runs) ns/node for each node type.
+    If byClass is True, dispatch is called with type(node) (as done
+    by the registry) rather than the node itself.
+    """
+    byType = {}
+    for node in nodes:
+        byType.setdefault(type(node).__name__, []).append(node)
+    result = {}
+    for name, group in byType.items():
+        best = None
+        loops = max(1, 20000 // len(group))
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(loops):
+                if byClass:
+                    for node in group:
+                        dispatch(type(node))
+                else:
+                    for node in group:
+                        dispatch(node)
+            elapsed = (time.perf_counter_ns() - start) / (loops * len(group))
+            best = elapsed if best is None else min(best, elapsed)
+        result[name] = (len(group), best)
+    return result
+
+def report(title: str, nodes: list, ladder, reg: registry.NodeRegistry):
+    """Prints a table comparing the ladder and registry dispatch."""
+    before = timeDispatch(nodes, ladder, False)
+    after  = timeDispatch(nodes, reg.lookup, True)
+    print("\n{}".format(title))
+    print("{:<16}{:>8}{:>12}{:>12}{:>9}".format("Node", "Count",
+        "Ladder ns", "Registry ns", "Speedup"))
+    totBefore = totAfter = 0.0
+    for name in sorted(before, key=lambda n: -before[n][0]):
+        count, b = before[name]
+        a = after[name][1]
+        totBefore += count * b
+        totAfter  += count * a
+        print("{:<16}{:>8}{:>12.1f}{:>12.1f}{:>8.2f}x".format(name, count,
+            b, a, b / a))
+    total = sum(c for c, _ in before.values())
+    if total:
+        print("{:<16}{:>8}{:>12.1f}{:>12.1f}{:>8.2f}x".format("(weighted)",
+            total, totBefore / total, totAfter / total, totBefore / totAfter))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the cost of "
+        "isinstance ladders and registry lookups to dispatch AST nodes")
+    parser.add_argument("files", nargs="*", metavar="FILE",
+        help="Python source files whose nodes are used (default: the "
+        "sources in the tests directory)")
+    args = parser.parse_args()
+    paths = args.files or sorted(glob.glob(os.path.join(ROOT, "tests", "*.py")))
+    stmts, exprs = collectNodes(paths)
+    report("Statement dispatch (ns/node)", stmts,
+           makeLadder("stmtLadder", STMT_LADDER), registry.STATEMENTS)
+    report("Expression dispatch (ns/node)", exprs,
+           makeLadder("exprLadder", EXPR_LADDER), registry.EXPRESSIONS)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
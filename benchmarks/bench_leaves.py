@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+
+# This script checks that the leaf caches (see leafCache.py) are a net
+# win: converting the names and constants of real source files via
+# the caches (expr2srcml.convertName and convertConstant, with warm
+# caches) is compared with forming their XML every time, as the
+# converters did before the caches were added.  The time per leaf is
+# reported for each kind of leaf along with the speedup.  The check
+# fails (exit status 1) if the cached conversion of all the leaves is
+# slower than forming them.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/bench_leaves.py [file.py ...]
+#
+# If no files are specified the sources in the tests directory are used.
+
+import argparse
+import ast
+import glob
+import os
+import sys
+import time
+import typing
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import expr2srcml, leafCache
+from py2srcml import xmlFormat as XML
+
+def formName(node: ast.Name) -> str:
+    """Returns the XML for a name without using the cache (as
+    expr2srcml.convertName did before the caches were added).
+    """
+    if isinstance(node, ast.Name):
+        return XML.NAME.form(node.id)
+
+def collectLeaves(paths: typing.List[str]) -> typing.Dict[str, list]:
+    """Returns the name and constant nodes in the given source files
+    grouped by kind (the type of the constant values).
+    """
+    leaves: typing.Dict[str, list] = {}
+    for path in paths:
+        with open(path, "rb") as srcFile:
+            tree = ast.parse(srcFile.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                leaves.setdefault("name", []).append(node)
+            elif isinstance(node, ast.Constant):
+                kind = type(node.value).__name__
+                leaves.setdefault(kind, []).append(node)
+    return leaves
+
+def timeCalls(function: typing.Callable, nodes: list, repeat: int) -> float:
+    """Returns the best (over repeat runs) time in ns per call to
+    convert all the nodes with the function.
+    """
+    loops = max(1, 200000 // len(nodes))
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            for node in nodes:
+                function(node)
+        elapsed = (time.perf_counter_ns() - start) / (loops * len(nodes))
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(leaves: typing.Dict[str, list], repeat: int) -> typing.Tuple[float, float]:
+    """Prints a table with the time per leaf with and without the
+    caches for each kind of leaf.
+
+    Returns:
+        The total time (in ns) to convert all the leaves with and
+        without the caches.
+    """
+    print("{:<10}{:>8}{:>12}{:>12}{:>9}".format("Leaf", "Count",
+        "Form ns", "Cached ns", "Speedup"))
+    totForm = totCached = 0.0
+    for kind, nodes in sorted(leaves.items(), key=lambda item: -len(item[1])):
+        if kind == "name":
+            form, cached = formName, expr2srcml.convertName
+        else:
+            form, cached = expr2srcml.formConstant, expr2srcml.convertConstant
+        formNs = timeCalls(form, nodes, repeat)
+        cachedNs = timeCalls(cached, nodes, repeat)
+        totForm += formNs * len(nodes)
+        totCached += cachedNs * len(nodes)
+        print("{:<10}{:>8}{:>12.1f}{:>12.1f}{:>8.2f}x".format(kind,
+            len(nodes), formNs, cachedNs, formNs / cachedNs))
+    total = sum(len(nodes) for nodes in leaves.values())
+    print("{:<10}{:>8}{:>12.1f}{:>12.1f}{:>8.2f}x".format("(weighted)",
+        total, totForm / total, totCached / total, totForm / totCached))
+    return totForm, totCached
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that converting "
+        "names and constants via the leaf caches is faster than forming "
+        "their XML")
+    parser.add_argument("files", nargs="*", metavar="FILE",
+        help="Python source files whose leaves are used (default: the "
+        "sources in the tests directory)")
+    parser.add_argument("--repeat", type=int, default=5, metavar="N",
+        help="Number of runs for each kind of leaf; the best is used "
+        "(default: 5)")
+    args = parser.parse_args()
+    paths = args.files or sorted(glob.glob(os.path.join(ROOT, "tests", "*.py")))
+    leaves = collectLeaves(paths)
+    if not leaves:
+        sys.exit("No names or constants in the files")
+    leafCache.resizeAll(leafCache.DEFAULT_SIZE)
+    totForm, totCached = run(leaves, args.repeat)
+    if totCached > totForm:
+        print("The leaf caches are slower than forming the XML",
+              file=sys.stderr)
+        sys.exit(1)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/python3
+
+# This script measures the converter entry points of individual
+# modules in isolation (eg: expr2srcml.convertCompare or
+# try2srcml.convertTry), so that optimizing a single module can be
+# measured directly.  Each entry point is run on the nodes of its type
+# in a representative fixture.  The fixtures are parsed before timing,
+# so that only the conversion is measured.  The time per call and per
+# node (in the subtrees converted) is reported for each entry point.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/bench_modules.py [--bench convertTry] [-o report.json]
+#
+# By default the leaf caches (see leafCache.py) are enabled and warm,
+# as when converting a large file.  Use --no-leaf-cache to disable them.
+
+import argparse
+import ast
+import json
+import os
+import sys
+import time
+import typing
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import comp2srcml, expr2srcml, func2srcml, if2srcml
+from py2srcml import leafCache, op2srcml, try2srcml
+from py2srcml import xmlFormat as XML
+
+# The fixtures (Python source) from which the nodes are extracted.
+FIXTURES = {
+    "compare": """
+if a < b: pass
+if 0 <= index < len(items): pass
+if key not in seen and value is not None: pass
+if x == y != z: pass
+if self.count >= limit: pass
+""",
+    "subscript": """
+x = items[0]
+x = matrix[i][j]
+x = data["key"]
+x = values[1:-1]
+x = grid[i, j:k]
+x = self.table[name][::2]
+""",
+    "call": """
+print("Hello", name, sep=", ")
+result = func(a, b, key=value, **kwargs)
+obj.method()
+total = sum(x * x for x in values)
+logger.info("%s: %d", name, len(items))
+open(path, "rb").read()
+""",
+    "params": """
+def f(): pass
+def f(a, b, c): pass
+def f(self, name: str, value: int = 0) -> None: pass
+def f(*args, **kwargs): pass
+def f(a, /, b, *, c=1, d: float = 2.0): pass
+""",
+    "dict": """
+x = {}
+x = {"a": 1, "b": 2, "c": 3}
+x = {key: value, (1, 2): [a, b]}
+x = {"name": name, "items": [1, 2, 3], "nested": {"x": 0}}
+""",
+    "if": """
+if a:
+    x = 1
+if a > 0:
+    x = 1
+else:
+    x = -1
+if a == 1:
+    x = "one"
+elif a == 2:
+    x = "two"
+elif a == 3:
+    x = "three"
+else:
+    x = "many"
+if items and not done:
+    for item in items:
+        process(item)
+""",
+    "try": """
+try:
+    value = int(text)
+except ValueError:
+    value = 0
+try:
+    f = open(path)
+except (IOError, OSError) as error:
+    print(error)
+    raise RuntimeError(error)
+else:
+    data = f.read()
+finally:
+    cleanup()
+""",
+    "op": """
+x = a + b - c * d / e // f % g ** h
+x = a << b >> c | d & e ^ f @ g
+x = not a and b or c
+x = -a + ~b
+x = a == b != c < d <= e > f >= g
+x = a is b is not c in d not in e
+""",
+}
+
+def outermost(tree: ast.AST, nodeTypes: tuple) -> typing.List[ast.AST]:
+    """Returns the nodes of the given types in a tree that are not
+    within another node of those types (eg: the elif clauses are
+    converted as part of the outermost if statement).
+    """
+    nodes, pending = [], [tree]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, nodeTypes):
+            nodes.append(node)
+        else:
+            pending.extend(reversed(list(ast.iter_child_nodes(node))))
+    return nodes
+
+def operators(tree: ast.AST) -> typing.List[ast.AST]:
+    """Returns the operator nodes in a tree."""
+    opTypes = (ast.boolop, ast.operator, ast.unaryop, ast.cmpop)
+    return [node for node in ast.walk(tree) if isinstance(node, opTypes)]
+
+def formArgs(tree: ast.AST) -> typing.List[tuple]:
+    """Returns arguments for XML.form as used for the leaves of a
+    tree: a name or literal, optionally followed by an operator.
+    """
+    args = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            args.append(("name", node.id))
+        elif isinstance(node, ast.Constant):
+            args.append(("literal type=\"number\"", repr(node.value),
+                         "operator", "="))
+    return args
+
+def texts(tree: ast.AST) -> typing.List[str]:
+    """Returns the strings escaped for the leaves of a tree (names and
+    the source of constants, some with characters to be escaped).
+    """
+    values = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            values.append(node.id)
+        elif isinstance(node, ast.Constant):
+            values.append(repr(node.value))
+    return values + ["a < b && c > d", "<tag>", "x & y"]
+
+# The benchmarks: the fixture, the function that extracts the inputs
+# from the parsed fixture, and the entry point called with each input.
+BENCHMARKS: typing.Dict[str, tuple] = {
+    "expr2srcml.convertCompare": ("compare",
+        lambda tree: outermost(tree, (ast.Compare,)), expr2srcml.convertCompare),
+    "expr2srcml.convertSubscript": ("subscript",
+        lambda tree: outermost(tree, (ast.Subscript,)), expr2srcml.convertSubscript),
+    "func2srcml.convertFuncCall": ("call",
+        lambda tree: outermost(tree, (ast.Call,)), func2srcml.convertFuncCall),
+    "func2srcml.convertParams": ("params",
+        lambda tree: outermost(tree, (ast.arguments,)), func2srcml.convertParams),
+    "comp2srcml.convertDict": ("dict",
+        lambda tree: outermost(tree, (ast.Dict,)), comp2srcml.convertDict),
+    "if2srcml.convertIf": ("if",
+        lambda tree: outermost(tree, (ast.If,)), if2srcml.convertIf),
+    "try2srcml.convertTry": ("try",
+        lambda tree: outermost(tree, (ast.Try,)), try2srcml.convertTry),
+    "op2srcml.convertOp": ("op", operators, op2srcml.convertOp),
+    "xmlFormat.form": ("op", formArgs, lambda args: XML.form(*args)),
+    "xmlFormat.escape": ("op", texts, XML.escape),
+}
+
+def countNodes(value) -> int:
+    """Returns the number of AST nodes in an input (1 for the inputs
+    that are not AST nodes). The expression contexts (eg: ast.Load)
+    are not counted as they are not converted.
+    """
+    if not isinstance(value, ast.AST):
+        return 1
+    return sum(1 for node in ast.walk(value)
+               if not isinstance(node, ast.expr_context))
+
+def timeCalls(function: typing.Callable, inputs: list, repeat: int) -> float:
+    """Returns the best (over repeat runs) time in ns to call the
+    function with all the inputs. Each run calls the function enough
+    times (in loops over the inputs) to last a few milliseconds.
+    """
+    loops = max(1, 20000 // len(inputs))
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            for value in inputs:
+                function(value)
+        elapsed = (time.perf_counter_ns() - start) / loops
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(names: typing.List[str], repeat: int) -> typing.List[dict]:
+    """Runs the benchmarks and prints a table with the time per call
+    and per node of each entry point.
+    """
+    trees = {name: ast.parse(src) for name, src in FIXTURES.items()}
+    rows = []
+    print("{:<30}{:>7}{:>7}{:>11}{:>10}".format("Entry point", "Calls",
+                                                 "Nodes", "ns/call", "ns/node"))
+    for name in names:
+        fixture, extract, function = BENCHMARKS[name]
+        inputs = extract(trees[fixture])
+        nodes = sum(countNodes(value) for value in inputs)
+        elapsed = timeCalls(function, inputs, repeat)
+        print("{:<30}{:>7}{:>7}{:>11.0f}{:>10.1f}".format(name, len(inputs),
+              nodes, elapsed / len(inputs), elapsed / nodes))
+        rows.append({"name": name, "calls": len(inputs), "nodes": nodes,
+                     "nsPerCall": elapsed / len(inputs),
+                     "nsPerNode": elapsed / nodes})
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the converter "
+        "entry points of individual modules on pre-parsed fixtures")
+    parser.add_argument("--bench", action="append", choices=list(BENCHMARKS),
+        help="The entry points to be measured. May be repeated (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, metavar="N",
+        help="Number of runs for each entry point; the best is used "
+        "(default: 5)")
+    parser.add_argument("--no-leaf-cache", action="store_true",
+        help="Disable the caches of rendered names and constants")
+    parser.add_argument("-o", "--output", metavar="FILE",
+        help="Also write the results as JSON to this file")
+    args = parser.parse_args()
+    if args.no_leaf_cache:
+        leafCache.resizeAll(0)
+    rows = run(args.bench or list(BENCHMARKS), args.repeat)
+    if args.output:
+        with open(args.output, "w") as outFile:
+            json.dump(rows, outFile, indent=1)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
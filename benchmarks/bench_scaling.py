@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+
+# This script checks that the time to convert a module grows linearly
+# with the size of the module.  Modules are generated for families of
+# stress inputs (eg: a list literal with N elements or N nested if
+# statements) at increasing sizes N.  A growth exponent k (time ~ N^k)
+# is fitted to the conversion times of each family by least squares
+# on a log-log scale.  A converter that is accidentally quadratic
+# (eg: building its XML with += in a loop) has an exponent close to
+# 2.  The check fails (exit status 1) if the exponent of any family
+# exceeds a limit.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/bench_scaling.py [--family list] [-o report.json]
+#
+# Only the conversion is timed (parsing is not).  The sizes of the
+# nested families are limited by the parser (100 levels of indentation).
+
+import argparse
+import ast
+import io
+import json
+import math
+import os
+import sys
+import time
+import typing
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import cli, emitter
+
+def nested(header: str, footer: typing.List[str], n: int) -> str:
+    """Returns n compound statements nested within each other.
+
+    Arguments:
+        header: The first line of each statement (formatted with the
+        level of nesting).
+        footer: The lines after the body of each statement (eg: an
+        except clause), indented relative to the statement.
+        n: The number of levels of nesting.
+    """
+    lines = ["    " * level + header.format(level) for level in range(n)]
+    lines.append("    " * n + "x = 1")
+    for level in reversed(range(n)):
+        lines.extend("    " * level + line for line in footer)
+    return "\n".join(lines) + "\n"
+
+# The number of distinct names and constants in the generated inputs.
+# It is below the size of the leaf caches (see leafCache.py) so that
+# the caches hit equally often at all sizes.
+DISTINCT = 1000
+
+def joined(separator: str, n: int) -> str:
+    """Returns an assignment of n names joined by an operator."""
+    return "x = " + separator.join("a{}".format(i % DISTINCT)
+                                   for i in range(n)) + "\n"
+
+# The generators for the families of stress inputs of size n.
+FAMILIES: typing.Dict[str, typing.Callable[[int], str]] = {
+    "functions": lambda n: "".join("def f{0}(a, b):\n    return a + b * {0}\n"
+                                   .format(i) for i in range(n)),
+    "list": lambda n: "x = [" + ", ".join(str(i % DISTINCT)
+                                          for i in range(n)) + "]\n",
+    "dict": lambda n: "x = {" + ", ".join("{0}: 'v{0}'".format(i % DISTINCT)
+                                          for i in range(n)) + "}\n",
+    "binop": lambda n: joined(" + ", n),
+    "boolop": lambda n: joined(" and ", n),
+    "compare": lambda n: joined(" < ", n),
+    "string": lambda n: "x = '" + "a<&>b" * (n // 5) + "'\n",
+    "nested-if": lambda n: nested("if a{} > 0:", [], n),
+    "nested-for": lambda n: nested("for i{0} in range({0}):", [], n),
+    "nested-try": lambda n: nested("try:", ["except ValueError:", "    pass"], n),
+}
+
+# The sizes used for each family (the default is used for the others).
+# Deeper binop chains exceed the recursion limit of the parser and the
+# nested statements the limit on indentation.
+DEFAULT_SIZES = (1000, 2000, 4000, 8000, 16000)
+SIZES = {
+    "functions": (250, 500, 1000, 2000, 4000),
+    "binop": (200, 400, 800, 1600, 3200),
+    "string": (100000, 200000, 400000, 800000, 1600000),
+    "nested-if": (12, 24, 48, 96),
+    "nested-for": (12, 24, 48, 96),
+    "nested-try": (12, 24, 48, 96),
+}
+
+def parse(src: str, n: int) -> ast.Module:
+    """Parses source code with a recursion limit sufficient for n levels."""
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 4 * n + 1000))
+    try:
+        return ast.parse(src)
+    finally:
+        sys.setrecursionlimit(limit)
+
+def timeConversion(src: str, n: int, repeat: int) -> float:
+    """Returns the best time (in seconds) to convert a module to srcML.
+    The module is parsed again for each run as the conversion releases
+    the statements in the module.
+    """
+    best = math.inf
+    for _ in range(repeat):
+        tree = parse(src, n)
+        out = emitter.Emitter(io.BytesIO())
+        start = time.perf_counter()
+        cli.convertTree(tree, "stress.py", out)
+        out.flush()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def fitExponent(sizes: typing.List[int], times: typing.List[float]) -> float:
+    """Returns the slope of the least-squares line through the points
+    (log size, log time), i.e., k in time ~ size^k.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(seconds) for seconds in times]
+    meanX, meanY = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - meanX) ** 2 for x in xs)
+    sxy = sum((x - meanX) * (y - meanY) for x, y in zip(xs, ys))
+    return sxy / sxx
+
+def run(families: typing.List[str], repeat: int,
+        maxExponent: float) -> typing.List[dict]:
+    """Runs the benchmark and prints a table with the time per element
+    at each size and the fitted exponent of each family.
+    """
+    rows = []
+    print("{:<12}{:>9}{:>12}{:>12}{:>10}".format("Family", "N", "ms",
+                                                 "ns/elem", "Exponent"))
+    for family in families:
+        sizes = list(SIZES.get(family, DEFAULT_SIZES))
+        times = [timeConversion(FAMILIES[family](n), n, repeat) for n in sizes]
+        exponent = fitExponent(sizes, times)
+        for n, seconds in zip(sizes, times):
+            print("{:<12}{:>9}{:>12.3f}{:>12.0f}".format(family, n,
+                  seconds * 1e3, seconds * 1e9 / n))
+        status = "ok" if exponent <= maxExponent else "SUPER-LINEAR"
+        print("{:<12}{:>43.2f}  {}".format(family, exponent, status))
+        rows.append({"family": family, "sizes": sizes, "seconds": times,
+                     "exponent": exponent, "ok": exponent <= maxExponent})
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the time to "
+        "convert generated stress inputs grows linearly with their size")
+    parser.add_argument("--family", action="append", choices=list(FAMILIES),
+        help="The families of inputs to be used (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, metavar="N",
+        help="Number of runs for each size; the best is used (default: 3)")
+    parser.add_argument("--max-exponent", type=float, default=1.5,
+        metavar="K", help="Fail if the growth exponent of a family "
+        "exceeds this limit (default: 1.5)")
+    parser.add_argument("-o", "--output", metavar="FILE",
+        help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    rows = run(args.family or list(FAMILIES), args.repeat, args.max_exponent)
+    if args.output:
+        with open(args.output, "w") as outFile:
+            json.dump(rows, outFile, indent=1)
+    if not all(row["ok"] for row in rows):
+        sys.exit(1)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+
+# This script checks the start-up cost of the py2srcml command-line
+# tool.  It converts a small source file with "python3 -X importtime
+# -m py2srcml" a few times and uses the median import times reported
+# by the interpreter.  The check fails (exit status 1) if the total
+# import time exceeds a budget or if modules that are only needed for
+# some options (such as the disk cache, the process pool, or the
+# rarely used converters) are imported for a short invocation.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/check_imports.py [--budget MS] [file.py]
+#
+# The heaviest imports are printed to help find the cause of a
+# regression.
+
+import argparse
+import compileall
+import os
+import re
+import statistics
+import subprocess
+import sys
+import typing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules that must not be imported when converting a single file
+# without classes, try statements, or comprehensions (eg: tests/simple.py).
+FORBIDDEN = ("concurrent.futures", "json", "tempfile", "hashlib",
+    "py2srcml.batch", "py2srcml.unitCache", "py2srcml.incremental",
+    "py2srcml.subtreeCache", "py2srcml.scanner", "py2srcml.class2srcml",
+    "py2srcml.try2srcml", "py2srcml.comp2srcml", "py2srcml.sinks", "gzip",
+    "py2srcml.pipeline", "asyncio")
+
+# A line reported by -X importtime: self and cumulative times (in
+# microseconds) followed by the indented module name.
+IMPORT_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+def importTimes(module: str, pySrcPath: str) -> typing.Dict[str, typing.Tuple[int, int]]:
+    """Runs the given module on a source file and returns the self and
+    cumulative import times (in microseconds) of each imported module.
+    """
+    cmd = [sys.executable, "-X", "importtime", "-m", module, pySrcPath]
+    proc = subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode != 0:
+        sys.exit("{} failed:\n{}".format(" ".join(cmd), proc.stderr))
+    times = {}
+    for match in IMPORT_RE.finditer(proc.stderr):
+        times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+def measure(module: str, pySrcPath: str, runs: int) -> typing.Dict[str, typing.Tuple[float, float]]:
+    """Returns the median self and cumulative import times (in
+    milliseconds) of each module over a number of runs.
+    """
+    samples: typing.Dict[str, typing.List[typing.Tuple[int, int]]] = {}
+    for _ in range(runs):
+        for name, times in importTimes(module, pySrcPath).items():
+            samples.setdefault(name, []).append(times)
+    return {name: (statistics.median(t[0] for t in times) / 1e3,
+                   statistics.median(t[1] for t in times) / 1e3)
+            for name, times in samples.items()}
+
+def parseArgs(argv: typing.List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check the import time "
+        "of the py2srcml command-line tool")
+    parser.add_argument("file", nargs="?",
+        default=os.path.join("tests", "simple.py"),
+        help="Python source file to be converted (default: tests/simple.py)")
+    parser.add_argument("-m", "--module", default="py2srcml",
+        help="The module run with -m (default: py2srcml)")
+    parser.add_argument("-n", "--runs", type=int, default=5, metavar="N",
+        help="Number of runs; the median times are used (default: 5)")
+    parser.add_argument("--budget", type=float, default=60.0, metavar="MS",
+        help="Limit on the total import time in ms (default: 60)")
+    parser.add_argument("--forbid", action="append", default=[],
+        metavar="MODULE", help="An additional module that must not be "
+        "imported")
+    parser.add_argument("--top", type=int, default=10, metavar="N",
+        help="Number of the heaviest imports to be listed (default: 10)")
+    return parser.parse_args(argv)
+
+def main():
+    args = parseArgs(sys.argv[1:])
+    # Compiling stale modules (eg: if bytecode is not written due to
+    # PYTHONDONTWRITEBYTECODE) must not be counted as import time.
+    compileall.compile_dir(os.path.join(ROOT, "py2srcml"), quiet=1)
+    times = measure(args.module, args.file, args.runs)
+    total = sum(selfTime for selfTime, _ in times.values())
+
+    print("{:>10}{:>10}  {}".format("Self ms", "Cum. ms", "Module"))
+    heaviest = sorted(times.items(), key=lambda item: -item[1][1])
+    for name, (selfTime, cumTime) in heaviest[:args.top]:
+        print("{:>10.2f}{:>10.2f}  {}".format(selfTime, cumTime, name))
+    print("Total import time: {:.2f} ms (budget: {:.2f} ms)".format(
+        total, args.budget))
+
+    violations = ["imports {}".format(name)
+                  for name in FORBIDDEN + tuple(args.forbid) if name in times]
+    if total > args.budget:
+        violations.append("exceeds the budget by {:.2f} ms".format(
+            total - args.budget))
+    for violation in violations:
+        print("FAIL: {} {}".format(args.module, violation), file=sys.stderr)
+    sys.exit(1 if violations else 0)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
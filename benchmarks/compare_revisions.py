@@ -0,0 +1,317 @@
+#!/usr/bin/python3
+
+# This script compares the performance of the converter at two git
+# revisions (eg: before and after a change) on a corpus of Python
+# source files.  Each revision is checked out in its own (temporary)
+# git worktree.  The corpus is then converted a number of times with
+# each revision, alternating between the revisions, in a fresh process
+# for each run (see measure).  The following metrics are recorded:
+#
+#    filesPerSec   - files converted (read excluded) per second
+#    bytesPerLine  - bytes of srcML generated per line of source
+#    peakMemoryMB  - the peak resident memory of the process
+#    ns/<Node>     - nanoseconds (exclusive) per node of each type, if
+#                    the revision supports --profile-nodes
+#
+# The results of every run are appended to a history file (JSON lines)
+# that is never rewritten, so that the performance of the converter
+# can be tracked across changes.  For each metric, the change from the
+# base to the head revision is reported along with the noise (twice
+# the standard error of the difference of the means).  A change that
+# exceeds the noise is significant.  The exit status is 1 if a metric
+# regresses significantly by more than a threshold.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 benchmarks/compare_revisions.py HEAD~1 HEAD --corpus DIR
+#
+# The corpus is read from the current tree (not the worktrees), so
+# both revisions convert the same files.  Revisions with the py2srcml
+# package and those with flat modules (py2srcml.py, stmt2srcml.py, ...
+# at the top level, up to the baseline) are supported.  The latter
+# only have convert(path), which writes to stdout.  So their srcML is
+# captured from stdout and their time includes reading the files (from
+# the page cache, as the files were read before).  Each revision
+# converts the corpus once before it is timed (which imports the
+# converters that are imported lazily).  A revision whose converter
+# cannot be imported or run is reported with the error.
+
+import argparse
+import io
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The default file to which the results of every run are appended.
+HISTORY = os.path.join(ROOT, ".benchmark-history.jsonl")
+
+# The metrics for which larger values are better (smaller is better
+# for the others).
+HIGHER_IS_BETTER = ("filesPerSec",)
+
+def findSources(roots: typing.List[str]) -> typing.List[str]:
+    """Returns the Python source files in the given directories (or
+    files), sorted so that every run converts them in the same order.
+    """
+    paths = []
+    for root in roots:
+        if not os.path.isdir(root):
+            paths.append(root)
+            continue
+        for dirPath, _, fileNames in os.walk(root):
+            paths.extend(os.path.join(dirPath, name)
+                         for name in fileNames if name.endswith(".py"))
+    return sorted(paths)
+
+def loadConverter(root: str) -> typing.Callable[[str, bytes], bytes]:
+    """Imports the converter in a worktree and returns a method that
+    converts a source file (given its path and contents) to srcML.
+    """
+    sys.path.insert(0, root)
+    if os.path.isdir(os.path.join(root, "py2srcml")):
+        from py2srcml import cli, emitter
+
+        def convertPackaged(path: str, source: bytes) -> bytes:
+            sink = io.BytesIO()
+            cli.convertSource(source, path, emitter.Emitter(sink))
+            return sink.getvalue()
+        convert = convertPackaged
+    else:
+        # The flat modules import xml.py as XML (on a case-insensitive
+        # file system). So it is made available under that name.
+        xmlPath = os.path.join(root, "xml.py")
+        if os.path.exists(xmlPath) and not os.path.exists(os.path.join(root, "XML.py")):
+            import importlib.util
+            spec = importlib.util.spec_from_file_location("XML", xmlPath)
+            sys.modules["XML"] = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(sys.modules["XML"])
+        import py2srcml as tool
+
+        def convertFlat(path: str, source: bytes) -> bytes:
+            stdout = sys.stdout
+            sys.stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+            try:
+                tool.convert(path)
+                sys.stdout.flush()
+                return sys.stdout.buffer.getvalue()
+            finally:
+                sys.stdout = stdout
+        convert = convertFlat
+    module = sys.modules["py2srcml"]
+    assert module.__file__.startswith(root), "py2srcml not imported from the worktree"
+    return convert
+
+def measure(root: str, roots: typing.List[str]) -> dict:
+    """Converts the corpus with the converter in a worktree and returns
+    the metrics. This method is run in a separate process (see
+    runMeasure) so that the converter of the worktree is imported and
+    the peak memory is only that of converting the corpus.
+
+    Arguments:
+        root: The root of the worktree with the converter.
+        roots: The directories (or files) with the corpus.
+    """
+    import resource
+    convert = loadConverter(root)
+    sources = []
+    for path in findSources(roots):
+        with open(path, "rb") as srcFile:
+            sources.append((path, srcFile.read()))
+
+    def convertAll() -> typing.Tuple[int, int]:
+        """Converts the corpus and returns the output bytes and failures."""
+        outBytes = failures = 0
+        for path, source in sources:
+            try:
+                outBytes += len(convert(path, source))
+            except Exception:
+                failures += 1
+        return outBytes, failures
+
+    # An untimed pass imports the converters that are imported lazily
+    convertAll()
+    start = time.perf_counter()
+    outBytes, failures = convertAll()
+    seconds = time.perf_counter() - start
+    lines = sum(source.count(b"\n") for _, source in sources)
+    metrics = {"filesPerSec": len(sources) / seconds if seconds else 0.0,
+               "bytesPerLine": outBytes / lines if lines else 0.0,
+               # ru_maxrss is in kilobytes (on Linux)
+               "peakMemoryMB": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+    counts = {}
+    try:
+        from py2srcml import nodeProfiler
+    except ImportError:
+        nodeProfiler = None
+    if nodeProfiler is not None:
+        # Profiled separately as the profiler slows down the conversion
+        nodeProfiler.enable()
+        convertAll()
+        nodeProfiler.disable()
+        for name, stats in nodeProfiler.collect().items():
+            metrics["ns/" + name] = 1e9 * stats["exclusive"] / stats["count"]
+            counts[name] = stats["count"]
+    return {"files": len(sources), "lines": lines, "failures": failures,
+            "seconds": seconds, "nodeCounts": counts, "metrics": metrics}
+
+def runMeasure(worktree: str, roots: typing.List[str]) -> dict:
+    """Runs measure in a new process for a worktree and returns its result."""
+    cmd = [sys.executable, os.path.abspath(__file__), "--measure", worktree]
+    proc = subprocess.run(cmd + roots, stdout=subprocess.PIPE,
+                          universal_newlines=True)
+    if proc.returncode != 0:
+        raise RuntimeError("measuring {} failed (exit status {})".format(
+            worktree, proc.returncode))
+    return json.loads(proc.stdout)
+
+def git(*args: str) -> str:
+    """Runs a git command in this repository and returns its output."""
+    return subprocess.run(["git"] + list(args), cwd=ROOT, check=True,
+                          stdout=subprocess.PIPE,
+                          universal_newlines=True).stdout.strip()
+
+def addWorktree(revision: str, directory: str, name: str) -> str:
+    """Checks out a revision in a new worktree (with a detached HEAD)
+    within the given directory and returns the path to the worktree.
+    """
+    path = os.path.join(directory, name)
+    git("worktree", "add", "--detach", "--quiet", path, revision)
+    return path
+
+def summarize(values: typing.List[float]) -> typing.Tuple[float, float]:
+    """Returns the mean and the variance of the mean of the values."""
+    mean = statistics.fmean(values)
+    variance = statistics.variance(values) / len(values) if len(values) > 1 else 0.0
+    return mean, variance
+
+def compare(base: typing.List[dict], head: typing.List[dict],
+            threshold: float, minNodes: int) -> typing.List[dict]:
+    """Compares the metrics from the runs of two revisions.
+
+    Arguments:
+        base: The results of the runs of the base revision.
+        head: The results of the runs of the head revision.
+        threshold: The change (in percent) beyond which a significant
+        change for the worse is a regression.
+        minNodes: The per-node metrics of node types with fewer nodes
+        in the corpus are not compared (their timings are noisy).
+
+    Returns:
+        The comparison of each metric measured for both revisions.
+    """
+    counts = base[0]["nodeCounts"]
+    names = [name for name in base[0]["metrics"] if name in head[0]["metrics"]
+             and (not name.startswith("ns/") or counts.get(name[3:], 0) >= minNodes)]
+    rows = []
+    for name in names:
+        baseMean, baseVar = summarize([run["metrics"][name] for run in base])
+        headMean, headVar = summarize([run["metrics"][name] for run in head])
+        change = 100 * (headMean - baseMean) / baseMean if baseMean else 0.0
+        noise = 100 * 2 * math.sqrt(baseVar + headVar) / baseMean if baseMean else 0.0
+        # With a single run, the noise cannot be estimated
+        significant = abs(change) > noise or len(base) < 2 or len(head) < 2
+        worse = change < 0 if name in HIGHER_IS_BETTER else change > 0
+        if not significant:
+            status = "~"
+        elif worse:
+            status = "REGRESSION" if abs(change) > threshold else "worse"
+        else:
+            status = "better"
+        rows.append({"metric": name, "base": baseMean, "head": headMean,
+                     "change": change, "noise": noise, "status": status})
+    return rows
+
+def printComparison(rows: typing.List[dict], labels: typing.Tuple[str, str]) -> None:
+    """Prints a table with the change in each metric."""
+    fmt = "{:<24}{:>14}{:>14}{:>10}{:>10}  {}"
+    print(fmt.format("Metric", labels[0][:12], labels[1][:12], "Change",
+                     "Noise", "Status"))
+    for row in rows:
+        print(fmt.format(row["metric"], "{:.2f}".format(row["base"]),
+                         "{:.2f}".format(row["head"]),
+                         "{:+.1f}%".format(row["change"]),
+                         "{:.1f}%".format(row["noise"]), row["status"]))
+
+def appendHistory(path: str, record: dict) -> None:
+    """Appends a record (a line of JSON) to the history file."""
+    with open(path, "a", encoding="utf-8") as historyFile:
+        historyFile.write(json.dumps(record, sort_keys=True) + "\n")
+
+def parseArgs(argv: typing.List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare the performance "
+        "of the converter at two git revisions on a corpus")
+    parser.add_argument("base", help="The revision to compare against")
+    parser.add_argument("head", nargs="?", default="HEAD",
+        help="The revision to be evaluated (default: HEAD)")
+    parser.add_argument("--corpus", action="append", metavar="DIR",
+        help="Directory (or file) with the corpus. May be repeated "
+        "(default: tests)")
+    parser.add_argument("--runs", type=int, default=5, metavar="N",
+        help="Number of runs for each revision (default: 5)")
+    parser.add_argument("--threshold", type=float, default=5.0, metavar="PCT",
+        help="Significant changes for the worse larger than this "
+        "percentage are regressions (default: 5)")
+    parser.add_argument("--min-nodes", type=int, default=1000, metavar="N",
+        help="Compare the time per node only for node types with at "
+        "least N nodes in the corpus (default: 1000)")
+    parser.add_argument("--history", default=HISTORY, metavar="FILE",
+        help="File to which the results are appended (default: {})".format(
+            os.path.relpath(HISTORY)))
+    parser.add_argument("-o", "--output", metavar="FILE",
+        help="Also write the comparison as JSON to this file")
+    return parser.parse_args(argv)
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--measure":
+        json.dump(measure(sys.argv[2], sys.argv[3:]), sys.stdout)
+        return
+    args = parseArgs(sys.argv[1:])
+    roots = [os.path.abspath(root) for root in
+             args.corpus or [os.path.join(ROOT, "tests")]]
+    labels = (args.base, args.head)
+    shas = [git("rev-parse", "--verify", label + "^{commit}") for label in labels]
+    results: typing.Tuple[list, list] = ([], [])
+    with tempfile.TemporaryDirectory() as directory:
+        worktrees = []
+        try:
+            for name, sha in zip(("base", "head"), shas):
+                worktrees.append(addWorktree(sha, directory, name))
+            # Alternate between the revisions so that a change in the
+            # load of the machine affects both equally.
+            for run in range(args.runs):
+                for i in range(2):
+                    try:
+                        results[i].append(runMeasure(worktrees[i], roots))
+                    except RuntimeError:
+                        sys.exit("The converter at {} ({}) could not be "
+                                 "measured; see the error above".format(
+                                     labels[i], shas[i][:12]))
+                print("Run {}/{} done".format(run + 1, args.runs), file=sys.stderr)
+        finally:
+            for worktree in worktrees:
+                git("worktree", "remove", "--force", worktree)
+
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    for label, sha, runs in zip(labels, shas, results):
+        appendHistory(args.history, {"time": timestamp, "revision": sha,
+            "label": label, "python": sys.version.split()[0],
+            "corpus": roots, "runs": runs})
+    rows = compare(results[0], results[1], args.threshold, args.min_nodes)
+    printComparison(rows, labels)
+    if args.output:
+        with open(args.output, "w") as outFile:
+            json.dump({"base": shas[0], "head": shas[1], "metrics": rows},
+                      outFile, indent=1)
+    if any(row["status"] == "REGRESSION" for row in rows):
+        sys.exit(1)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
@@ -31,62 +31,14 @@
 #     DJ Rao               raodm@miamioh.edu
 #------------------------------------------------------------------------
 
-import ast
-import sys
-import typing
-
-import srcMLFormats
-import stmt2srcml
-
-def convertModule(module: ast.Module) -> None:
-    """Helper method to generate srcML for a given module. A module
-    consists of many functions.
-    """
-    print(stmt2srcml.convertBlock(module.body, content_only=True))
-
-    # print("<block>:<block_content>")
-    # Process each statement in the module 
-    # for stmt in module.body:
-    #     print(stmt2srcml.convertStmt(stmt))
-    # Finish the XML for the module
-    # print("</block_content></block>")
-
-def convert(pySrcPath: str) -> None:
-    """Top-level method that performs the generation of srcML from a 
-    given Python source file.
-    
-    Arguments:
-        pySrcPath: Path to the python source file to be processed
-    """
-    # Open the specified source file.
-    srcFile = open(pySrcPath, "r")
-    if not srcFile.readable():
-        raise IOError("Unable to read from {}".format(pySrcPath))
-    # Now that the file is valid, let's parse it with Python's ast
-    srcAST: ast.Module = ast.parse(srcFile.read())
-    # Now, let's process the body of the top-level module
-    print(srcMLFormats.START_UNIT.format(pySrcPath))
-    convertModule(srcAST)
-    print(srcMLFormats.END_UNIT.format(pySrcPath))
+# This script runs the py2srcml command-line tool (see py2srcml/cli.py)
+# so that it can continue to be used in the following manner:
+#    $ python3 py2srcml.py tests/simple.py
+#
+# It is equivalent to running: python3 -m py2srcml tests/simple.py
 
-def main():
-    """The main function that starts the process of XML generation
-    by calling suitable helper methods.
-    
-    It uses command line arguments. Each command-line argument
-    is assumed to be a python program to be converted to
-    srcML.
-    """
-    # If we don't have command-line arguments, then report an error
-    if len(sys.argv) < 2:
-        print("Specify python source file as command-line argument.")
-    else:
-        print(srcMLFormats.PROLOG)
-        # Process each source file specified as command-line argument
-        for pySrcPath in sys.argv[1:]:
-            # print("Converting {}".format(pySrcPath))
-            convert(pySrcPath)
+from py2srcml import cli
 
 # The top-level script.
 if __name__ == "__main__":
-    main()
+    cli.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# py2srcml converts Python source code to srcML.  The command-line
+# interface is in cli.py (run as "python3 -m py2srcml").  The modules
+# that are only needed for some options (eg: the on-disk cache or the
+# parallel batch mode) are imported lazily via lazyImport so that
+# short invocations start quickly.  This module itself must remain
+# cheap to import as the client (see client.py) also imports it.
+# Hence, the library API (see api.py) is imported on first use:
+#
+#    import py2srcml
+#    xml = py2srcml.convertSource("x = 1\n", "x.py")
+
+import sys
+
+class LazyModule:
+    """A proxy for a module of this package that imports the module when
+    one of its attributes is first used.
+    """
+
+    def __init__(self, name: str):
+        """Creates the proxy for a module.
+
+        Arguments:
+            name: The name of the module in this package (eg: "batch").
+        """
+        self.moduleName = "{}.{}".format(__name__, name)
+
+    def __getattr__(self, attr: str):
+        # __import__ (rather than importlib) is reported by -X importtime
+        module = sys.modules.get(self.moduleName)
+        if module is None:
+            __import__(self.moduleName)
+            module = sys.modules[self.moduleName]
+        return getattr(module, attr)
+
+
+def lazyImport(name: str) -> LazyModule:
+    """Returns a proxy for a module of this package that is only
+    imported when one of its attributes is first used.
+
+    Arguments:
+        name: The name of the module in this package (eg: "batch").
+    """
+    return LazyModule(name)
+
+
+# The names of the library API that are available from this package.
+API = ("configure", "convertSource", "convertFile", "iterConvert", "convertTo")
+
+def __getattr__(name: str):
+    """Imports the library API (see api.py) when it is first used."""
+    if name in API:
+        from . import api
+        return getattr(api, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+# End of source code
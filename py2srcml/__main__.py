@@ -0,0 +1,5 @@
+# Runs the py2srcml command-line interface: python3 -m py2srcml FILE...
+
+from .cli import main
+
+main()
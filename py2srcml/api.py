@@ -0,0 +1,193 @@
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the library API for converting Python
+# source code to srcML in-process.  The XML is returned as a string,
+# written to a binary file, or yielded for each of a batch of files;
+# nothing is printed.  The converter is configured (eg: tolerant
+# mode or the caches) using the same options as the command-line
+# tool (see configure).  For example:
+#
+#    import py2srcml
+#    xml = py2srcml.convertSource("x = 1\n", "x.py")
+#    for path, xml in py2srcml.iterConvert(["a.py", "b.py"]):
+#        ...
+#
+# Conversions only use bounded caches so that these methods can be
+# called any number of times in a long-running process.
+
+from __future__ import annotations
+
+import argparse
+import io
+import typing
+
+from . import cli
+from . import emitter
+from . import lazyImport
+from . import srcMLFormats
+
+batch = lazyImport("batch")
+
+# The options used to configure the converter (see configure). They
+# are also used to setup worker processes.
+OPTIONS: typing.Optional[argparse.Namespace] = None
+
+def configure(**options: typing.Any) -> None:
+    """Configures the converter in this process. The keyword arguments
+    are the converter options of the command-line tool with dashes
+    replaced by underscores (eg: tolerant=True, cache_dir="cache",
+    subtree_cache_size=1024). Options that are not specified are reset
+    to their defaults.
+
+    Arguments:
+        options: The values of the converter options.
+    """
+    global OPTIONS
+    parser = argparse.ArgumentParser()
+    cli.addConverterOptions(parser)
+    args = parser.parse_args([])
+    for name, value in options.items():
+        if not hasattr(args, name):
+            raise TypeError("Unknown converter option {}".format(name))
+        setattr(args, name, value)
+    cli.setup(args)
+    OPTIONS = args
+
+def convertSource(source: typing.Union[str, bytes], filename: str = "<string>",
+                  info: typing.Dict[str, typing.Any] = None) -> str:
+    """Converts Python source code to a srcML unit.
+
+    Arguments:
+        source: The Python source code to be converted.
+        filename: The filename recorded in the unit.
+        info: Optional dictionary in which additional information
+        about the conversion (eg: degraded statements) is recorded.
+
+    Returns:
+        The srcML unit (without the XML prolog). Exceptions (eg: a
+        SyntaxError) are raised if the source cannot be converted.
+    """
+    sink = io.BytesIO()
+    cli.convertSource(source, filename, emitter.Emitter(sink), info)
+    return sink.getvalue().decode("utf-8")
+
+def convertFile(pySrcPath: str, info: typing.Dict[str, typing.Any] = None) -> str:
+    """Converts a Python source file to a srcML unit.
+
+    Arguments:
+        pySrcPath: Path to the python source file (used in the unit).
+        info: Optional dictionary in which additional information
+        about the conversion (eg: degraded statements) is recorded.
+
+    Returns:
+        The srcML unit (without the XML prolog).
+    """
+    source = cli.mapSource(pySrcPath)
+    try:
+        return convertSource(source, pySrcPath, info)
+    finally:
+        cli.closeSource(source)
+
+def convertUnits(pySrcPaths: typing.Iterable[str], jobs: int = 1,
+                 chunkSize: int = 8) -> typing.Iterator[batch.UnitResult]:
+    """Converts a batch of source files (in parallel if jobs > 1) and
+    yields the results in the order of the paths.
+    """
+    return batch.convertFiles(pySrcPaths, cli.convertUnit, jobs,
+        chunkSize, initializer=cli.setup if OPTIONS else None,
+        initargs=(OPTIONS,) if OPTIONS else (), prefetch=cli.prefetchSource,
+        readAhead=cli.READ_AHEAD)
+
+def iterConvert(pySrcPaths: typing.Iterable[str], jobs: int = 1,
+                chunkSize: int = 8, errors: typing.Dict[str, str] = None
+                ) -> typing.Iterator[typing.Tuple[str, typing.Optional[str]]]:
+    """Converts a batch of Python source files to srcML units. The
+    paths are consumed lazily and the units are yielded in the same
+    order as the paths.
+
+    Arguments:
+        pySrcPaths: The paths to the python source files.
+        jobs: The number of processes used to convert the files.
+        chunkSize: The number of files sent to a process at a time.
+        errors: Optional dictionary in which the reason a file could
+        not be converted is recorded (keyed by path).
+
+    Returns:
+        An iterator over (path, unit) pairs. The unit is None if the
+        file could not be converted.
+    """
+    for result in convertUnits(pySrcPaths, jobs, chunkSize):
+        if result.error is not None and errors is not None:
+            errors[result.path] = result.error
+        yield result.path, None if result.xml is None else result.xml.decode("utf-8")
+
+def convertTo(out: typing.BinaryIO,
+              pySrcPaths: typing.Union[str, typing.Iterable[str]],
+              jobs: int = 1, chunkSize: int = 8,
+              errors: typing.Dict[str, str] = None) -> bool:
+    """Writes a srcML document to a binary file. The document is a
+    single unit if one path (a string) is given and an archive of
+    units otherwise.
+
+    Arguments:
+        out: The binary file (eg: open(path, "wb")) to write to.
+        pySrcPaths: The path to a python source file or an iterable
+        of paths.
+        jobs: The number of processes used to convert the files.
+        chunkSize: The number of files sent to a process at a time.
+        errors: Optional dictionary in which the reason a file could
+        not be converted is recorded (keyed by path). Such files are
+        not included in the archive.
+
+    Returns:
+        True if all the files were converted. For a single file,
+        exceptions are raised instead.
+    """
+    xmlOut = emitter.Emitter(out)
+    xmlOut.writeLine(srcMLFormats.PROLOG)
+    if isinstance(pySrcPaths, str):
+        cli.convert(pySrcPaths, xmlOut)
+        return True
+    success = True
+    xmlOut.writeLine(srcMLFormats.START_ARCHIVE)
+    for result in convertUnits(pySrcPaths, jobs, chunkSize):
+        if result.error is None:
+            xmlOut.writeBytes(result.xml)
+        else:
+            if errors is not None:
+                errors[result.path] = result.error
+            success = False
+    xmlOut.writeLine(srcMLFormats.END_ARCHIVE)
+    xmlOut.flush()
+    return success
+
+# End of source code
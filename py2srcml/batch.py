@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the methods used to convert a batch of
+# Python source files to srcML.  The files are converted in a pool of
+# processes.  The srcML for each file (a unit) is returned in the same
+# order as the input files.  Only a bounded number of units are in
+# flight (or waiting to be written) at any time so that memory usage
+# stays flat for arbitrarily large batches.  Optionally, the kernel is
+# asked to read the next few files (see cli.prefetchSource) while the
+# current file is converted so that reading overlaps with conversion.
+
+import collections
+import concurrent.futures
+import itertools
+import typing
+
+class UnitResult(typing.NamedTuple):
+    """The result of converting one source file to a srcML unit."""
+    # The path to the source file
+    path: str
+    # The UTF-8 encoded srcML unit. None if the conversion failed
+    xml: typing.Optional[bytes]
+    # The reason for failure. None if the conversion succeeded
+    error: typing.Optional[str]
+    # Additional information about the conversion (eg: cache status)
+    info: typing.Dict[str, typing.Any]
+
+# The signature of the method that converts a source file to a unit.
+# A failure must be recorded in the result (rather than raised) so
+# that the remaining files are still converted.
+UnitConverter = typing.Callable[[str], UnitResult]
+
+# The signature of the method that starts reading a source file in the
+# background. It must not raise exceptions.
+SourcePrefetcher = typing.Callable[[str], None]
+
+
+def describe(exp: BaseException) -> str:
+    """Returns the reason for a failure recorded in a UnitResult."""
+    return "{}: {}".format(type(exp).__name__, exp)
+
+
+def convertChunk(convertUnit: UnitConverter, paths: typing.List[str],
+                 prefetch: SourcePrefetcher = None) -> typing.List[UnitResult]:
+    """Converts a list of source files. This method is run in the worker
+    processes.
+
+    Arguments:
+        convertUnit: The method used to convert a source file to a unit.
+        paths: The paths to the source files to be converted.
+        prefetch: Optional method used to start reading all the files
+        in the chunk before the first one is converted.
+
+    Returns:
+        The results in the same order as the paths.
+    """
+    if prefetch is not None:
+        for path in paths:
+            prefetch(path)
+    return [convertUnit(path) for path in paths]
+
+
+def convertPrefetched(paths: typing.Iterable[str], convertUnit: UnitConverter,
+                      prefetch: SourcePrefetcher,
+                      readAhead: int) -> typing.Iterator[UnitResult]:
+    """Converts the given source files in this process. Reading of the
+    next few files is started before the current file is converted.
+
+    Arguments:
+        paths: The source files to be converted.
+        convertUnit: The method used to convert a source file to a unit.
+        prefetch: The method used to start reading a source file.
+        readAhead: The number of files read ahead of their conversion.
+
+    Returns:
+        An iterator over the results in the order of the paths.
+    """
+    pending: typing.Deque[str] = collections.deque()
+    for path in paths:
+        prefetch(path)
+        pending.append(path)
+        if len(pending) > readAhead:
+            yield convertUnit(pending.popleft())
+    while pending:
+        yield convertUnit(pending.popleft())
+
+
+def chunked(paths: typing.Iterable[str],
+            chunkSize: int) -> typing.Iterator[typing.List[str]]:
+    """Lazily splits the paths into lists of at most chunkSize entries."""
+    paths = iter(paths)
+    while True:
+        chunk = list(itertools.islice(paths, chunkSize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convertFiles(paths: typing.Iterable[str], convertUnit: UnitConverter,
+                 jobs: int = 1, chunkSize: int = 1, window: int = 0,
+                 initializer: typing.Callable = None,
+                 initargs: tuple = (), prefetch: SourcePrefetcher = None,
+                 readAhead: int = 0) -> typing.Iterator[UnitResult]:
+    """Converts the given source files and yields the results in the
+    same order as the paths. The paths are consumed lazily.
+
+    Arguments:
+        paths: The source files to be converted.
+        convertUnit: The method used to convert a source file to a
+        unit. It must be picklable (i.e., a module-level method).
+        jobs: The number of worker processes. If 1, the files are
+        converted in this process.
+        chunkSize: The number of files sent to a worker at a time.
+        window: The maximum number of chunks in flight. Defaults to
+        4 chunks per worker.
+        initializer: Optional method called (with initargs) in each
+        worker process to setup the converter.
+        initargs: The arguments to the initializer.
+        prefetch: Optional method used to start reading source files
+        ahead of their conversion. It must be picklable if jobs > 1.
+        readAhead: The number of files read ahead when jobs is 1 (0
+        to disable). Workers read ahead the files in their chunk.
+
+    Returns:
+        An iterator over the results in the order of the paths.
+    """
+    if jobs <= 1 and prefetch is not None and readAhead > 0:
+        yield from convertPrefetched(paths, convertUnit, prefetch, readAhead)
+        return
+    if jobs <= 1:
+        for path in paths:
+            yield from convertChunk(convertUnit, [path])
+        return
+    window = window if window > 0 else 4 * jobs
+    pool = concurrent.futures.ProcessPoolExecutor(jobs, initializer=initializer,
+                                                  initargs=initargs)
+    try:
+        # The reorder buffer: the chunks in the order they were
+        # submitted. Results are yielded only from the oldest chunk.
+        pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+        for chunk in chunked(paths, chunkSize):
+            pending.append(pool.submit(convertChunk, convertUnit, chunk,
+                                       prefetch if readAhead > 0 else None))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+# End of source code
@@ -37,10 +37,16 @@
 # This source file has been introduced to streamline the
 # overall script and keep things organized.
 
+from __future__ import annotations
+
 import ast
-import expr2srcml
-import XML
-import stmt2srcml
+from . import expr2srcml
+from . import xmlFormat as XML
+from . import stmt2srcml
+from . import registry
+
+
+@registry.STATEMENTS.register(ast.ClassDef)
 def convertClassDef(classDef: ast.ClassDef) -> str:
     """This method converts a class definition block to corresponding
     srcML XML.
@@ -52,18 +58,17 @@ def convertClassDef(classDef: ast.ClassDef) -> str:
         The srcML fragment corresponding to the statement (includes body).
     """
 
-    classXML = ""
+    classXML = []
     # decorators
     for dec in classDef.decorator_list:
-        classXML += XML.form("annotation", "@" + expr2srcml.convertName(dec))
-    classXML += "class" + expr2srcml.convertName(ast.Name(classDef.name)) + "("
+        classXML.append(XML.ANNOTATION.form("@" + expr2srcml.convertName(dec)))
+    classXML.append("class" + expr2srcml.convertName(ast.Name(classDef.name)) + "(")
     # base classes
-    bases = ""
-    for base in classDef.bases:
-        bases += XML.form("super", expr2srcml.convertName(base))
-    bases = XML.form("super_list", bases) if len(classDef.bases) > 0 else ""
-    classXML += bases
+    bases = "".join([XML.SUPER.form(expr2srcml.convertName(base))
+                     for base in classDef.bases])
+    bases = XML.SUPER_LIST.form(bases) if len(classDef.bases) > 0 else ""
+    classXML.append(bases)
 
-    classXML += ")"
-    classXML += stmt2srcml.convertBlock(classDef.body)
-    return XML.form("class", classXML)
+    classXML.append(")")
+    classXML.append(stmt2srcml.convertBlock(classDef.body))
+    return XML.CLASS.form("".join(classXML))
@@ -0,0 +1,790 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import argparse
+import ast
+import collections
+import io
+import mmap
+import os
+import re
+import sys
+import time
+import typing
+
+from . import emitter
+from . import expr2srcml
+from . import iterative
+from . import lazyImport
+from . import leafCache
+from . import positions
+from . import sourceMap
+from . import srcMLFormats
+from . import stmt2srcml
+
+# The modules that are only needed for some of the options are imported
+# when first used to keep the start-up time for a single file low.
+batch = lazyImport("batch")
+incremental = lazyImport("incremental")
+metrics = lazyImport("metrics")
+nodeProfiler = lazyImport("nodeProfiler")
+pipeline = lazyImport("pipeline")
+scanner = lazyImport("scanner")
+sinks = lazyImport("sinks")
+subtreeCache = lazyImport("subtreeCache")
+unitCache = lazyImport("unitCache")
+
+# The optional on-disk cache of converted units (see setup)
+CACHE: typing.Optional[unitCache.UnitCache] = None
+
+# The fragments for statements retained for incremental conversion
+INCREMENTAL: typing.Optional[incremental.StatementCache] = None
+
+# True if the conversion is profiled by type of node (see setup)
+PROFILE = False
+
+# True if the metrics for each file are measured (see metrics.py)
+METRICS = False
+
+# Source files of at least this size (in bytes) are memory-mapped
+# rather than read into memory (see readSource).
+MMAP_THRESHOLD = 1 << 20
+
+# The number of files read ahead of their conversion in an archive
+# (see prefetchSource).
+READ_AHEAD = 4
+
+# Regular expression to find the placeholders for degraded statements
+# (see stmt2srcml.convertUnhandled) in cached units.
+UNHANDLED_RE = re.compile(rb'<py:unhandled type="(\w+)"')
+
+def convertModule(module: ast.Module, out: emitter.Emitter,
+                  release: bool = False) -> None:
+    """Helper method to generate srcML for a given module. A module
+    consists of many functions. The XML for each top-level statement
+    is written to the emitter as soon as it is converted.
+
+    Arguments:
+        module: The module whose body is to be converted.
+        out: The emitter to which the XML is to be written.
+        release: If True, the statements are removed from the module
+        (which must not be used afterwards) and released as they are
+        converted, so that memory usage depends on the size of a
+        statement rather than the size of the module.
+    """
+    body = list(module.body)
+    if release:
+        module.body = []
+    # Process each statement in the module
+    for i in range(len(body)):
+        out.write(stmt2srcml.convertStmt(body[i]))
+        # Release the finished subtree (if the module has given it up)
+        body[i] = None
+    out.writeLine()
+
+def convertBody(module: ast.Module, source: typing.Union[str, bytes],
+                pySrcPath: str, out: emitter.Emitter,
+                info: typing.Dict[str, typing.Any] = None,
+                release: bool = False) -> None:
+    """Writes the srcML for the statements in a module, incrementally
+    (reusing the XML for unchanged statements) if it is enabled. The
+    source is also used to reuse the XML for repeated expressions
+    (see expr2srcml.SUBTREES).
+
+    Arguments:
+        module: The parsed module to be converted.
+        source: The source code from which the module was parsed.
+        pySrcPath: Path to the python source file.
+        out: The emitter to which the XML is to be written.
+        info: Optional dictionary for information about the conversion.
+        In tolerant mode, the number of statements replaced by
+        placeholders (by type) is recorded under "degraded".
+        release: If True, the statements are released as they are
+        converted (see convertModule).
+    """
+    degraded = collections.Counter(stmt2srcml.DEGRADED) \
+        if stmt2srcml.TOLERANT and info is not None else None
+    try:
+        convertBodyWith(module, source, pySrcPath, out, info, release)
+    finally:
+        if degraded is not None:
+            info["degraded"] = dict(stmt2srcml.DEGRADED - degraded)
+
+def convertBodyWith(module: ast.Module, source: typing.Union[str, bytes],
+                    pySrcPath: str, out: emitter.Emitter,
+                    info: typing.Dict[str, typing.Any] = None,
+                    release: bool = False) -> None:
+    """Helper method for convertBody that selects the method used to
+    convert the statements in the module.
+    """
+    subtrees = expr2srcml.SUBTREES
+    if source is None or (INCREMENTAL is None and subtrees is None and
+                          not positions.ENABLED):
+        convertModule(module, out, release)
+        return
+    srcMap = sourceMap.SourceMap(source)
+    if subtrees is not None:
+        subtrees.setSource(srcMap)
+    positions.setSource(srcMap)
+    try:
+        if INCREMENTAL is None:
+            convertModule(module, out, release)
+        else:
+            INCREMENTAL.convertModule(module, srcMap, pySrcPath, out, info,
+                                      release)
+    finally:
+        if subtrees is not None:
+            subtrees.setSource(None)
+        positions.setSource(None)
+
+def convert(pySrcPath: str, out: emitter.Emitter = None,
+            info: typing.Dict[str, typing.Any] = None) -> None:
+    """Top-level method that performs the generation of srcML from a 
+    given Python source file.
+    
+    Arguments:
+        pySrcPath: Path to the python source file to be processed
+        out: The emitter to which the XML is to be written. If None,
+        the XML is written to standard output.
+        info: Optional dictionary in which additional information
+        about the conversion (eg: cache statistics) is recorded.
+    """
+    if out is None:
+        out = emitter.Emitter(sys.stdout.buffer)
+    if METRICS and info is not None:
+        start = time.perf_counter()
+        source = mapSource(pySrcPath)
+        info.setdefault("metrics", {})["readTime"] = time.perf_counter() - start
+    else:
+        source = mapSource(pySrcPath)
+    try:
+        convertSource(source, pySrcPath, out, info)
+    finally:
+        closeSource(source)
+
+def readSource(pySrcPath: str, mapSize: int = 0) -> typing.Union[bytes, mmap.mmap]:
+    """Reads a Python source file as bytes. The bytes are decoded by
+    the parser using the encoding declared in the file (see PEP 263).
+    The file is closed before returning.
+
+    Arguments:
+        pySrcPath: Path to the python source file to be read.
+        mapSize: If non-zero, files of at least this size are
+        memory-mapped rather than copied into memory. The returned
+        map must be closed via closeSource.
+    """
+    # Open the specified source file.
+    with open(pySrcPath, "rb") as srcFile:
+        if mapSize > 0 and os.fstat(srcFile.fileno()).st_size >= mapSize:
+            source = mmap.mmap(srcFile.fileno(), 0, access=mmap.ACCESS_READ)
+            return source
+        return srcFile.read()
+
+def mapSource(pySrcPath: str) -> typing.Union[bytes, mmap.mmap]:
+    """Reads a Python source file, memory-mapping large files."""
+    return readSource(pySrcPath, MMAP_THRESHOLD)
+
+def prefetchSource(pySrcPath: str) -> None:
+    """Asks the operating system to start reading a source file in the
+    background so that it is in memory by the time it is converted.
+    Errors are ignored (they are reported when the file is converted).
+    This method does nothing on platforms without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(pySrcPath, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def closeSource(source: typing.Union[str, bytes, mmap.mmap]) -> None:
+    """Releases a source read via readSource (i.e., unmaps a
+    memory-mapped file). Other sources are left as is.
+    """
+    if hasattr(source, "close"):
+        source.close()
+
+def convertSource(source: typing.Union[str, bytes], pySrcPath: str,
+                  out: emitter.Emitter,
+                  info: typing.Dict[str, typing.Any] = None) -> None:
+    """Generates the srcML unit for the given Python source code.
+
+    Arguments:
+        source: The Python source code to be converted. Bytes (or a
+        memory-mapped file) are decoded as declared in the source.
+        pySrcPath: The path to the source file (used in the unit).
+        out: The emitter to which the XML is to be written.
+        info: Optional dictionary in which additional information
+        about the conversion (eg: cache statistics) is recorded. The
+        metrics for the file are recorded under "metrics" if METRICS
+        is set (see metrics.py).
+    """
+    measures = info.setdefault("metrics", {}) \
+        if METRICS and info is not None else None
+    if measures is not None:
+        measures.update(metrics.sourceShape(source))
+        start, written = time.perf_counter(), out.written
+    try:
+        if CACHE is not None:
+            convertCached(source, pySrcPath, out, CACHE, info)
+        else:
+            # Parse the source code with Python's ast
+            srcAST = parseSource(source, info)
+            # Now, let's process the body of the top-level module. The
+            # tree is not used afterwards. So it is released as converted.
+            convertTree(srcAST, pySrcPath, out, source, info, release=True)
+        out.flush()
+    finally:
+        if measures is not None:
+            measures["convertTime"] = time.perf_counter() - start - \
+                measures.get("parseTime", 0.0) - measures.pop("shapeTime", 0.0)
+            measures["outputBytes"] = out.written - written
+
+def parseSource(source: typing.Union[str, bytes],
+                info: typing.Dict[str, typing.Any] = None) -> ast.Module:
+    """Parses Python source code. If metrics are being recorded in the
+    information about the conversion, the time taken and the shape of
+    the AST are recorded.
+
+    Arguments:
+        source: The Python source code to be parsed.
+        info: Optional dictionary for information about the conversion.
+
+    Returns:
+        The parsed module.
+    """
+    measures = info.get("metrics") if info is not None else None
+    if measures is None:
+        return ast.parse(source)
+    start = time.perf_counter()
+    srcAST: ast.Module = ast.parse(source)
+    measures["parseTime"] = time.perf_counter() - start
+    measures.update(metrics.treeShape(srcAST))
+    # Not counted in the time taken to convert the source
+    measures["shapeTime"] = time.perf_counter() - start - measures["parseTime"]
+    return srcAST
+
+def startUnit(pySrcPath: str) -> str:
+    """Returns the start tag of the unit for a Python source file. The
+    namespace for positions is declared if positions are generated.
+    """
+    if positions.ENABLED:
+        return srcMLFormats.START_UNIT_POSITIONS.format(pySrcPath)
+    return srcMLFormats.START_UNIT.format(pySrcPath)
+
+def convertTree(srcAST: ast.Module, pySrcPath: str, out: emitter.Emitter,
+                source: typing.Union[str, bytes] = None,
+                info: typing.Dict[str, typing.Any] = None,
+                release: bool = False) -> None:
+    """Writes the srcML unit for an already parsed Python source file.
+    The tree is not changed unless release is True.
+
+    Arguments:
+        srcAST: The parsed module to be converted.
+        pySrcPath: Path to the python source file (used in the unit).
+        out: The emitter to which the XML is to be written.
+        source: Optional source code from which the module was parsed.
+        It is needed for incremental conversion and positions.
+        info: Optional dictionary for information about the conversion.
+        release: If True, the statements are removed from the tree and
+        released as they are converted (see convertModule).
+    """
+    out.writeLine(startUnit(pySrcPath))
+    convertBody(srcAST, source, pySrcPath, out, info, release)
+    out.writeLine(srcMLFormats.END_UNIT.format(pySrcPath))
+
+def convertCached(source: typing.Union[str, bytes], pySrcPath: str,
+                  out: emitter.Emitter, cache: unitCache.UnitCache,
+                  info: typing.Dict[str, typing.Any] = None) -> None:
+    """Writes the srcML unit for a Python source file reusing the body
+    of the unit from the cache, if possible. Newly converted bodies
+    and failures are added to the cache.
+
+    Arguments:
+        source: The contents of the python source file.
+        pySrcPath: Path to the python source file (used in the unit).
+        out: The emitter to which the XML is to be written.
+        cache: The cache of converted units.
+        info: Optional dictionary in which the changes to the cache
+        statistics are recorded (under "cache").
+    """
+    before = cache.stats()
+    try:
+        key = cache.key(source)
+        body = cache.lookup(key)
+        if body is None:
+            try:
+                srcAST = parseSource(source, info)
+                sink = io.BytesIO()
+                bodyOut = emitter.Emitter(sink)
+                convertBody(srcAST, source, pySrcPath, bodyOut, info,
+                            release=True)
+                bodyOut.flush()
+                body = sink.getvalue()
+            except (RecursionError, MemoryError):
+                # These failures depend on the environment. Not cached.
+                raise
+            except Exception as exp:
+                cache.storeFailure(key, batch.describe(exp))
+                raise
+            cache.store(key, body)
+        elif stmt2srcml.TOLERANT and info is not None:
+            # Recover the counts of degraded statements from the unit
+            info["degraded"] = dict(collections.Counter(
+                match.decode() for match in UNHANDLED_RE.findall(body)))
+        out.writeLine(startUnit(pySrcPath))
+        out.writeBytes(body)
+        out.writeLine(srcMLFormats.END_UNIT.format(pySrcPath))
+    finally:
+        if info is not None:
+            after = cache.stats()
+            info["cache"] = {name: after[name] - before[name] for name in after}
+
+def convertUnit(pySrcPath: str,
+                source: typing.Union[str, bytes] = None) -> batch.UnitResult:
+    """Converts a given Python source file to a srcML unit in memory.
+    This method is used to convert files in worker processes.
+
+    Arguments:
+        pySrcPath: Path to the python source file to be processed
+        source: Optional source code to be converted instead of the
+        contents of the file.
+
+    Returns:
+        The result with the UTF-8 encoded srcML unit for the source
+        file or the reason the conversion failed.
+    """
+    info: typing.Dict[str, typing.Any] = {}
+    leafBefore = leafCache.counters()
+    subtrees = expr2srcml.SUBTREES
+    subtreesBefore = subtreeCache.counters(subtrees) if subtrees else None
+    try:
+        sink = io.BytesIO()
+        if source is None:
+            convert(pySrcPath, emitter.Emitter(sink), info)
+        else:
+            convertSource(source, pySrcPath, emitter.Emitter(sink), info)
+        return batch.UnitResult(pySrcPath, sink.getvalue(), None, info)
+    except Exception as exp:
+        return batch.UnitResult(pySrcPath, None, batch.describe(exp), info)
+    finally:
+        info["leafCache"] = leafCache.counters(leafBefore)
+        if subtrees is not None:
+            info["subtrees"] = subtreeCache.counters(subtrees, subtreesBefore)
+        if PROFILE:
+            info["nodes"] = nodeProfiler.collect()
+
+def mergeInfo(totals: typing.Dict[str, typing.Any],
+              info: typing.Dict[str, typing.Any]) -> None:
+    """Adds the numbers in the information about a conversion to the
+    running totals (nested dictionaries are merged recursively).
+    """
+    for name, value in info.items():
+        if isinstance(value, dict):
+            mergeInfo(totals.setdefault(name, {}), value)
+        elif isinstance(value, (int, float)):
+            totals[name] = totals.get(name, 0) + value
+
+def convertArchive(pySrcPaths: typing.Iterable[str], out: emitter.Emitter,
+                   jobs: int = 1, chunkSize: int = 1,
+                   options: argparse.Namespace = None,
+                   totals: typing.Dict[str, typing.Any] = None,
+                   readAhead: int = READ_AHEAD,
+                   metricsOut: typing.TextIO = None,
+                   pipelined: bool = False) -> bool:
+    """Converts a batch of Python source files to a srcML archive in
+    which the unit for each file is nested within a root unit. The
+    units are written in the same order as the source files. A file
+    that cannot be converted is reported to stderr and skipped.
+
+    Arguments:
+        pySrcPaths: The paths to the python source files to be processed.
+        out: The emitter to which the archive is to be written.
+        jobs: The number of processes to be used to convert the files.
+        chunkSize: The number of files sent to a process at a time.
+        options: The command-line options used to setup the worker
+        processes (see setup).
+        totals: Optional dictionary to which the information about
+        the conversion of each file is added (see mergeInfo).
+        readAhead: The number of files read ahead of their conversion
+        (see prefetchSource).
+        metricsOut: Optional file to which the metrics for each file
+        are written (see metrics.py).
+        pipelined: If True, the files are read, converted, and written
+        concurrently via an asyncio pipeline (see pipeline.py).
+
+    Returns:
+        True if all the files were successfully converted.
+    """
+    success = True
+    out.writeLine(srcMLFormats.START_ARCHIVE)
+    if pipelined:
+        stats = totals.setdefault("pipeline", {}) if totals is not None else None
+        success = pipeline.convertFiles(pySrcPaths, readSource, convertUnit,
+            lambda result: writeUnit(result, out, totals, metricsOut),
+            jobs, readAhead, initializer=setup if options else None,
+            initargs=(options,) if options else (), stats=stats)
+    else:
+        for result in batch.convertFiles(pySrcPaths, convertUnit, jobs,
+                chunkSize, initializer=setup if options else None,
+                initargs=(options,) if options else (),
+                prefetch=prefetchSource, readAhead=readAhead):
+            success = writeUnit(result, out, totals, metricsOut) and success
+    out.writeLine(srcMLFormats.END_ARCHIVE)
+    out.flush()
+    return success
+
+def writeUnit(result: batch.UnitResult, out: emitter.Emitter,
+              totals: typing.Optional[typing.Dict[str, typing.Any]],
+              metricsOut: typing.Optional[typing.TextIO]) -> bool:
+    """Writes a unit of an archive (see convertArchive) or reports to
+    stderr that the file could not be converted.
+
+    Returns:
+        True if the unit was written.
+    """
+    if totals is not None:
+        mergeInfo(totals, result.info)
+    if result.info.get("degraded"):
+        reportDegraded(result.path, result.info["degraded"])
+    if metricsOut is not None:
+        metrics.writeMetrics(metricsOut, metrics.record(result.path,
+                             result.info, result.error))
+    if result.error is None:
+        out.writeBytes(result.xml)
+        return True
+    print("{}: {}".format(result.path, result.error), file=sys.stderr)
+    return False
+
+def reportDegraded(pySrcPath: str, degraded: typing.Dict[str, int]) -> None:
+    """Reports the statements in a file that were replaced by
+    placeholders (in tolerant mode) to stderr.
+
+    Arguments:
+        pySrcPath: Path to the python source file.
+        degraded: The number of degraded statements by type of node.
+    """
+    print("{}: {} statement(s) not converted ({})".format(pySrcPath,
+        sum(degraded.values()), ", ".join("{} x{}".format(name, count)
+        for name, count in sorted(degraded.items()))), file=sys.stderr)
+
+def setup(options: argparse.Namespace) -> None:
+    """Configures the converter (in this process) using the command-line
+    options. This method is also used to setup worker processes.
+
+    Arguments:
+        options: The parsed command-line options.
+    """
+    global CACHE, INCREMENTAL, PROFILE, METRICS
+    stmt2srcml.ENGINE = options.engine
+    stmt2srcml.TOLERANT = options.tolerant
+    positions.ENABLED = options.positions
+    leafCache.resizeAll(options.leaf_cache_size)
+    leafCache.COUNT_HITS = options.leaf_cache_stats
+    # The options that change the generated srcML
+    variant = ",".join(name for name in ("tolerant", "positions")
+                       if getattr(options, name))
+    CACHE = unitCache.UnitCache(options.cache_dir, options.cache_max_size,
+        variant) if options.cache_dir else None
+    INCREMENTAL = incremental.StatementCache(options.incremental,
+        variant=variant) if options.incremental else None
+    # The XML for repeated subtrees differs in positions. So not reused.
+    expr2srcml.SUBTREES = subtreeCache.SubtreeCache(options.subtree_cache_size) \
+        if options.subtree_cache_size > 0 and not options.positions else None
+    # The converters are wrapped only while profiling
+    if options.profile_nodes:
+        nodeProfiler.enable()
+    elif PROFILE:
+        nodeProfiler.disable()
+    PROFILE = options.profile_nodes
+    # Only the command-line tool (not the library API) has --metrics
+    METRICS = getattr(options, "metrics", None) is not None
+
+def parseSize(size: str) -> int:
+    """Converts a size such as "512M" or "2G" to number of bytes."""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    size = size.strip().upper()
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+def addConverterOptions(parser: argparse.ArgumentParser) -> None:
+    """Adds the command-line options that configure the converter (see
+    setup) to a parser.
+
+    Arguments:
+        parser: The parser to which the options are to be added.
+    """
+    parser.add_argument("--tolerant", action="store_true",
+        help="Replace statements that cannot be converted with a "
+        "<py:unhandled> placeholder rather than skipping the file")
+    parser.add_argument("--positions", action="store_true",
+        help="Add pos:start and pos:end attributes with the line and "
+        "column of statements and expressions")
+    parser.add_argument("--engine", choices=iterative.ENGINES, default="auto",
+        help="How statements are converted: recursively, with an explicit "
+        "stack (for deeply nested expressions), or automatically "
+        "switching to the explicit stack when needed (default: auto)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+        help="Directory in which converted units (and failures) are "
+        "cached across runs")
+    parser.add_argument("--cache-max-size", type=parseSize,
+        default="1G", metavar="SIZE",
+        help="Limit on the size of the cache, eg: 512M (default: 1G)")
+    parser.add_argument("--cache-stats", action="store_true",
+        help="Print the cache statistics to stderr")
+    parser.add_argument("--incremental", metavar="DIR",
+        help="Reuse the srcML for top-level statements that have not "
+        "changed since a file was last converted. The srcML for the "
+        "statements is saved in this directory")
+    parser.add_argument("--incremental-stats", action="store_true",
+        help="Print the number of reused and recomputed statements to stderr")
+    parser.add_argument("--leaf-cache-size", type=int,
+        default=leafCache.DEFAULT_SIZE, metavar="N",
+        help="Maximum number of cached name and literal fragments")
+    parser.add_argument("--subtree-cache-size", type=int, default=0,
+        metavar="N", help="Reuse the srcML for up to N repeated "
+        "expressions (default: 0, disabled)")
+    parser.add_argument("--subtree-cache-stats", action="store_true",
+        help="Print the number of expressions and nodes whose srcML "
+        "was reused to stderr")
+    parser.add_argument("--leaf-cache-stats", action="store_true",
+        help="Print leaf cache hit/miss statistics to stderr")
+    parser.add_argument("--profile-nodes", action="store_true",
+        help="Print the number of nodes, the conversion time, and the "
+        "size of the srcML by type of AST node to stderr")
+
+def parseArgs(argv: typing.List[str]) -> argparse.Namespace:
+    """Helper method to parse the command-line arguments.
+
+    Arguments:
+        argv: The command-line arguments (excluding the program name).
+
+    Returns:
+        The parsed command-line options.
+    """
+    parser = argparse.ArgumentParser(description="Converts Python "
+        "source files to srcML")
+    parser.add_argument("files", nargs="*", metavar="FILE",
+        help="Python source file(s) or directories to be converted")
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+        help="Number of processes used to convert files in parallel")
+    parser.add_argument("--chunk-size", type=int, default=8, metavar="N",
+        help="Number of files sent to a process at a time (with -j)")
+    parser.add_argument("--include", action="append", metavar="GLOB",
+        help="Glob for source files in directories (default: *.py). "
+        "May be repeated")
+    parser.add_argument("--exclude", action="append", default=[],
+        metavar="GLOB", help="Glob for files or directories to be "
+        "skipped. May be repeated")
+    parser.add_argument("--max-size", type=int, default=0, metavar="BYTES",
+        help="Skip source files in directories larger than this size")
+    parser.add_argument("-o", "--output", metavar="FILE",
+        help="Write the srcML to this file rather than stdout. Files "
+        "ending in .gz, .bz2, or .xz are compressed")
+    parser.add_argument("--compress", default="auto",
+        choices=("auto", "none", "gzip", "bz2", "lzma"),
+        help="Compress the output with this codec (default: based on "
+        "the extension of the output file)")
+    parser.add_argument("--compress-level", type=int, metavar="N",
+        help="Compression level (default: 6 for gzip and lzma, 9 for bz2)")
+    parser.add_argument("--buffer-size", type=int,
+        default=emitter.BUFFER_SIZE, metavar="N",
+        help="Number of characters of XML accumulated before they are "
+        "written (and compressed)")
+    parser.add_argument("--read-ahead", type=int, default=READ_AHEAD,
+        metavar="N", help="Number of files read in the background "
+        "while the previous files are converted (default: {}, 0 to "
+        "disable)".format(READ_AHEAD))
+    parser.add_argument("--pipeline", action="store_true",
+        help="Read (in --read-ahead threads), convert (in -j processes), "
+        "and write the files concurrently (eg: for network file systems)")
+    parser.add_argument("--pipeline-stats", action="store_true",
+        help="Print the depth of the queues of --pipeline and the time "
+        "spent waiting on them to stderr")
+    parser.add_argument("--scan-threads", type=int, default=0, metavar="N",
+        help="Threads used to scan directories (order is then "
+        "nondeterministic)")
+    parser.add_argument("--metrics", metavar="FILE",
+        help="Append the metrics for each file (size, AST shape, read, "
+        "parse, and convert times, output size, errors) as JSON lines "
+        "to this file (- for stderr)")
+    parser.add_argument("--profile-json", metavar="FILE",
+        help="Also write the measurements of --profile-nodes (which it "
+        "implies) to this JSON file")
+    addConverterOptions(parser)
+    args = parser.parse_args(argv)
+    args.profile_nodes = args.profile_nodes or args.profile_json is not None
+    return args
+
+def trimCache(totals: typing.Dict[str, typing.Any]) -> None:
+    """Trims the unit cache (if any) to its maximum size once the files
+    are converted. The evictions are added to the cache statistics.
+
+    Arguments:
+        totals: The information accumulated from converting the files.
+    """
+    if CACHE is not None:
+        evictions = CACHE.evictions
+        CACHE.trim()
+        mergeInfo(totals, {"cache": {"evictions": CACHE.evictions - evictions}})
+
+def printStats(args: argparse.Namespace,
+               totals: typing.Dict[str, typing.Any]) -> None:
+    """Prints the statistics requested via command-line options to stderr.
+
+    Arguments:
+        args: The parsed command-line options.
+        totals: The information accumulated from converting the files.
+    """
+    if args.leaf_cache_stats:
+        # With -j, the statistics from the worker processes are used
+        print(leafCache.report(totals.get("leafCache") if args.jobs > 1 or
+            getattr(args, "pipeline", False) else None), file=sys.stderr)
+    if args.cache_stats and CACHE is not None:
+        stats = dict.fromkeys(CACHE.stats(), 0)
+        mergeInfo(stats, totals.get("cache", {}))
+        print(unitCache.report(stats, CACHE), file=sys.stderr)
+    if args.subtree_cache_stats and expr2srcml.SUBTREES is not None:
+        # The counters are not in totals when a single file is streamed
+        stats = totals.get("subtrees") or subtreeCache.counters(expr2srcml.SUBTREES)
+        print(subtreeCache.report(stats), file=sys.stderr)
+    if args.incremental_stats and INCREMENTAL is not None:
+        print(incremental.report(totals.get("incremental", {})), file=sys.stderr)
+    if getattr(args, "pipeline_stats", False) and "pipeline" in totals:
+        print(pipeline.report(totals["pipeline"]), file=sys.stderr)
+    if args.profile_nodes:
+        # Nodes converted in this process but not yet in totals are added
+        stats = totals.get("nodes", {})
+        mergeInfo(stats, nodeProfiler.collect())
+        print(nodeProfiler.report(stats), file=sys.stderr)
+        # The server (see server.py) does not have --profile-json
+        profileJSON = getattr(args, "profile_json", None)
+        if profileJSON:
+            import json
+            with open(profileJSON, "w") as jsonFile:
+                json.dump(stats, jsonFile, indent=1, sort_keys=True)
+
+def main():
+    """The main function that starts the process of XML generation
+    by calling suitable helper methods.
+    
+    It uses command line arguments. Each command-line argument
+    is assumed to be a python program to be converted to
+    srcML. Directories are recursively scanned for source files.
+    If several files are specified (or -j is used), the output is a
+    srcML archive with one unit per file.
+    """
+    args = parseArgs(sys.argv[1:])
+    # If we don't have command-line arguments, then report an error
+    if len(args.files) < 1:
+        print("Specify python source file as command-line argument.")
+    else:
+        setup(args)
+        sink = sys.stdout.buffer
+        if args.output is not None or args.compress != "auto":
+            sink = sinks.openSink(args.output, args.compress,
+                                  args.compress_level)
+        try:
+            success = convertFiles(args, emitter.Emitter(sink, args.buffer_size))
+        finally:
+            if sink is not sys.stdout.buffer:
+                sink.close()
+        if not success:
+            sys.exit(1)
+
+def convertFiles(args: argparse.Namespace, out: emitter.Emitter) -> bool:
+    """Writes the srcML document for the files specified via the
+    command-line arguments: a unit for a single file or an archive.
+
+    Arguments:
+        args: The parsed command-line options.
+        out: The emitter to which the XML is to be written.
+
+    Returns:
+        True if all the files were successfully converted.
+    """
+    metricsOut = metrics.openMetrics(args.metrics) \
+        if args.metrics is not None else None
+    try:
+        return convertFilesTo(args, out, metricsOut)
+    finally:
+        if metricsOut is not None and metricsOut is not sys.stderr:
+            metricsOut.close()
+
+def convertFilesTo(args: argparse.Namespace, out: emitter.Emitter,
+                   metricsOut: typing.Optional[typing.TextIO]) -> bool:
+    """Helper method for convertFiles that writes the srcML document
+    and the metrics for each file, if requested.
+    """
+    out.writeLine(srcMLFormats.PROLOG)
+    totals: typing.Dict[str, typing.Any] = {}
+    if len(args.files) == 1 and args.jobs <= 1 and \
+            not os.path.isdir(args.files[0]):
+        # Stream the unit for the only source file
+        error = None
+        try:
+            convert(args.files[0], out, totals)
+        except Exception as exp:
+            error = batch.describe(exp)
+            raise
+        finally:
+            if totals.get("degraded"):
+                reportDegraded(args.files[0], totals["degraded"])
+            if metricsOut is not None:
+                metrics.writeMetrics(metricsOut,
+                    metrics.record(args.files[0], totals, error))
+            trimCache(totals)
+            printStats(args, totals)
+        return True
+    # Process each source file found via command-line arguments
+    srcFilter = scanner.SourceFilter(args.include or
+        scanner.DEFAULT_INCLUDE, args.exclude, args.max_size)
+    pySrcPaths = scanner.findSources(args.files, srcFilter,
+                                     args.scan_threads)
+    success = convertArchive(pySrcPaths, out, args.jobs, args.chunk_size,
+                             args, totals, args.read_ahead, metricsOut,
+                             args.pipeline)
+    trimCache(totals)
+    printStats(args, totals)
+    return success
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/python3
+
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains a thin client for the py2srcml server
+# (see server.py).  It is a drop-in replacement for running
+# py2srcml on files: the output (a single unit or an archive) is
+# the same.  The client only imports a few small modules and sends
+# the paths to a running server, which avoids the cost of starting
+# the interpreter with all the converters for every invocation.  If
+# no server is running, the files are converted in this process.
+#
+# This script is meant to be used in the following manner:
+#    $ python3 -m py2srcml.server --socket /tmp/py2srcml.sock &
+#    $ python3 -m py2srcml.client --socket /tmp/py2srcml.sock tests/*.py
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import typing
+
+from . import scanner
+from . import srcMLFormats
+
+# The environment variable with the path of the server's socket
+SOCKET_ENV = "PY2SRCML_SOCKET"
+
+def defaultSocket() -> str:
+    """Returns the path of the socket used if none is specified."""
+    return os.environ.get(SOCKET_ENV) or os.path.join("/tmp",
+        "py2srcml-{}.sock".format(os.getuid()))
+
+def connect(socketPath: str) -> typing.Optional[socket.socket]:
+    """Returns a connection to the server or None if the server is
+    not running.
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socketPath)
+        return conn
+    except OSError:
+        conn.close()
+        return None
+
+def sendRequests(conn: socket.socket, pySrcPaths: typing.Iterable[str]) -> int:
+    """Sends a request to convert each file to the server (from a
+    separate thread so that requests are pipelined with responses).
+
+    Returns:
+        The number of requests sent.
+    """
+    count = 0
+    with conn.makefile("wb") as reqFile:
+        for pySrcPath in pySrcPaths:
+            request = {"id": count, "path": os.path.abspath(pySrcPath),
+                       "filename": pySrcPath}
+            reqFile.write(json.dumps(request).encode("utf-8") + b"\n")
+            count += 1
+        reqFile.flush()
+    conn.shutdown(socket.SHUT_WR)
+    return count
+
+def convertFiles(conn: socket.socket, pySrcPaths: typing.Iterable[str],
+                 out: typing.BinaryIO, archive: bool) -> bool:
+    """Converts the files via the server and writes the units (in the
+    same order as the files) to out.
+
+    Arguments:
+        conn: The connection to the server.
+        pySrcPaths: The paths of the files to be converted.
+        out: The binary stream to which the srcML is written.
+        archive: If True the units are nested in a root unit.
+
+    Returns:
+        True if all the files were successfully converted.
+    """
+    sender = threading.Thread(target=sendRequests, args=(conn, pySrcPaths),
+                              daemon=True)
+    sender.start()
+    success = True
+    out.write(srcMLFormats.PROLOG.encode() + b"\n")
+    if archive:
+        out.write(srcMLFormats.START_ARCHIVE.encode() + b"\n")
+    with conn.makefile("rb") as respFile:
+        for line in respFile:
+            response = json.loads(line)
+            degraded = (response.get("info") or {}).get("degraded")
+            if degraded:
+                print("{}: {} statement(s) not converted ({})".format(
+                    response["filename"], sum(degraded.values()),
+                    ", ".join("{} x{}".format(name, count) for name, count
+                              in sorted(degraded.items()))), file=sys.stderr)
+            if response.get("error") is None:
+                out.write(response["xml"].encode("utf-8"))
+            else:
+                print("{}: {}".format(response["filename"], response["error"]),
+                      file=sys.stderr)
+                success = False
+    if archive:
+        out.write(srcMLFormats.END_ARCHIVE.encode() + b"\n")
+    out.flush()
+    sender.join()
+    return success
+
+def withoutSocket(argv: typing.List[str]) -> typing.List[str]:
+    """Returns the command-line arguments without the --socket option."""
+    result, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == "--socket":
+            skip = True
+        elif not arg.startswith("--socket="):
+            result.append(arg)
+    return result
+
+def parseArgs(argv: typing.List[str]) -> typing.Tuple[argparse.Namespace,
+                                                     typing.List[str]]:
+    """Parses the command-line arguments (a subset of cli.py's).
+
+    Returns:
+        The parsed options and the arguments that were not recognized.
+    """
+    parser = argparse.ArgumentParser(description="Converts Python source "
+        "files to srcML using a running py2srcml server")
+    parser.add_argument("files", nargs="*", metavar="FILE",
+        help="Python source file(s) or directories to be converted")
+    parser.add_argument("--socket", default=defaultSocket(), metavar="PATH",
+        help="The server's socket (default: ${} or {})".format(SOCKET_ENV,
+            defaultSocket()))
+    parser.add_argument("--include", action="append", metavar="GLOB",
+        help="Glob for source files in directories (default: *.py)")
+    parser.add_argument("--exclude", action="append", default=[],
+        metavar="GLOB", help="Glob for files or directories to be skipped")
+    parser.add_argument("--max-size", type=int, default=0, metavar="BYTES",
+        help="Skip source files in directories larger than this size")
+    return parser.parse_known_args(argv)
+
+def main():
+    args, others = parseArgs(sys.argv[1:])
+    conn = connect(args.socket) if args.files and not others else None
+    if conn is None:
+        # No server (or options only the converter supports). So run
+        # the converter in this process.
+        from . import cli
+        sys.argv = [sys.argv[0]] + withoutSocket(sys.argv[1:])
+        cli.main()
+        return
+    srcFilter = scanner.SourceFilter(args.include or scanner.DEFAULT_INCLUDE,
+                                     args.exclude, args.max_size)
+    archive = len(args.files) > 1 or os.path.isdir(args.files[0])
+    with conn:
+        success = convertFiles(conn, scanner.findSources(args.files, srcFilter),
+                               sys.stdout.buffer, archive)
+    if not success:
+        sys.exit(1)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
+
+# End of source code
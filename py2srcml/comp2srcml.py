@@ -34,11 +34,15 @@
 # This source file contains methods that focus on converting
 # a list comprehension to a corresponding srcML XML.
 
+from __future__ import annotations
+
 import ast
 
-import expr2srcml
-import XML
+from . import expr2srcml
+from . import xmlFormat as XML
+from . import registry
 
+@registry.EXPRESSIONS.register(ast.ListComp)
 def convertListComp(stmt: ast.ListComp) -> str:
     """Helper method to convert an import statement to srcML XML.
 
@@ -54,7 +58,7 @@ def convertListComp(stmt: ast.ListComp) -> str:
     # Convert the generators to an array in list
     genXML = convertGenerators(stmt.generators)
     # Combine the XML fragments together
-    return eltXML + XML.form("operator", "=") + genXML
+    return eltXML + XML.OPERATOR.form("=") + genXML
 
 
 def convertGenerators(generators: ast.comprehension) -> str:
@@ -68,23 +72,23 @@ def convertGenerators(generators: ast.comprehension) -> str:
         The XML string corresponding to the list of generators.
     """
     # Convert the generators to an array in list
-    genXML = ""
+    genXML = []
     for gen in generators:
         if gen.is_async != 0:
             raise Exception("Async generator not yet supported.")
         # Convert the sub-parts of the generator
         targetXML = expr2srcml.convertExpr(gen.target)
         forXML    = expr2srcml.convertExpr(gen.iter)
-        ifXML = ""
-        for condition in gen.ifs:
-            ifXML += expr2srcml.convertExpr(condition)
+        ifXML = "".join([expr2srcml.convertExpr(condition)
+                         for condition in gen.ifs])
         # Combine the generators into an XML
         # genXML += XML.form("block", targetXML, forXML, ifXML)
-        genXML += XML.form("block", targetXML + forXML + ifXML)
+        genXML.append(XML.BLOCK.form(targetXML + forXML + ifXML))
     
-    return genXML
+    return "".join(genXML)
 
 
+@registry.EXPRESSIONS.register(ast.GeneratorExp)
 def convertGenExp(stmt: ast.GeneratorExp) -> str:
     """Helper method to convert a generator expression to srcML XML.
     This method is called from expr2srcml.py script. The generator
@@ -103,9 +107,10 @@ def convertGenExp(stmt: ast.GeneratorExp) -> str:
     # Convert the generators to an array in list
     genXML = convertGenerators(stmt.generators)
     # Combine the XML fragments together
-    return eltXML + XML.form("operator", "=") + genXML
+    return eltXML + XML.OPERATOR.form("=") + genXML
 
 
+@registry.EXPRESSIONS.register(ast.Dict)
 def convertDict(dict: ast.Dict) -> str:
     """Helper method to convert a dictionary initialization to corresponding
     srcML XML.
@@ -122,12 +127,12 @@ def convertDict(dict: ast.Dict) -> str:
     #     keys: typing.List[Optional[expr]]
     #     values: typing.List[expr]
     #
-    dictXML = "["
+    dictXML = ["["]
     for (key, val) in zip(dict.keys, dict.values):
-        dictXML += XML.form("expr", expr2srcml.convertExpr(key) + " = " +\
-            expr2srcml.convertExpr(val))
-    dictXML += "]"
-    return XML.form("block", dictXML)
+        dictXML.append(XML.EXPR.form(expr2srcml.convertExpr(key) + " = " +\
+            expr2srcml.convertExpr(val)))
+    dictXML.append("]")
+    return XML.BLOCK.form("".join(dictXML))
 
 
 # End of source code
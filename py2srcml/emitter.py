@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains a simple streaming emitter. Rather than
+# building the srcML for a whole module as one giant string, the
+# XML fragments are written to the emitter as they are generated.
+# The emitter encodes pending fragments to UTF-8 and flushes them to
+# a buffered binary sink (such as stdout or a file) once enough text
+# has accumulated.
+
+from __future__ import annotations
+
+import typing
+
+# The default number of characters to accumulate before the pending
+# fragments are encoded and written to the sink.
+BUFFER_SIZE: int = 64 * 1024
+
+class Emitter:
+    """A buffered writer to which srcML fragments are written. The
+    fragments are encoded as UTF-8 (consistent with the XML prolog)
+    and written to the underlying binary sink in large chunks.
+    """
+
+    def __init__(self, sink: typing.BinaryIO, bufferSize: int = BUFFER_SIZE):
+        """Creates an emitter that writes to the given sink.
+
+        Arguments:
+            sink: The binary sink (eg: sys.stdout.buffer) to write to.
+            bufferSize: The number of characters to accumulate before
+            the pending fragments are flushed to the sink.
+        """
+        self.sink = sink
+        self.bufferSize = bufferSize
+        self.pending: typing.List[str] = []
+        self.pendingSize = 0
+        # The number of bytes written to the sink so far
+        self.written = 0
+
+    def write(self, fragment: str) -> None:
+        """Adds a fragment of XML to the output. The fragment is
+        flushed to the sink once sufficient data is pending.
+
+        Arguments:
+            fragment: The XML fragment to be written.
+        """
+        self.pending.append(fragment)
+        self.pendingSize += len(fragment)
+        if self.pendingSize >= self.bufferSize:
+            self.flush()
+
+    def writeLine(self, fragment: str = "") -> None:
+        """Convenience method to write a fragment followed by a newline
+        (similar to print).
+
+        Arguments:
+            fragment: The XML fragment to be written.
+        """
+        self.write(fragment)
+        self.write("\n")
+
+    def writeBytes(self, data: bytes) -> None:
+        """Writes already encoded (UTF-8) XML to the sink, after any
+        pending fragments.
+
+        Arguments:
+            data: The encoded XML to be written.
+        """
+        if self.pending:
+            self.flush()
+        self.sink.write(data)
+        self.written += len(data)
+
+    def flush(self) -> None:
+        """Encodes all the pending fragments and writes them to the sink."""
+        if self.pending:
+            data = "".join(self.pending).encode("utf-8")
+            self.sink.write(data)
+            self.written += len(data)
+            self.pending.clear()
+            self.pendingSize = 0
+        self.sink.flush()
+
+# End of source code
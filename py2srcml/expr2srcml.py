@@ -0,0 +1,405 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains methods that focus on converting
+# an expression node in the AST to srcML.  The Expr node has
+# several subclasses and is involved.  Hence, they have been
+# placed in a separate source file to keep things organized.
+
+from __future__ import annotations
+
+import ast
+import typing
+
+from . import op2srcml
+from . import func2srcml
+from . import if2srcml
+from . import xmlFormat as XML
+from . import registry
+from . import leafCache
+from . import positions
+
+if typing.TYPE_CHECKING:
+    # Only used in annotations. The cache is imported when it is
+    # enabled (see cli.setup) so that it does not add to the start-up
+    # time of the command-line tool otherwise (see check_imports.py).
+    from . import subtreeCache
+
+# The optional cache of the srcML for repeated expression subtrees.
+SUBTREES: typing.Optional[subtreeCache.SubtreeCache] = None
+
+# The XML for expressions already converted by the iterative engine
+# (see iterative.py), keyed by the id of the expression node.
+RENDERED: typing.Dict[int, str] = {}
+
+# True while the conversion is profiled by type of node (see
+# nodeProfiler.py), which needs each node converted via convertExprValue.
+PROFILED = False
+
+@registry.EXPRESSIONS.register(ast.Attribute)
+def convertAttribute(attrib: ast.Attribute) -> str:
+    """Helper method to convert an attribute to srcML XML
+
+    Arguments:
+        attrib: The attribute to be converted to XML
+    Returns:
+        The XML corresponding to the attribute.
+    """
+    attribXML = XML.form("name", convertExpr(attrib.value),
+        "operator", ".", "name", attrib.attr)
+    return XML.NAME.form(attribXML)
+
+@registry.EXPRESSIONS.register(ast.Name)
+def convertName(node: typing.Union[ast.Name, ast.Expr]) -> str:
+    """Helper method to just return the string for a given identifier
+
+    Arguments:
+        node: An ast.Name or ast.Expr node from where the name of a
+        identifier (variable, function, etc.) is returned.
+    """
+    if isinstance(node, ast.Name):
+        # Most identifiers are reused. So use the cached fragment if any.
+        nameXML = leafCache.NAMES.get(node.id)
+        if nameXML is None:
+            nameXML = leafCache.NAMES.store(node.id, XML.NAME.form(node.id))
+        elif leafCache.COUNT_HITS:
+            leafCache.NAMES.hits += 1
+        return nameXML
+    elif isinstance(node, ast.Expr):
+        return convertExpr(node)
+    elif isinstance(node, ast.Attribute):
+        return convertAttribute(node)
+    else:
+        raise Exception("Uhandled name node {}", ast.dump(node))
+
+
+# The types of literals whose XML is cached in leafCache.CONSTANTS.
+# Floats and complex numbers are not cached as their keys would need
+# repr (0.0 == -0.0), which costs as much as forming the XML.
+CACHED_CONSTANT_TYPES = {str, int, bool, type(None)}
+
+@registry.EXPRESSIONS.register(ast.Constant)
+def convertConstant(const: ast.Constant) -> str:
+    """Helper method to convert literals to srcML XML. The XML for
+    small literals is reused from leafCache.CONSTANTS.
+
+    Arguments:
+        const: An ast.Constant node containing the literal
+    Returns:
+        Returns the srcML XML fragment for the literal
+    """
+    value = const.value
+    valType = type(value)
+    if valType is str:
+        if len(value) > leafCache.MAX_STRING_LENGTH:
+            return formConstant(const)
+        key = value
+    elif valType in CACHED_CONSTANT_TYPES:
+        # The type is part of the key because True == 1 (strings are
+        # never equal to the other constants).
+        key = (valType, value)
+    else:
+        return formConstant(const)
+    constXML = leafCache.CONSTANTS.get(key)
+    if constXML is None:
+        constXML = leafCache.CONSTANTS.store(key, formConstant(const))
+    elif leafCache.COUNT_HITS:
+        leafCache.CONSTANTS.hits += 1
+    return constXML
+
+
+def formConstant(const: ast.Constant) -> str:
+    """Helper method to form the srcML XML for a literal without using
+    the cache.
+
+    Arguments:
+        const: An ast.Constant node containing the literal
+    Returns:
+        Returns the srcML XML fragment for the literal
+    """
+    if isinstance(const.value, str):
+        return XML.LITERAL_STRING.form("\"" + XML.escape(const.value) + "\"")
+    elif isinstance(const.value, bool):
+        return XML.LITERAL_BOOLEAN.form("\"" + str(const.value) + "\"")
+    elif isinstance(const.value, float) or isinstance(const.value, int):
+        return XML.LITERAL_NUMBER.form(str(const.value))
+    elif isinstance(const.value, complex):
+        return XML.LITERAL_COMPLEX.form("\"" + str(const.value) + "\"")
+    elif const.value is None:
+        return XML.LITERAL_NONE.form("\"" + str(const.value) + "\"")
+    else:
+        raise Exception("Unhandled Constant {}".format(ast.dump(const)))
+
+
+@registry.EXPRESSIONS.register(ast.BoolOp)
+def convertBoolOper(binOp: ast.BoolOp) -> str:
+    """Converts boolean operators in the from "True and False"
+    Arguments:
+        binOp: The binary operator 
+    Returns:
+        Returns the srcML XML fragment for the boolean operator
+    """
+    # For get XML the operator itself.
+    operXML = op2srcml.convertOp(binOp.op)
+    # Next convert the value expressions and join them with the operator
+    valXML = operXML.join([convertExpr(val) for val in binOp.values])
+    # Return the formatted XML
+    return XML.EXPR.form(valXML)
+
+
+@registry.EXPRESSIONS.register(ast.BinOp)
+def convertBinOper(binOp: ast.BinOp) -> str:
+    """Converts binary operators in the from 1 + 2. A chain such as
+    a + b + c is a left-deep tree. Forming the XML level by level
+    copies the XML for the left operand at each level, which is
+    quadratic in the length of the chain. Hence, the binary operators
+    on the left are walked iteratively and the XML is joined once,
+    unless each node must be converted on its own (positions, SUBTREES,
+    or PROFILED).
+    """
+    if positions.SOURCE is not None or SUBTREES is not None or PROFILED:
+        # First obtain the XML for the left and right hand side expressions.
+        lhsXML = convertExpr(binOp.left)
+        rhsXML = convertExpr(binOp.right)
+        # Get the operator itself.
+        operXML = op2srcml.convertOp(binOp.op)
+        # Return the formatted XML
+        return XML.EXPR.form(lhsXML + operXML + rhsXML)
+    # The operators on the left spine (outermost first). The XML for
+    # operators converted by the iterative engine is used as is.
+    chain = []
+    node = binOp
+    while type(node) is ast.BinOp and not (RENDERED and id(node) in RENDERED):
+        chain.append(node)
+        node = node.left
+    exprXML = [XML.EXPR.open * len(chain), convertExpr(node)]
+    for level in reversed(chain):
+        rhsXML = convertExpr(level.right)
+        exprXML.append(op2srcml.convertOp(level.op))
+        exprXML.append(rhsXML)
+        exprXML.append(XML.EXPR.close)
+    return "".join(exprXML)
+
+
+@registry.EXPRESSIONS.register(ast.Compare)
+def convertCompare(comp: ast.Compare) -> str:
+    """Helper method to convert a comparison operator.
+    """
+    exprXML = []
+    # First obtain the XML for the left and right hand side expressions.
+    lhsXML = convertExpr(comp.left)
+    for i in range(0, len(comp.ops)):
+        # Convert the operators into a suitable subexpressions
+        operXML = op2srcml.convertOp(comp.ops[i])
+        rhsXML = convertExpr(comp.comparators[i])
+        # Combine them into the running expression
+        exprXML.append(lhsXML + operXML + rhsXML)
+        # Prep for the next set of operators
+        lhsXML = rhsXML
+    # Return the formatted XML with "and" between successive expressions
+    return XML.EXPR.form(XML.OPERATOR.form("and").join(exprXML))
+
+
+@registry.EXPRESSIONS.register(ast.Tuple)
+def convertTuple(tup: ast.Tuple) -> str:
+    # Converts "[k, v]" to "<index>[<expr><name>k</name></expr>
+    # <operator>,</operator> <name>v</name>]</index>"
+    # Convert the entries and add the ',' separators between them
+    elemXML = XML.OPERATOR.form(",").join([convertExpr(entry)
+                                              for entry in tup.elts])
+    # Return the overall index expression
+    elemXML = "[" + elemXML + "]"
+    return XML.INDEX.form(elemXML)
+
+
+@registry.EXPRESSIONS.register(ast.List)
+def convertList(lst: ast.List) -> str:
+    """Method to convert a list of the form [1, 2, 3] to srcML XML
+
+    Arguments:
+        lst: The list to be converted to XML
+
+    Returns
+        The XML corresponding to the list
+    """
+    # Convert the entries and add the ',' separators between them
+    lstXML = XML.OPERATOR.form(",").join([convertExpr(entry)
+                                             for entry in lst.elts])
+    # Return the overall index expression
+    lstXML = "[" + XML.EXPR.form(lstXML) + "]"
+    return XML.INDEX.form(lstXML)
+
+@registry.EXPRESSIONS.register(ast.Set)
+def convertSet(set: ast.Set) -> str:
+    """Method to convert a set of the form {1, 2, 3} to srcML XML
+
+    Arguments:
+        set: The set to be converted to XML
+
+    Returns
+        The XML corresponding to the set
+    """
+
+    # Convert the entries and add the ',' separators between them
+    setXML = XML.OPERATOR.form(",").join([convertExpr(entry)
+                                             for entry in set.elts])
+    # Return the overall index expression
+    setXML = "{" + setXML + "}"
+    return XML.BLOCK.form(setXML)
+
+@registry.EXPRESSIONS.register(ast.Slice)
+def convertSlice(slice: ast.Slice) -> str:
+    """Helper method to convert a slice to a suitable srcML XML.
+    For example, expressions of the form "[1:]", "[2:3]", and "[:2]"
+
+    Arguemnts:
+        slice: The slice to be converted to XML
+
+    Returns:
+        The XML string 
+    """
+    # Convert each individual components of the slice to corresponding XML
+    colXML   = XML.OPERATOR.form(":")
+    lowXML   = convertExpr(slice.lower) if slice.lower else ""
+    hiXML    = convertExpr(slice.upper) if slice.upper else ""
+    stepXML  = colXML + convertExpr(slice.step)  if slice.step  else ""
+    # Return the combined XML back
+    return XML.INDEX.form("[" + XML.EXPR.form(lowXML + colXML + hiXML + stepXML) + "]")
+
+
+@registry.EXPRESSIONS.register(ast.Subscript)
+def convertSubscript(sub: ast.Subscript) -> str:
+    """Helper method to convert a subscript expression of the form
+    s[1:2] to corresponding srcML
+
+    Arguments:
+        sub: The subcript expression to be converted to srcML XML
+
+    Returns:
+        Returns a string corresponding to the XML
+    """
+    sliceXML = convertExprValue(sub.slice)
+    if not isinstance(sub.slice, ast.Slice):
+        sliceXML = XML.INDEX.form("[" + sliceXML + "]")
+    return XML.NAME.form(convertExpr(sub.value) + sliceXML)
+
+
+@registry.EXPRESSIONS.register(ast.UnaryOp)
+def convertUnaryOp(uop: ast.UnaryOp) -> str:
+    """Helper method to convert an unary operator in the form "-a"
+    to corresponding srcML XML.
+
+    Arguments:
+        uop: The unary operator to be converted to XML
+
+    Returns:
+        The srcML XML corresponding to the unary operator.
+    """
+    return op2srcml.convertOp(uop.op) + convertExpr(uop.operand)
+
+
+# The expressions whose converters are imported when first needed.
+registry.EXPRESSIONS.addLazy(ast.ListComp, "comp2srcml")
+registry.EXPRESSIONS.addLazy(ast.GeneratorExp, "comp2srcml")
+registry.EXPRESSIONS.addLazy(ast.Dict, "comp2srcml")
+
+# The expressions that are not yet supported.
+registry.EXPRESSIONS.add(ast.NamedExpr, registry.unhandled("NamedExpr"))
+registry.EXPRESSIONS.add(ast.SetComp, registry.unhandled("SetComp"))
+registry.EXPRESSIONS.add(ast.DictComp, registry.unhandled("DictComp"))
+registry.EXPRESSIONS.add(ast.Await, registry.unhandled("Await"))
+registry.EXPRESSIONS.add(ast.Yield, registry.unhandled("Yield"))
+registry.EXPRESSIONS.add(ast.YieldFrom, registry.unhandled("YieldFrom"))
+registry.EXPRESSIONS.add(ast.FormattedValue, registry.unhandled("FormattedValue"))
+registry.EXPRESSIONS.add(ast.JoinedStr, registry.unhandled("JoinedStr"))
+registry.EXPRESSIONS.add(ast.Starred, registry.unhandled("Starred"))
+
+
+def convertExprValue(exprVal: XML.AST_ExprNodes) -> str:
+    """"The top-level method for processing an expression AST node. 
+    Expressions are most diverse nodes in the AST. The converter for
+    the expression is looked up in registry.EXPRESSIONS. If SUBTREES
+    is set, the XML for repeated subtrees is reused. The XML recorded
+    for the expression by the iterative engine is used, if any.
+    Position attributes are added if positions.SOURCE is set (the
+    subtree cache is not used with positions).
+
+    Arguments:
+        expr: The expression node to be processed.
+    Returns:
+        An optional string value or None.
+    """
+    if RENDERED:
+        exprXML = RENDERED.pop(id(exprVal), None)
+        if exprXML is not None:
+            return exprXML
+    if SUBTREES is not None:
+        return SUBTREES.convert(exprVal, formExprValue)
+    srcMap = positions.SOURCE
+    if srcMap is not None:
+        return positions.addPosition(formExprValue(exprVal), exprVal, srcMap)
+    return formExprValue(exprVal)
+
+
+def formExprValue(exprVal: XML.AST_ExprNodes) -> str:
+    """Helper method to convert an expression AST node using the
+    converter in registry.EXPRESSIONS (without using SUBTREES).
+
+    Arguments:
+        expr: The expression node to be processed.
+    Returns:
+        The srcML XML for the expression.
+    """
+    converter = registry.EXPRESSIONS.lookup(type(exprVal))
+    if converter is None:
+        raise Exception("Unhandled expression {}".format(ast.dump(exprVal)))
+    return converter(exprVal)
+
+
+def convertExpr(expr: XML.AST_ExprNodes) -> str:
+    """"The top-level method for processing subnode of an expression AST node. 
+    Expressions are most diverse nodes in the AST.
+
+    Arguments:
+        expr: The expression node to be processed.
+    Returns:
+        An optional string value or None.
+    """
+    # Use helper method to handle different cases better
+    if isinstance(expr, ast.Expr):
+        exprXML = convertExprValue(expr.value)
+        return XML.EXPR.form(exprXML)
+    else:
+        return convertExprValue(expr)
+
+# End of source code
@@ -36,13 +36,15 @@
 # several subclasses and is involved.  Hence, they have been
 # placed in a separate source file to keep things organized.
 
+from __future__ import annotations
+
 import ast
 import typing
 
-import expr2srcml
-import stmt2srcml
-import XML
-
+from . import expr2srcml
+from . import stmt2srcml
+from . import xmlFormat as XML
+from . import registry
 
 def convertParams(args: ast.arguments) -> str:
     """Helper method to process a list of parmaeters (to either a 
@@ -55,19 +57,19 @@ def convertParams(args: ast.arguments) -> str:
         A string with the srcML XML
     """
     # Process parameters to the function into an list of XML entries
-    prmListXML = ""
+    prmListXML = []
     for prm in args.args:
-        prmType = XML.form("type", expr2srcml.convertExpr(prm.annotation))\
+        prmType = XML.TYPE.form(expr2srcml.convertExpr(prm.annotation))\
             if prm.annotation else ""
-        prmDecl = XML.form("decl",  prmType + XML.form("name", prm.arg))
-        prmListXML += XML.form("parameter", prmDecl)
-        prmListXML += ", "
-    # Remove trailing ", " and create parameter list.
-    prmListXML = "(" + prmListXML[:-2] + ")"
+        prmDecl = XML.DECL.form(prmType + XML.NAME.form(prm.arg))
+        prmListXML.append(XML.PARAMETER.form(prmDecl))
+    # Separate parameters with ", " and create parameter list.
+    prmListXML = "(" + ", ".join(prmListXML) + ")"
     # Return the parameter list
     return prmListXML
 
 
+@registry.STATEMENTS.register(ast.FunctionDef)
 def convertFuncDef(fnDef: ast.FunctionDef) -> str:
     """Helper method that is called from stmt2srcml.convertStmt() method.
     This method is called to convert a function definition to corresponding
@@ -84,7 +86,7 @@ def convertFuncDef(fnDef: ast.FunctionDef) -> str:
         The function definition to be converted to source ML
     """
     # Get return type if specified as hint. Otherwise it will be ""
-    retTypeXML = XML.form("type", expr2srcml.convertExpr(fnDef.returns))\
+    retTypeXML = XML.TYPE.form(expr2srcml.convertExpr(fnDef.returns))\
         if fnDef.returns else ""
     # Get the name of the function
     fnName = fnDef.name
@@ -95,7 +97,7 @@ def convertFuncDef(fnDef: ast.FunctionDef) -> str:
     # Make the sequence of elements for your function.
     fnXML = XML.form("name", fnName, "parameter_list", prmListXML) + fnBody
     # Return the fully formed XML for the function defintion
-    return XML.form("function", retTypeXML + fnXML) +\
+    return XML.FUNCTION.form(retTypeXML + fnXML) +\
         " " + XML.formComment(fnName)
 
 
@@ -115,10 +117,11 @@ def convertArg(arg: XML.AST_ExprNodes) -> str:
     # node. So we streamline it by explicitly adding "<expr>" here
     # as needed.
     if not argXML.startswith("<expr>"):
-        argXML = XML.form("expr", argXML)
+        argXML = XML.EXPR.form(argXML)
     return argXML
 
 
+@registry.EXPRESSIONS.register(ast.Call)
 def convertFuncCall(call: ast.Call) -> str:
     """Prints the srcML XML corresponding to the given function call.
 
@@ -133,23 +136,24 @@ def convertFuncCall(call: ast.Call) -> str:
     if not fnName:
         raise Exception("Invalid function call {}".format(ast.dump(call)))
     # Start the starting XML-node for function calls
-    fnXML = "<call>{}<argument_list>(".format(fnName)
+    fnXML = ["<call>{}<argument_list>(".format(fnName)]
 
     # Next figure out the arguments to the function call.
     for arg in call.args:
-        fnXML += XML.form("argument", convertArg(arg))
+        fnXML.append(XML.ARGUMENT.form(convertArg(arg)))
 
     # Handle named arguments in function calls. Eg: print("0",end="")
     if call.keywords:
         for kw in call.keywords:
-            fnXML += XML.form("argument", XML.form("name", kw.arg) +\
-                expr2srcml.convertExpr(kw.value))
+            fnXML.append(XML.ARGUMENT.form(XML.NAME.form(kw.arg) +\
+                expr2srcml.convertExpr(kw.value)))
 
     # Add the ending XML-node for the function call.
-    fnXML += ")</argument_list></call> {}".format(XML.formComment(fnName))
-    return fnXML
+    fnXML.append(")</argument_list></call> {}".format(XML.formComment(fnName)))
+    return "".join(fnXML)
 
 
+@registry.EXPRESSIONS.register(ast.Lambda)
 def convertLambda(lmda: ast.Lambda) -> str:
     """Helper method to convert a lambda to corresponding srcML XML.
     Arguments:
@@ -163,6 +167,6 @@ def convertLambda(lmda: ast.Lambda) -> str:
     lmdaBody = "<block>: <block_content>" + expr2srcml.convertExpr(lmda.body) +\
         "</block_content></block>"
     # Return the lambda XML
-    return XML.form("lambda", paramXML + lmdaBody)
+    return XML.LAMBDA.form(paramXML + lmdaBody)
 
 # End of source code
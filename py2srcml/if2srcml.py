@@ -40,47 +40,57 @@ This source file has been introduced to streamline the
 overall script and keep things organized.
 """
 
+from __future__ import annotations
+
 import ast
 
-import stmt2srcml
-import expr2srcml
-import XML
+from . import stmt2srcml
+from . import expr2srcml
+from . import xmlFormat as XML
+from . import registry
 
+@registry.STATEMENTS.register(ast.If)
 def convertIf(ifStmt: ast.If, isElseIf: bool = False) -> str:
     """This method converts if-elif-else block to corresponding
-    srcML XML.  This method works recursively. In recursive
-    calls the isElseIF flag should be set to True.
+    srcML XML.  The chain of elif blocks is processed iteratively.
+    The isElseIF flag should be set to True to convert just an elif.
 
     Arguments:
         ifStmt: The AST node corresponding to the if or elif
         statement to be converted to srcML.
         isElseIF: This flag should be True when this method is
-        recursively called to process elif blocks.
+        called to process elif blocks.
 
     Returns:
         The srcML fragment corresponding to the statement (includes body).
     """
-    condXML   = XML.form("condition", expr2srcml.convertExpr(ifStmt.test))
-    ifBodyXML = stmt2srcml.convertBlock(ifStmt.body)
-    if not isElseIf:
-        ifXML = "<if_stmt><if>if " + condXML + ifBodyXML + "</if>"
-    else:
-        ifXML = "<if type=\"elseif\">elif " + condXML + ifBodyXML + "</if>"
-    # Handle any elif statement(s)
-    if len(ifStmt.orelse) > 0:
-        if isinstance(ifStmt.orelse[0], ast.If):
-            ifXML += convertIf(ifStmt.orelse[0], True)
+    isIfStmt = not isElseIf
+    ifXML = ["<if_stmt>"] if isIfStmt else []
+    # Process the if and the chain of elif statement(s) iteratively so
+    # that long elif-chains are not copied again at every level.
+    while True:
+        condXML   = XML.CONDITION.form(expr2srcml.convertExpr(ifStmt.test))
+        ifBodyXML = stmt2srcml.convertBlock(ifStmt.body)
+        if not isElseIf:
+            ifXML.append("<if>if " + condXML + ifBodyXML + "</if>")
         else:
-            ifXML += "<else>else <block>:<block_content>"
-            for expr in ifStmt.orelse:
-                ifXML += stmt2srcml.convertStmt(expr)
-            ifXML += "</block_content></block></else>"
+            ifXML.append("<if type=\"elseif\">elif " + condXML + ifBodyXML + "</if>")
+        if len(ifStmt.orelse) == 0 or not isinstance(ifStmt.orelse[0], ast.If):
+            break
+        # Handle the elif statement
+        ifStmt, isElseIf = ifStmt.orelse[0], True
+    # Handle any else block
+    if len(ifStmt.orelse) > 0:
+        ifXML.append("<else>else ")
+        ifXML.append(stmt2srcml.convertBlock(ifStmt.orelse))
+        ifXML.append("</else>")
     # Finish and return the XML for the if-elif-else statement
-    if not isElseIf:
-        ifXML += "</if_stmt>"
-    return ifXML
+    if isIfStmt:
+        ifXML.append("</if_stmt>")
+    return "".join(ifXML)
 
 
+@registry.EXPRESSIONS.register(ast.IfExp)
 def convertIfExp(ifExp: ast.IfExp) -> str:
     """This method converts ternary-type if-else statement to 
     corresponding srcML XML. For example: "if True 1 else 0"
@@ -93,10 +103,10 @@ def convertIfExp(ifExp: ast.IfExp) -> str:
         The srcML fragment corresponding to the statement.
     """
     # Convert the condition 
-    condXML = XML.form("condition", expr2srcml.convertExpr(ifExp.test))
+    condXML = XML.CONDITION.form(expr2srcml.convertExpr(ifExp.test))
     # Convert the expression for the 'true' case
-    trueXML = XML.form("then", expr2srcml.convertExpr(ifExp.body))
+    trueXML = XML.THEN.form(expr2srcml.convertExpr(ifExp.body))
     # Convert the expression for the 'false' case
-    falseXML = XML.form("else", expr2srcml.convertExpr(ifExp.orelse))
+    falseXML = XML.ELSE.form(expr2srcml.convertExpr(ifExp.orelse))
     # Return the full ternary XML back
-    return XML.form("ternary", condXML + trueXML + falseXML)
+    return XML.TERNARY.form(condXML + trueXML + falseXML)
@@ -37,11 +37,15 @@
 # Hence, they have been placed in a separate source file to keep
 # things organized.
 
+from __future__ import annotations
+
 import ast
 import typing
 
-import XML
+from . import xmlFormat as XML
+from . import registry
 
+@registry.STATEMENTS.register(ast.Import)
 def convertImport(stmt: ast.Import) -> str:
     """Helper method to convert an import statement to srcML XML.
 
@@ -51,15 +55,16 @@ def convertImport(stmt: ast.Import) -> str:
     Returns:
         The srcML XML corresponding to the import statement.
     """
-    impXML = ""
+    impXML = []
     # Convert the imports into a list of include statements
     for imp in stmt.names:
-        fileXML = XML.form("file", imp.name)
-        impXML += XML.form("include", "import " + fileXML)
+        fileXML = XML.FILE.form(imp.name)
+        impXML.append(XML.INCLUDE.form("import " + fileXML))
     # Return the list list of xml
-    return impXML
+    return "".join(impXML)
 
 
+@registry.STATEMENTS.register(ast.ImportFrom)
 def convertImportFrom(stmt: ast.ImportFrom) -> str:
     """Helper method to convert an import from statement to srcML XML.
 
@@ -69,12 +74,12 @@ def convertImportFrom(stmt: ast.ImportFrom) -> str:
     Returns:
         The srcML XML corresponding to the import statement.
     """
-    impXML = ""
+    impXML = []
     # Convert the imports into a list of include statements
-    fileXML = XML.form("file", stmt.module)
+    fileXML = XML.FILE.form(stmt.module)
     for imp in stmt.names:
-        impXML += XML.form("include", "import {}".format(imp.name) + fileXML)
+        impXML.append(XML.INCLUDE.form("import {}".format(imp.name) + fileXML))
     # Return the list list of xml
-    return impXML
+    return "".join(impXML)
 
 # End of source code
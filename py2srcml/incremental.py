@@ -0,0 +1,214 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the support for incrementally converting
+# source files that are edited and converted repeatedly (eg: from an
+# editor or a file watcher).  The srcML for each top-level statement
+# is retained, keyed by a hash of the statement's source text.  When
+# the file is converted again, only the statements whose hash changed
+# are converted; the retained XML is reused for the rest.
+#
+# The statement's source text is used as the key (rather than a dump
+# of its AST) because ast.dump is slower than converting the
+# statement.  Identical source text always parses to an identical
+# subtree, so a reused fragment is always the same as the converted
+# one.  The fragments for a file can also be saved in a directory so
+# that they persist across runs.
+
+import ast
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import typing
+
+from . import emitter
+from . import positions
+from . import sourceMap
+from . import stmt2srcml
+from . import unitCache
+
+# The default number of files whose fragments are retained in memory
+DEFAULT_MAX_UNITS: int = 256
+
+# The fragments for a file: key of statement -> srcML for statement
+Fragments = typing.Dict[str, str]
+
+def statementText(stmt: ast.stmt, srcMap: sourceMap.SourceMap) -> bytes:
+    """Returns the source text of a statement, including its decorators
+    (which precede the statement's position).
+    """
+    start, end = srcMap.span(stmt)
+    for decorator in getattr(stmt, "decorator_list", ()):
+        start = min(start, srcMap.span(decorator)[0])
+    return srcMap.source[start:end]
+
+
+class StatementCache:
+    """The srcML fragments for the top-level statements of recently
+    converted files, along with counters of the reused and recomputed
+    statements.
+    """
+
+    def __init__(self, directory: str = None,
+                 maxUnits: int = DEFAULT_MAX_UNITS, variant: str = ""):
+        """Creates the cache of statement fragments.
+
+        Arguments:
+            directory: Optional directory in which the fragments for
+            each file are saved so that they persist across runs.
+            maxUnits: The number of files whose fragments are retained
+            in memory.
+            variant: A string describing the options that affect the
+            generated srcML. Fragments saved with different options
+            (or a different converter) are not reused.
+        """
+        self.directory = directory
+        self.maxUnits = maxUnits
+        self.version = "{}\0{}".format(unitCache.converterVersion(), variant)
+        self.units: typing.OrderedDict[str, Fragments] = collections.OrderedDict()
+        self.reused = self.recomputed = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def statePath(self, pySrcPath: str) -> str:
+        """Returns the path of the file with the saved fragments."""
+        name = hashlib.sha256(os.path.abspath(pySrcPath).encode()).hexdigest()
+        return os.path.join(self.directory, name[:32] + ".json")
+
+    def load(self, pySrcPath: str) -> Fragments:
+        """Returns the fragments from the last conversion of a file
+        (an empty dictionary if the file was not converted before).
+        """
+        fragments = self.units.get(pySrcPath)
+        if fragments is not None or not self.directory:
+            return fragments or {}
+        try:
+            with open(self.statePath(pySrcPath), "r", encoding="utf-8") as stateFile:
+                state = json.load(stateFile)
+        except (OSError, ValueError):
+            return {}
+        if state.get("version") != self.version or state.get("path") != pySrcPath:
+            return {}
+        return state["statements"]
+
+    def save(self, pySrcPath: str, fragments: Fragments) -> None:
+        """Retains the fragments from the latest conversion of a file."""
+        self.units[pySrcPath] = fragments
+        self.units.move_to_end(pySrcPath)
+        if len(self.units) > self.maxUnits:
+            self.units.popitem(last=False)
+        if not self.directory:
+            return
+        state = {"version": self.version, "path": pySrcPath,
+                 "statements": fragments}
+        fd, tmpPath = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as stateFile:
+                json.dump(state, stateFile)
+            os.replace(tmpPath, self.statePath(pySrcPath))
+        except OSError:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+
+    def convertModule(self, module: ast.Module, srcMap: sourceMap.SourceMap,
+                      pySrcPath: str, out: emitter.Emitter,
+                      info: typing.Dict[str, typing.Any] = None,
+                      release: bool = False) -> None:
+        """Writes the srcML for the statements in a module to the emitter,
+        reusing the fragments for statements that have not changed since
+        the file was last converted.
+
+        Arguments:
+            module: The parsed module to be converted.
+            srcMap: The source code from which the module was parsed.
+            pySrcPath: Path to the python source file.
+            out: The emitter to which the XML is to be written.
+            info: Optional dictionary in which the number of reused and
+            recomputed statements is recorded (under "incremental").
+            release: If True, the statements are removed from the module
+            and released as they are converted (see cli.convertModule).
+        """
+        previous = self.load(pySrcPath)
+        fragments: Fragments = {}
+        reused = recomputed = 0
+        body = list(module.body)
+        if release:
+            module.body = []
+        # With positions, the XML for a statement depends on where it
+        # starts and ends (the columns of the nested nodes then follow
+        # from the text of the statement).
+        withPosition = positions.SOURCE is not None
+        for i in range(len(body)):
+            text = statementText(body[i], srcMap)
+            if withPosition:
+                text += positions.attributes(body[i], srcMap).encode()
+            key = hashlib.blake2b(text, digest_size=16).hexdigest()
+            fragment = fragments.get(key) or previous.get(key)
+            if fragment is None:
+                degraded = sum(stmt2srcml.DEGRADED.values())
+                fragment = stmt2srcml.convertStmt(body[i])
+                recomputed += 1
+                # Placeholders contain line numbers. So they are not reused.
+                if degraded == sum(stmt2srcml.DEGRADED.values()):
+                    fragments[key] = fragment
+            else:
+                reused += 1
+                fragments[key] = fragment
+            out.write(fragment)
+            # Release the finished subtree (as in cli.convertModule)
+            body[i] = None
+        out.writeLine()
+        self.save(pySrcPath, fragments)
+        self.reused += reused
+        self.recomputed += recomputed
+        if info is not None:
+            info["incremental"] = {"reused": reused, "recomputed": recomputed}
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Returns the counters for this cache."""
+        return {"reused": self.reused, "recomputed": self.recomputed}
+
+
+def report(stats: typing.Dict[str, int]) -> str:
+    """Returns a summary of the (possibly aggregated) statement counts."""
+    total = stats.get("reused", 0) + stats.get("recomputed", 0)
+    return "\n".join([
+        "Statements      : {}".format(total),
+        "Reused          : {}".format(stats.get("reused", 0)),
+        "Recomputed      : {}".format(stats.get("recomputed", 0)),
+        "Reuse rate      : {:.1f}%".format(
+            100 * stats.get("reused", 0) / total if total else 0.0)])
+
+# End of source code
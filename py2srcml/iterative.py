@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains an alternative traversal engine that is
+# immune to deeply nested expressions.  The converters are recursive:
+# converting an expression calls convertExpr for each subexpression.
+# Generated code such as "a + b + c + ..." with thousands of terms
+# creates left-deep trees that exhaust Python's recursion limit.
+#
+# This engine walks the expressions in a statement with an explicit
+# stack, in post-order (children before parents).  Each expression
+# is converted using its usual converter and the XML is recorded in
+# expr2srcml.RENDERED.  When the converter for the parent asks for the
+# XML for a subexpression, the recorded XML is returned instead of
+# recursing.  Hence the converters never recurse more than one level
+# and the output is identical to the recursive converters.
+
+from __future__ import annotations
+
+import ast
+import typing
+
+from . import expr2srcml
+
+# The engines that may be used to convert statements:
+#   auto      - convert recursively and use the iterative engine for
+#               statements that exceed the recursion limit
+#   recursive - only use the recursive converters
+#   iterative - use the iterative engine for every statement
+ENGINES = ("auto", "recursive", "iterative")
+
+def postOrder(root: ast.AST) -> typing.Iterator[ast.expr]:
+    """Yields the expressions in a statement (or expression) such that
+    each expression is yielded after all its subexpressions. Nested
+    statements are not visited as they are converted separately.
+    """
+    stack: typing.List[typing.Tuple[ast.AST, bool]] = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            if isinstance(node, ast.expr):
+                yield node
+            continue
+        stack.append((node, True))
+        # Push children in reverse so that they are visited in order
+        for child in reversed(list(ast.iter_child_nodes(node))):
+            if not isinstance(child, ast.stmt):
+                stack.append((child, False))
+
+def prerender(root: ast.AST) -> typing.List[int]:
+    """Converts the expressions in a statement (or expression) in
+    post-order and records their XML in expr2srcml.RENDERED.
+
+    Arguments:
+        root: The statement whose expressions are to be converted.
+
+    Returns:
+        The ids of the expressions whose XML was recorded.
+    """
+    rendered = expr2srcml.RENDERED
+    ids = []
+    for expr in postOrder(root):
+        try:
+            exprXML = expr2srcml.convertExprValue(expr)
+        except Exception:
+            # Some nodes (eg: the targets of some statements) are not
+            # converted via convertExprValue. If the parent does need
+            # the XML, the error is reported when the parent converts it.
+            continue
+        rendered[id(expr)] = exprXML
+        ids.append(id(expr))
+    return ids
+
+def convertStmt(stmt: ast.stmt, converter: typing.Callable[[ast.stmt], str]) -> str:
+    """Converts a statement without deep recursion. The output is the
+    same as converter(stmt).
+
+    Arguments:
+        stmt: The statement to be converted.
+        converter: The converter for the statement.
+
+    Returns:
+        The XML fragment corresponding to the python statement.
+    """
+    ids: typing.List[int] = []
+    try:
+        ids = prerender(stmt)
+        return converter(stmt)
+    finally:
+        # Discard the XML for expressions that the converter did not use
+        rendered = expr2srcml.RENDERED
+        for exprId in ids:
+            rendered.pop(exprId, None)
+
+# End of source code
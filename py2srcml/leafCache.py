@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains simple size-bounded caches that are used
+# to reuse the rendered srcML for leaf nodes, such as identifiers and
+# small constants.  Most source files reuse a few hundred names and
+# literals.  Hence, caching the fragments avoids repeatedly forming the
+# same XML.  A hit must be cheaper than forming the fragment, so a hit
+# is a plain dictionary lookup: the caches are cleared when they are
+# full instead of tracking the least recently used entries, and hits
+# are only counted when the statistics are requested (see COUNT_HITS).
+# The caches track misses and evictions so that the bound on their
+# size can be tuned.
+
+from __future__ import annotations
+
+import typing
+
+# The default maximum number of fragments in each cache.
+DEFAULT_SIZE: int = 4096
+
+# String literals longer than this are not cached as they are
+# unlikely to be reused.
+MAX_STRING_LENGTH: int = 64
+
+# Flag to indicate if the converters count the hits in the caches
+# (see cli.setup). Counting the hits adds to the cost of each hit.
+COUNT_HITS: bool = False
+
+class FragmentCache(dict):
+    """A size-bounded cache of rendered XML fragments. The converters
+    look up fragments via get (so that a hit is a plain dictionary
+    lookup) and add the fragments that are missing via store. All
+    the fragments are evicted when the cache is full.
+    """
+
+    def __init__(self, name: str, maxSize: int = DEFAULT_SIZE):
+        """Creates an empty cache.
+
+        Arguments:
+            name: A short name for the cache used in reports.
+            maxSize: The maximum number of entries in the cache. A
+            value of zero disables caching.
+        """
+        super().__init__()
+        self.name = name
+        self.maxSize = maxSize
+        self.hits = self.misses = self.evictions = 0
+
+    def store(self, key: typing.Hashable, fragment: str) -> str:
+        """Adds a fragment that was not found in the cache (a miss),
+        evicting all the fragments if the cache is full.
+
+        Arguments:
+            key: The key associated with the fragment.
+            fragment: The rendered XML fragment.
+
+        Returns:
+            The fragment.
+        """
+        self.misses += 1
+        if self.maxSize > 0:
+            if len(self) >= self.maxSize:
+                self.evict()
+            self[key] = fragment
+        return fragment
+
+    def evict(self) -> None:
+        """Removes all the fragments, counting them as evictions."""
+        self.evictions += len(self)
+        super().clear()
+
+    def resize(self, maxSize: int) -> None:
+        """Changes the maximum size of the cache, evicting the entries
+        if there are more than the new maximum.
+
+        Arguments:
+            maxSize: The new maximum number of entries in the cache.
+        """
+        self.maxSize = maxSize
+        if len(self) > max(maxSize, 0):
+            self.evict()
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        super().clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> typing.Dict[str, typing.Union[int, float]]:
+        """Returns a dictionary with the statistics for this cache."""
+        lookups = self.hits + self.misses
+        return {"size": len(self), "maxSize": self.maxSize,
+                "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / lookups if lookups else 0.0}
+
+
+# The cache of rendered <name> fragments keyed by the identifier.
+NAMES = FragmentCache("names")
+
+# The cache of rendered <literal> fragments keyed by (type, value).
+CONSTANTS = FragmentCache("constants")
+
+# All the leaf caches.
+CACHES: typing.List[FragmentCache] = [NAMES, CONSTANTS]
+
+
+def resizeAll(maxSize: int) -> None:
+    """Changes the maximum size of all the leaf caches.
+
+    Arguments:
+        maxSize: The maximum number of entries in each cache.
+    """
+    for cache in CACHES:
+        cache.resize(maxSize)
+
+
+def counters(since: typing.Dict[str, typing.Dict[str, int]] = None
+             ) -> typing.Dict[str, typing.Dict[str, int]]:
+    """Returns the hit, miss, and eviction counters of each leaf cache.
+
+    Arguments:
+        since: Optional counters returned by an earlier call. If
+        specified, the change in the counters since then is returned.
+    """
+    result = {}
+    for cache in CACHES:
+        old = since.get(cache.name, {}) if since else {}
+        result[cache.name] = {"hits": cache.hits - old.get("hits", 0),
+            "misses": cache.misses - old.get("misses", 0),
+            "evictions": cache.evictions - old.get("evictions", 0)}
+    return result
+
+
+def report(totals: typing.Dict[str, typing.Dict[str, int]] = None) -> str:
+    """Returns a table with the statistics for all the leaf caches.
+
+    Arguments:
+        totals: Optional counters (see counters) to be reported instead
+        of the counters of the caches in this process (eg: the totals
+        from worker processes).
+    """
+    lines = ["{:<12}{:>8}{:>8}{:>10}{:>10}{:>10}{:>9}".format("Cache",
+        "Size", "Max", "Hits", "Misses", "Evictions", "Hit %")]
+    for cache in CACHES:
+        st = cache.stats()
+        if totals is not None:
+            st.update(totals.get(cache.name, {}))
+            lookups = st["hits"] + st["misses"]
+            st["hitRate"] = st["hits"] / lookups if lookups else 0.0
+        lines.append("{:<12}{:>8}{:>8}{:>10}{:>10}{:>10}{:>8.1f}%".format(
+            cache.name, st["size"], st["maxSize"], st["hits"],
+            st["misses"], st["evictions"], 100 * st["hitRate"]))
+    return "\n".join(lines)
+
+# End of source code
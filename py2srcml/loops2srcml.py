@@ -36,12 +36,16 @@
 # several subclasses and is involved.  Hence, they have been
 # placed in a separate source file to keep things organized.
 
+from __future__ import annotations
+
 import ast
 import typing
 
-import expr2srcml
-import stmt2srcml
+from . import expr2srcml
+from . import stmt2srcml
+from . import registry
 
+@registry.STATEMENTS.register(ast.For)
 def convertForLoop(stmt: ast.For) -> str:
     """Helper method to convert a for-loop to srcML XML.  Currently,
     we don't handle the for-else construct because the corresponding
@@ -58,6 +62,7 @@ def convertForLoop(stmt: ast.For) -> str:
     return forXML
 
 
+@registry.STATEMENTS.register(ast.While)
 def convertWhileLoop(stmt: ast.While) -> str:
     """Helper method to convert a while-loop to srcML XML.  Currently,
     we don't handle the while-else construct because the corresponding
@@ -0,0 +1,144 @@
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the per-file metrics reported with the
+# --metrics option for monitoring the conversion of large corpora.
+# For each file, the size of the source (bytes and lines) and its AST
+# (number of nodes and maximum depth), the time taken to read, parse,
+# and convert it, the size of the srcML, and the reason for a failure
+# are recorded.  The measurements are taken by the converter (see
+# cli.convert and cli.convertSource) in the "metrics" entry of the
+# information about the conversion.  Hence, they are also returned by
+# worker processes.  The metrics are written as JSON lines, one per
+# file, to a file or stderr:
+#
+#    {"path": "a.py", "bytes": 1204, "lines": 40, "nodes": 311, ...}
+
+from __future__ import annotations
+
+import ast
+import json
+import sys
+import typing
+
+# The fields in each line in the order they are written:
+#   path        - the path to the source file
+#   bytes       - the size of the source (in bytes)
+#   lines       - the number of lines in the source
+#   nodes       - the number of nodes in the AST (null if not parsed)
+#   depth       - the maximum depth of the AST (null if not parsed)
+#   readTime    - the seconds taken to read the file
+#   parseTime   - the seconds taken to parse the source
+#   convertTime - the seconds taken to generate the srcML
+#   outputBytes - the size of the srcML unit (in bytes)
+#   ratio       - outputBytes / bytes
+#   degraded    - the number of statements not converted (--tolerant)
+#   error       - the reason the file could not be converted, or null
+FIELDS = ("path", "bytes", "lines", "nodes", "depth", "readTime",
+          "parseTime", "convertTime", "outputBytes", "ratio", "degraded",
+          "error")
+
+def sourceShape(source: typing.Union[str, bytes]) -> typing.Dict[str, int]:
+    """Returns the size (in bytes or characters for text) and the
+    number of lines of a source, which may be a memory-mapped file.
+    """
+    newline = "\n" if isinstance(source, str) else b"\n"
+    if hasattr(source, "count"):
+        lines = source.count(newline)
+    else:
+        lines, pos = 0, source.find(newline)
+        while pos != -1:
+            lines += 1
+            pos = source.find(newline, pos + 1)
+    if len(source) > 0 and source[-1:] != newline:
+        lines += 1
+    return {"bytes": len(source), "lines": lines}
+
+def treeShape(tree: ast.AST) -> typing.Dict[str, int]:
+    """Returns the number of nodes and the maximum depth of an AST.
+    The shared expression contexts (eg: ast.Load) are not counted.
+    The fields are visited directly as ast.iter_child_nodes is slow.
+    """
+    nodeClass, contextClass = ast.AST, ast.expr_context
+    nodes = depth = 0
+    stack = [(tree, 1)]
+    push = stack.append
+    while stack:
+        node, level = stack.pop()
+        nodes += 1
+        if level > depth:
+            depth = level
+        level += 1
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, nodeClass):
+                        push((item, level))
+            elif isinstance(value, nodeClass) and \
+                    not isinstance(value, contextClass):
+                push((value, level))
+    return {"nodes": nodes, "depth": depth}
+
+def record(pySrcPath: str, info: typing.Dict[str, typing.Any],
+           error: typing.Optional[str] = None) -> typing.Dict[str, typing.Any]:
+    """Returns the metrics for a file with the fields in FIELDS.
+
+    Arguments:
+        pySrcPath: The path to the source file.
+        info: The information about the conversion of the file.
+        error: The reason the file could not be converted, if any.
+    """
+    measures = info.get("metrics", {})
+    result = {name: measures.get(name) for name in FIELDS}
+    result["path"] = pySrcPath
+    if error is None:
+        size, outputBytes = measures.get("bytes"), measures.get("outputBytes")
+        result["ratio"] = outputBytes / size if size and outputBytes else None
+    else:
+        # Only part of the unit may have been generated
+        result["outputBytes"] = None
+    result["degraded"] = sum(info.get("degraded", {}).values())
+    result["error"] = error
+    return result
+
+def openMetrics(path: str) -> typing.TextIO:
+    """Opens the file to which the metrics are appended ("-" for stderr)."""
+    return sys.stderr if path == "-" else open(path, "a", encoding="utf-8")
+
+def writeMetrics(out: typing.TextIO, metrics: typing.Dict[str, typing.Any]) -> None:
+    """Writes the metrics for a file as a line of JSON. The line is
+    flushed so that the metrics can be followed as they are written.
+    """
+    out.write(json.dumps(metrics, separators=(",", ":")) + "\n")
+    out.flush()
+
+# End of source code
@@ -0,0 +1,184 @@
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the optional profiling of the conversion
+# by type of AST node (see --profile-nodes).  When profiling is
+# enabled, stmt2srcml.convertStmt and expr2srcml.convertExprValue are
+# replaced by wrappers that record, for each type of node, the number
+# of nodes converted, the time spent converting them (inclusive and
+# exclusive of the nested statements and expressions), and the size
+# of the XML generated.  The converters are only wrapped while
+# profiling is enabled.  Hence, there is no overhead otherwise.
+#
+# The iterative engine (see iterative.py) converts the expressions in
+# a statement before the statement.  Their time is then counted as
+# nested in the statement and their XML as nested in the node that
+# uses it.
+
+from __future__ import annotations
+
+import ast
+import time
+import typing
+
+from . import expr2srcml
+from . import iterative
+from . import stmt2srcml
+
+# The measurements recorded for each type of node (see collect):
+#   count      - the number of nodes converted
+#   inclusive  - the seconds spent converting the nodes
+#   exclusive  - the seconds excluding nested statements and expressions
+#   output     - the number of characters of XML generated
+#   selfOutput - the characters excluding nested statements and expressions
+FIELDS = ("count", "inclusive", "exclusive", "output", "selfOutput")
+
+# The measurements (in the order of FIELDS) keyed by type of node.
+STATS: typing.Dict[str, typing.List[typing.Union[int, float]]] = {}
+
+# The time and XML of the nested nodes of each node being converted.
+# The first entry is for the nodes converted at the top level.
+NESTED: typing.List[typing.List[typing.Union[int, float]]] = [[0.0, 0]]
+
+# The original converters while profiling is enabled (see enable).
+ORIGINALS: typing.Optional[typing.Tuple[typing.Callable, ...]] = None
+
+def profiled(convert: typing.Callable[[ast.AST], str]
+             ) -> typing.Callable[[ast.AST], str]:
+    """Returns a wrapper for a converter that records the measurements
+    for each node converted in STATS.
+
+    Arguments:
+        convert: The converter for statements or expressions.
+    """
+    perfCounter = time.perf_counter
+    rendered = expr2srcml.RENDERED
+
+    def convertProfiled(node: ast.AST) -> str:
+        if rendered and id(node) in rendered:
+            # Converted earlier by the iterative engine and measured then
+            xml = convert(node)
+            NESTED[-1][1] += len(xml)
+            return xml
+        nested = [0.0, 0]
+        NESTED.append(nested)
+        start = perfCounter()
+        try:
+            xml = convert(node)
+        finally:
+            elapsed = perfCounter() - start
+            NESTED.pop()
+        parent = NESTED[-1]
+        parent[0] += elapsed
+        parent[1] += len(xml)
+        record = STATS.get(type(node).__name__)
+        if record is None:
+            record = STATS[type(node).__name__] = [0, 0.0, 0.0, 0, 0]
+        record[0] += 1
+        record[1] += elapsed
+        record[2] += elapsed - nested[0]
+        record[3] += len(xml)
+        record[4] += len(xml) - nested[1]
+        return xml
+
+    return convertProfiled
+
+def profiledPrerender(root: ast.AST) -> typing.List[int]:
+    """Wrapper for iterative.prerender that counts the time spent as
+    nested in the statement but not the XML (see profiled).
+    """
+    nested = [0.0, 0]
+    NESTED.append(nested)
+    try:
+        return ORIGINALS[2](root)
+    finally:
+        NESTED.pop()
+        NESTED[-1][0] += nested[0]
+
+def enable() -> None:
+    """Starts profiling the conversion in this process."""
+    global ORIGINALS
+    if ORIGINALS is None:
+        ORIGINALS = (stmt2srcml.convertStmt, expr2srcml.convertExprValue,
+                     iterative.prerender)
+        stmt2srcml.convertStmt = profiled(ORIGINALS[0])
+        expr2srcml.convertExprValue = profiled(ORIGINALS[1])
+        iterative.prerender = profiledPrerender
+        expr2srcml.PROFILED = True
+
+def disable() -> None:
+    """Stops profiling and restores the original converters. The
+    measurements recorded so far are retained (see collect).
+    """
+    global ORIGINALS
+    if ORIGINALS is not None:
+        (stmt2srcml.convertStmt, expr2srcml.convertExprValue,
+         iterative.prerender) = ORIGINALS
+        ORIGINALS = None
+        expr2srcml.PROFILED = False
+
+def collect() -> typing.Dict[str, typing.Dict[str, typing.Union[int, float]]]:
+    """Returns the measurements recorded since the last call to this
+    method (and clears them). The measurements for each type of node
+    are a dictionary keyed by the names in FIELDS.
+    """
+    stats = {name: dict(zip(FIELDS, record)) for name, record in STATS.items()}
+    STATS.clear()
+    return stats
+
+def report(stats: typing.Dict[str, typing.Dict[str, typing.Union[int, float]]],
+           limit: int = 0) -> str:
+    """Returns a table with the (possibly aggregated) measurements for
+    each type of node, sorted by exclusive time.
+
+    Arguments:
+        stats: The measurements returned by collect.
+        limit: The maximum number of types of nodes listed (0 for all).
+    """
+    total = sum(record["exclusive"] for record in stats.values())
+    rows = sorted(stats.items(), key=lambda item: -item[1]["exclusive"])
+    fmt = "{:<16}{:>10}{:>11}{:>11}{:>8}{:>10}{:>12}{:>12}"
+    lines = [fmt.format("Node", "Count", "Incl. ms", "Excl. ms", "Excl %",
+                        "ns/node", "Output", "Self output")]
+    for name, record in rows[:limit] if limit > 0 else rows:
+        count = record["count"]
+        lines.append(fmt.format(name, count,
+            "{:.2f}".format(1e3 * record["inclusive"]),
+            "{:.2f}".format(1e3 * record["exclusive"]),
+            "{:.1f}".format(100 * record["exclusive"] / total if total else 0.0),
+            "{:.0f}".format(1e9 * record["exclusive"] / count if count else 0.0),
+            record["output"], record["selfOutput"]))
+    lines.append(fmt.format("Total", sum(r["count"] for r in stats.values()),
+                            "", "{:.2f}".format(1e3 * total), "", "", "",
+                            sum(r["selfOutput"] for r in stats.values())))
+    return "\n".join(lines)
+
+# End of source code
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file facilitates conversion of operators to 
+# corresponding strings.  
+
+from __future__ import annotations
+
+import ast
+import typing
+
+# The strings corresponding to the boolean operators
+BOOL_OPERATORS: typing.Dict[type, str] = {
+    ast.And: "and", ast.Or: "or"
+}
+
+# The strings corresponding to the comparison operators
+CMP_OPERATORS: typing.Dict[type, str] = {
+    ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "&lt;", ast.LtE: "&lt;=",
+    ast.Gt: "&gt;", ast.GtE: "&gt;=", ast.Is: "is", ast.IsNot: "is not",
+    ast.In: "in", ast.NotIn: "not in"
+}
+
+# The strings corresponding to the unary operators
+UNARY_OPERATORS: typing.Dict[type, str] = {
+    ast.Invert: "~", ast.Not: "not", ast.UAdd: "+", ast.USub: "-"
+}
+
+# The strings corresponding to the binary operators
+BIN_OPERATORS: typing.Dict[type, str] = {
+    ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.MatMult: "@",
+    ast.Div: "/", ast.Mod: "%", ast.Pow: "**", ast.LShift: "&lt;&lt;",
+    ast.RShift: "&gt;&gt;", ast.BitOr: "|", ast.BitXor: "^",
+    ast.BitAnd: "&amp;", ast.FloorDiv: "//"
+}
+
+# The strings for all the operators keyed by the operator class
+OPERATORS: typing.Dict[type, str] = {**BOOL_OPERATORS, **CMP_OPERATORS,
+    **UNARY_OPERATORS, **BIN_OPERATORS}
+
+# The fully rendered XML for all the operators keyed by operator class
+OPERATORS_XML: typing.Dict[type, str] = {opClass: \
+    "<operator>{}</operator>".format(opStr) \
+    for opClass, opStr in OPERATORS.items()}
+
+def convertOp(op: typing.Union[ast.boolop, ast.operator, 
+    ast.unaryop, ast.cmpop]) -> str:
+    """This is a top-level method that can be used to convert
+    any operator to corresponding python source code
+    
+    Arguments:
+        op: The operator AST node to be converted
+
+    Returns:
+        The python source code corresponding to the node 
+        or throws an exception if node is not handled.
+    """
+    opXML = OPERATORS_XML.get(type(op))
+    if opXML is None:
+        raise Exception("Unhandled operator {}".format(ast.dump(op)))
+    return opXML
@@ -0,0 +1,307 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains an asyncio pipeline used to convert a
+# batch of Python source files to srcML when reading the files is
+# slow (eg: on a network file system).  The pipeline has 3 stages:
+#
+#    read    - the files are read in a pool of threads, several at a
+#              time, ahead of their conversion
+#    convert - the sources are converted (parsed and converted) in a
+#              pool of processes
+#    write   - the units are written, in the same order as the files,
+#              in a separate thread
+#
+# The stages are connected by bounded queues.  A stage waits (back
+# pressure) before starting an operation when the queue of pending
+# operations for the next stage is full.  Hence, only a
+# bounded number of files are in memory at any time.  The depth of
+# each queue and the time each stage spends waiting are recorded so
+# that it can be seen whether the reads are hidden behind conversion.
+
+import asyncio
+import concurrent.futures
+import time
+import typing
+
+from . import batch
+
+# The signature of the method that reads a source file (as bytes).
+SourceReader = typing.Callable[[str], bytes]
+
+# The signature of the method that converts a source file, given its
+# contents, to a unit. It must be picklable (a module-level method).
+SourceConverter = typing.Callable[[str, bytes], batch.UnitResult]
+
+# The signature of the method that writes a unit. It returns False if
+# the unit is not written (eg: the conversion failed).
+UnitWriter = typing.Callable[[batch.UnitResult], bool]
+
+
+class Stage:
+    """A bounded queue of the pending operations (reads or conversions)
+    of a stage of the pipeline. A slot in the queue is reserved before
+    an operation is started and is freed once its result is consumed.
+    Hence, at most maxSize operations are started ahead of their
+    consumer. The queue records the number of pending operations and
+    the time spent waiting for a slot (back pressure from the next
+    stage), for an operation to be queued (the stage is starved), and
+    for the oldest operation to complete (its latency is not hidden).
+    """
+
+    def __init__(self, name: str, maxSize: int):
+        """Creates an empty queue.
+
+        Arguments:
+            name: The name of the stage whose operations are queued.
+            maxSize: The maximum number of pending operations.
+        """
+        self.name = name
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(max(1, maxSize))
+        self.pending = 0
+        self.items = self.maxDepth = self.depthSum = 0
+        self.putWait = self.getWait = self.headWait = 0.0
+
+    async def reserve(self) -> None:
+        """Waits for a free slot for an operation that is to be started."""
+        start = time.perf_counter()
+        await self.slots.acquire()
+        self.putWait += time.perf_counter() - start
+        self.pending += 1
+        self.items += 1
+        self.depthSum += self.pending
+        self.maxDepth = max(self.maxDepth, self.pending)
+
+    def put(self, item: typing.Any) -> None:
+        """Queues a started operation (in a slot reserved via reserve)."""
+        self.queue.put_nowait(item)
+
+    def finish(self) -> None:
+        """Queues the marker (None) for the end of the operations."""
+        self.queue.put_nowait(None)
+
+    async def get(self) -> typing.Any:
+        """Removes the oldest item, waiting while the queue is empty."""
+        start = time.perf_counter()
+        item = await self.queue.get()
+        self.getWait += time.perf_counter() - start
+        return item
+
+    async def result(self, operation: typing.Awaitable) -> typing.Any:
+        """Waits for an operation removed from the queue to complete,
+        frees its slot, and returns its result.
+        """
+        start = time.perf_counter()
+        try:
+            return await operation
+        finally:
+            self.headWait += time.perf_counter() - start
+            self.pending -= 1
+            self.slots.release()
+
+    def stats(self) -> typing.Dict[str, typing.Union[int, float]]:
+        """Returns a dictionary with the statistics for this queue."""
+        return {"items": self.items, "maxDepth": self.maxDepth,
+                "meanDepth": self.depthSum / self.items if self.items else 0.0,
+                "putWait": self.putWait, "getWait": self.getWait,
+                "headWait": self.headWait}
+
+
+def timedRead(readSource: SourceReader, path: str) -> typing.Tuple[bytes, float]:
+    """Reads a source file and returns its contents and the time taken.
+    This method is run in the reader threads.
+    """
+    start = time.perf_counter()
+    source = readSource(path)
+    return source, time.perf_counter() - start
+
+
+async def readStage(paths: typing.Iterable[str], readSource: SourceReader,
+                    readers: concurrent.futures.Executor, out: Stage) -> None:
+    """Starts reading the files (in order) and queues the pending reads.
+    The number of reads started ahead of their conversion is bounded by
+    the size of the queue. The paths are also obtained in the reader
+    threads as finding them (eg: scanning directories) may block.
+    """
+    loop = asyncio.get_running_loop()
+    paths = iter(paths)
+    while True:
+        path = await loop.run_in_executor(readers, next, paths, None)
+        if path is None:
+            break
+        await out.reserve()
+        out.put((path, loop.run_in_executor(readers, timedRead,
+                                            readSource, path)))
+    out.finish()
+
+
+async def convertStage(convertSource: SourceConverter,
+                       workers: concurrent.futures.Executor,
+                       inp: Stage, out: Stage) -> None:
+    """Submits the sources (in order) to the worker processes as they
+    are read and queues the pending conversions. A file that cannot be
+    read is queued as a failed unit.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await inp.get()
+        if item is None:
+            break
+        path, read = item
+        try:
+            source, readTime = await inp.result(read)
+        except Exception as exp:
+            source, readTime = None, 0.0
+            failure = batch.UnitResult(path, None, batch.describe(exp), {})
+        await out.reserve()
+        if source is None:
+            conversion = loop.create_future()
+            conversion.set_result(failure)
+        else:
+            conversion = loop.run_in_executor(workers, convertSource, path,
+                                              source)
+        out.put((conversion, readTime))
+    out.finish()
+
+
+async def writeStage(writeUnit: UnitWriter,
+                     writer: concurrent.futures.Executor, inp: Stage) -> bool:
+    """Writes the units in the order of the files (in the writer thread).
+
+    Returns:
+        True if all the units were written.
+    """
+    loop = asyncio.get_running_loop()
+    success = True
+    while True:
+        item = await inp.get()
+        if item is None:
+            return success
+        conversion, readTime = item
+        result = await inp.result(conversion)
+        if "metrics" in result.info:
+            result.info["metrics"]["readTime"] = readTime
+        success = await loop.run_in_executor(writer, writeUnit, result) and success
+
+
+async def runStages(paths: typing.Iterable[str], readSource: SourceReader,
+                    convertSource: SourceConverter, writeUnit: UnitWriter,
+                    executors: typing.List[concurrent.futures.Executor],
+                    readAhead: int, window: int,
+                    stats: typing.Dict[str, typing.Any]) -> bool:
+    """Runs the stages of the pipeline concurrently until all the files
+    are written (or a stage fails).
+    """
+    readers, workers, writer = executors
+    reads = Stage("read", readAhead)
+    units = Stage("convert", window)
+    start = time.perf_counter()
+    try:
+        _, _, success = await asyncio.gather(
+            readStage(paths, readSource, readers, reads),
+            convertStage(convertSource, workers, reads, units),
+            writeStage(writeUnit, writer, units))
+    finally:
+        stats["seconds"] = time.perf_counter() - start
+        for stage in (reads, units):
+            stats[stage.name] = stage.stats()
+    return success
+
+
+def convertFiles(paths: typing.Iterable[str], readSource: SourceReader,
+                 convertSource: SourceConverter, writeUnit: UnitWriter,
+                 jobs: int = 1, readAhead: int = 4, window: int = 0,
+                 initializer: typing.Callable = None, initargs: tuple = (),
+                 stats: typing.Dict[str, typing.Any] = None) -> bool:
+    """Converts the given source files and writes the units in the same
+    order as the paths. The paths are consumed lazily.
+
+    Arguments:
+        paths: The source files to be converted.
+        readSource: The method used to read a source file (in threads).
+        convertSource: The method used to convert a source to a unit
+        (in worker processes).
+        writeUnit: The method used to write a unit (in a thread).
+        jobs: The number of worker processes.
+        readAhead: The maximum number of files read (concurrently)
+        ahead of their conversion.
+        window: The maximum number of units being converted or waiting
+        to be written. Defaults to 4 units per worker.
+        initializer: Optional method called (with initargs) in each
+        worker process to setup the converter.
+        initargs: The arguments to the initializer.
+        stats: Optional dictionary in which the statistics for each
+        queue (see Stage.stats) and the elapsed time are recorded.
+
+    Returns:
+        True if all the units were written.
+    """
+    jobs = max(1, jobs)
+    readers = concurrent.futures.ThreadPoolExecutor(max(1, readAhead),
+                                                    "py2srcml-read")
+    workers = concurrent.futures.ProcessPoolExecutor(jobs,
+        initializer=initializer, initargs=initargs)
+    writer = concurrent.futures.ThreadPoolExecutor(1, "py2srcml-write")
+    try:
+        return asyncio.run(runStages(paths, readSource, convertSource,
+            writeUnit, [readers, workers, writer], readAhead,
+            window if window > 0 else 4 * jobs,
+            stats if stats is not None else {}))
+    finally:
+        for executor in (readers, workers, writer):
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def report(stats: typing.Dict[str, typing.Any]) -> str:
+    """Returns a table with the statistics for the queues of the
+    pipeline (see Stage). The wait times are in seconds. A large head
+    wait for the reads means that reading is not hidden behind the
+    conversion (eg: a larger read-ahead is needed).
+
+    Arguments:
+        stats: The statistics for the pipeline.
+    """
+    lines = ["{:<10}{:>8}{:>10}{:>12}{:>10}{:>10}{:>11}".format("Stage",
+        "Items", "Max depth", "Mean depth", "Put wait", "Get wait",
+        "Head wait")]
+    for name in ("read", "convert"):
+        st = stats.get(name)
+        if st:
+            lines.append("{:<10}{:>8}{:>10}{:>12.1f}{:>10.3f}{:>10.3f}{:>11.3f}"
+                .format(name, st["items"], st["maxDepth"], st["meanDepth"],
+                        st["putWait"], st["getWait"], st["headWait"]))
+    lines.append("Elapsed: {:.3f} s".format(stats.get("seconds", 0.0)))
+    return "\n".join(lines)
+
+# End of source code
@@ -0,0 +1,123 @@
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file adds srcML position attributes (pos:start and
+# pos:end) to the XML generated for statements and expressions.  The
+# attributes are added to the first element of the XML for a node
+# (eg: <expr_stmt> for an assignment or <call> for a call) unless
+# the element belongs to a subexpression (eg: the <name> that starts
+# the XML for "a + b").  Lines and columns are 1-based and columns
+# count characters (a tab is one column).  The end position is that
+# of the last character of the node.  The character columns are
+# computed from the AST's byte offsets using the line offsets of the
+# source (see sourceMap.SourceMap.column), which are computed once
+# per file.
+
+from __future__ import annotations
+
+import ast
+import typing
+
+from . import sourceMap
+
+# The namespace for position attributes (declared in units)
+NAMESPACE = "http://www.srcML.org/srcML/position"
+
+# If True, position attributes are generated (see setSource).
+ENABLED = False
+
+# The map of the source being converted or None if positions are
+# not to be generated for it. It is set (via setSource) by the
+# method that converts a module.
+SOURCE: typing.Optional[sourceMap.SourceMap] = None
+
+# The decimal strings for the line and column numbers. Formatting the
+# numbers is the main cost of positions. So the strings are cached
+# for the largest line and column in a source (see setSource).
+NUMBERS: typing.List[str] = ["0"]
+
+def setSource(srcMap: typing.Optional[sourceMap.SourceMap]) -> None:
+    """Sets the source whose nodes are being converted. Positions are
+    only generated if ENABLED and the source is not None.
+    """
+    global SOURCE
+    SOURCE = srcMap if ENABLED else None
+    if SOURCE is not None:
+        largest = max(len(srcMap.offsets), srcMap.longestLine()) + 1
+        if largest >= len(NUMBERS):
+            NUMBERS.extend(map(str, range(len(NUMBERS), largest + 1)))
+
+# The start tags to which positions are not added: comments and the
+# operators that start the XML for some expressions (eg: "-x").
+SKIPPED = ("<!", "<operator")
+
+def attributes(node: ast.AST, srcMap: sourceMap.SourceMap) -> str:
+    """Returns the position attributes for a node.
+
+    Arguments:
+        node: The statement or expression node.
+        srcMap: The source from which the node was parsed.
+    """
+    numbers = NUMBERS
+    if srcMap.ascii:
+        return f' pos:start="{numbers[node.lineno]}:' \
+               f'{numbers[node.col_offset + 1]}" ' \
+               f'pos:end="{numbers[node.end_lineno]}:' \
+               f'{numbers[node.end_col_offset]}"'
+    return f' pos:start="{numbers[node.lineno]}:' \
+           f'{numbers[srcMap.column(node.lineno, node.col_offset) + 1]}" ' \
+           f'pos:end="{numbers[node.end_lineno]}:' \
+           f'{numbers[srcMap.column(node.end_lineno, node.end_col_offset)]}"'
+
+def addPosition(nodeXML: str, node: ast.AST, srcMap: sourceMap.SourceMap) -> str:
+    """Adds the position attributes for a node to the first element of
+    its XML (if the element is not an operator and does not already
+    have a position).
+
+    Arguments:
+        nodeXML: The XML generated for the node.
+        node: The statement or expression node.
+        srcMap: The source from which the node was parsed.
+
+    Returns:
+        The XML with the position attributes added, if any.
+    """
+    if not nodeXML.startswith("<") or nodeXML.startswith(SKIPPED):
+        return nodeXML
+    end = nodeXML.find(">")
+    if end < 0 or nodeXML.find(" pos:start=", 0, end) >= 0:
+        return nodeXML
+    # A single replace copies the (possibly long) XML just once
+    if nodeXML[end - 1] == "/":
+        return nodeXML.replace("/>", attributes(node, srcMap) + "/>", 1)
+    return nodeXML.replace(">", attributes(node, srcMap) + ">", 1)
+
+# End of source code
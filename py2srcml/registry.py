@@ -0,0 +1,181 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the registries that map each type of AST
+# node to the method that converts it to srcML.  Converters register
+# themselves (typically via the register decorator) so that new node
+# handlers can be added without editing a long chain of isinstance
+# checks.  The converter for a node class is resolved through the
+# class's MRO just once and then cached.  Converters for rarer nodes
+# may be registered lazily (see addLazy) so that their modules are
+# only imported when such a node is first converted.
+
+from __future__ import annotations
+
+import ast
+import typing
+
+# The signature of a method that converts an AST node to srcML.
+Converter = typing.Callable[[ast.AST], str]
+
+class NodeRegistry:
+    """A mapping from AST node classes to the methods that convert
+    them to srcML XML.
+    """
+
+    def __init__(self, kind: str):
+        """Creates an empty registry.
+
+        Arguments:
+            kind: A short description of the nodes in this registry
+            (eg: "statement") used in error messages.
+        """
+        self.kind = kind
+        # The converters explicitly registered for each node class.
+        self.converters: typing.Dict[type, Converter] = {}
+        # The cache of converters resolved (via MRO) for node classes.
+        self.resolved: typing.Dict[type, typing.Optional[Converter]] = {}
+        # The modules (in this package) that register the converters
+        # for node classes that are loaded on first use.
+        self.lazy: typing.Dict[type, str] = {}
+
+    def add(self, nodeClass: type, converter: Converter) -> None:
+        """Registers the converter for a given AST node class. Any
+        previously registered converter for the class is replaced.
+
+        Arguments:
+            nodeClass: The AST node class (eg: ast.Name) to be handled.
+            converter: The method to be used to convert the node.
+        """
+        self.converters[nodeClass] = converter
+        self.lazy.pop(nodeClass, None)
+        # Subclasses may resolve differently now. So clear the cache.
+        self.resolved.clear()
+
+    def addLazy(self, nodeClass: type, moduleName: str) -> None:
+        """Records the module that registers the converter for a given
+        AST node class. The module is imported when the converter for
+        the class is first looked up.
+
+        Arguments:
+            nodeClass: The AST node class (eg: ast.ClassDef) to be handled.
+            moduleName: The module in this package (eg: "class2srcml")
+            that registers the converter for the class.
+        """
+        self.lazy[nodeClass] = moduleName
+        self.resolved.clear()
+
+    def register(self, *nodeClasses: type) -> typing.Callable[[Converter], Converter]:
+        """Decorator to register a method as the converter for one or
+        more AST node classes. For example:
+
+            @registry.EXPRESSIONS.register(ast.Name)
+            def convertName(node: ast.Name) -> str:
+                ...
+
+        Arguments:
+            nodeClasses: The AST node classes handled by the method.
+        """
+        def decorator(converter: Converter) -> Converter:
+            for nodeClass in nodeClasses:
+                self.add(nodeClass, converter)
+            return converter
+        return decorator
+
+    def lookup(self, nodeClass: type) -> typing.Optional[Converter]:
+        """Returns the converter for a given AST node class. The first
+        registered class in the MRO of the node class is used.
+
+        Arguments:
+            nodeClass: The class of the AST node to be converted.
+
+        Returns:
+            The converter for the class or None if there is no converter.
+        """
+        converter = self.resolved.get(nodeClass)
+        if converter is None and nodeClass not in self.resolved:
+            for cls in nodeClass.__mro__:
+                if cls in self.lazy:
+                    # Importing the module registers its converters
+                    importModule(self.lazy[cls])
+                converter = self.converters.get(cls)
+                if converter is not None:
+                    break
+            self.resolved[nodeClass] = converter
+        return converter
+
+    def convert(self, node: ast.AST) -> str:
+        """Converts the given node to srcML using its registered converter.
+
+        Arguments:
+            node: The AST node to be converted.
+
+        Returns:
+            The srcML XML for the node or throws an exception if the
+            node is not handled.
+        """
+        converter = self.lookup(type(node))
+        if converter is None:
+            raise Exception("Unhandled {} {}".format(self.kind, ast.dump(node)))
+        return converter(node)
+
+
+def unhandled(description: str) -> Converter:
+    """Returns a converter that reports that a type of node is not yet
+    supported.
+
+    Arguments:
+        description: The description of the node used in the exception.
+    """
+    def convertUnhandled(node: ast.AST) -> str:
+        raise Exception("Unhandled {} {}".format(description, ast.dump(node)))
+    return convertUnhandled
+
+
+def importModule(name: str) -> None:
+    """Imports a module in this package. Unlike importlib.import_module,
+    __import__ is used so that the import is reported by -X importtime.
+
+    Arguments:
+        name: The name of the module (eg: "class2srcml").
+    """
+    __import__("{}.{}".format(__package__, name))
+
+
+# The registry of converters for statement nodes.
+STATEMENTS = NodeRegistry("statement")
+
+# The registry of converters for expression nodes.
+EXPRESSIONS = NodeRegistry("expression")
+
+# End of source code
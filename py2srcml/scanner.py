@@ -0,0 +1,238 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the methods used to find the Python
+# source files in a directory tree.  The directories are walked with
+# os.scandir (optionally using several threads for very large trees)
+# and the files are yielded as soon as they are found.  This enables
+# conversion to start without first listing the whole tree.
+
+import fnmatch
+import os
+import queue
+import threading
+import typing
+
+# The default glob(s) for the source files to be converted.
+DEFAULT_INCLUDE: typing.Tuple[str, ...] = ("*.py",)
+
+class SourceFilter:
+    """The criteria used to select the source files in a directory tree."""
+
+    def __init__(self, include: typing.Sequence[str] = DEFAULT_INCLUDE,
+                 exclude: typing.Sequence[str] = (), maxSize: int = 0):
+        """Creates the filter.
+
+        Arguments:
+            include: Globs for the files to be converted. A glob is
+            matched against the name of the file and its path relative
+            to the directory being scanned.
+            exclude: Globs for files and directories to be skipped.
+            maxSize: Files larger than these many bytes are skipped.
+            Zero indicates no limit.
+        """
+        self.include = list(include)
+        self.exclude = list(exclude)
+        self.maxSize = maxSize
+
+    def matches(self, globs: typing.List[str], name: str, relPath: str) -> bool:
+        """Returns True if the name or relative path matches any of the globs."""
+        for glob in globs:
+            if fnmatch.fnmatch(name, glob) or fnmatch.fnmatch(relPath, glob):
+                return True
+        return False
+
+    def isExcluded(self, name: str, relPath: str) -> bool:
+        """Returns True if the file or directory is to be skipped."""
+        return bool(self.exclude) and self.matches(self.exclude, name, relPath)
+
+    def isSource(self, entry: os.DirEntry, relPath: str) -> bool:
+        """Returns True if the given file is to be converted."""
+        if not self.matches(self.include, entry.name, relPath) or \
+                self.isExcluded(entry.name, relPath):
+            return False
+        return self.maxSize <= 0 or entry.stat().st_size <= self.maxSize
+
+
+def scanDir(root: str, srcFilter: SourceFilter,
+            relDir: str = "") -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """Scans a single directory (not recursively).
+
+    Arguments:
+        root: The top-level directory being scanned.
+        srcFilter: The criteria to select source files.
+        relDir: The path of the directory to scan relative to root.
+
+    Returns:
+        The lists of source files and sub-directories (relative to root)
+        in the directory, each sorted by name.
+    """
+    files, subDirs = [], []
+    try:
+        with os.scandir(os.path.join(root, relDir)) as entries:
+            for entry in entries:
+                relPath = relDir + "/" + entry.name if relDir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not srcFilter.isExcluded(entry.name, relPath):
+                            subDirs.append(relPath)
+                    elif entry.is_file() and srcFilter.isSource(entry, relPath):
+                        files.append(relPath)
+                except OSError:
+                    # Entries that cannot be checked (eg: removed during
+                    # the scan) are skipped, but not the rest of the
+                    # directory.
+                    pass
+    except OSError:
+        # Unreadable directories are skipped
+        pass
+    files.sort()
+    subDirs.sort()
+    return files, subDirs
+
+
+def walk(root: str, srcFilter: SourceFilter) -> typing.Iterator[str]:
+    """Yields the source files in a directory tree in a deterministic
+    (depth-first, sorted by name) order.
+
+    Arguments:
+        root: The directory to be scanned.
+        srcFilter: The criteria to select source files.
+    """
+    stack = [""]
+    while stack:
+        files, subDirs = scanDir(root, srcFilter, stack.pop())
+        for relPath in files:
+            yield os.path.join(root, relPath)
+        # Push in reverse so that sub-directories are visited in order
+        stack.extend(reversed(subDirs))
+
+
+def walkThreaded(root: str, srcFilter: SourceFilter,
+                 threads: int) -> typing.Iterator[str]:
+    """Yields the source files in a directory tree using several threads
+    to scan directories concurrently. This is useful for very large
+    trees (particularly on network file systems). The files are yielded
+    in the order in which they are found, which is not deterministic.
+
+    Arguments:
+        root: The directory to be scanned.
+        srcFilter: The criteria to select source files.
+        threads: The number of threads to be used.
+    """
+    dirQueue: queue.Queue = queue.Queue()
+    # Bound the number of files found but not yet consumed
+    fileQueue: queue.Queue = queue.Queue(maxsize=4096)
+    # The number of directories queued or being scanned
+    pending = [1]
+    lock = threading.Lock()
+    # Set if the caller stops consuming files before the scan is done
+    stop = threading.Event()
+    # The unexpected exceptions in the threads (raised to the caller)
+    errors: typing.List[Exception] = []
+    DONE = None
+
+    def scanner():
+        while True:
+            relDir = dirQueue.get()
+            if relDir is DONE or stop.is_set():
+                return
+            subDirs: typing.List[str] = []
+            try:
+                files, subDirs = scanDir(root, srcFilter, relDir)
+                for relPath in files:
+                    fileQueue.put(os.path.join(root, relPath))
+            except Exception as exp:
+                # End the scan so that the caller raises the exception
+                errors.append(exp)
+                fileQueue.put(DONE)
+            finally:
+                # The directory is no longer pending (even if it failed)
+                # so that the caller is not left waiting for it.
+                with lock:
+                    pending[0] += len(subDirs) - 1
+                    finished = pending[0] == 0
+                for subDir in subDirs:
+                    dirQueue.put(subDir)
+                if finished:
+                    # All directories have been scanned. Stop the threads.
+                    for _ in range(threads):
+                        dirQueue.put(DONE)
+                    fileQueue.put(DONE)
+
+    dirQueue.put("")
+    workers = [threading.Thread(target=scanner, daemon=True)
+               for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    try:
+        while True:
+            path = fileQueue.get()
+            if path is DONE:
+                break
+            yield path
+        if errors:
+            raise errors[0]
+    finally:
+        # Stop the threads, unblocking any that are waiting to add files
+        stop.set()
+        for _ in range(threads):
+            dirQueue.put(DONE)
+        while any(worker.is_alive() for worker in workers):
+            try:
+                fileQueue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+
+def findSources(paths: typing.Iterable[str], srcFilter: SourceFilter = None,
+                threads: int = 0) -> typing.Iterator[str]:
+    """Yields the source files to be converted. Paths to files are
+    yielded as is. Directories are recursively scanned for source files.
+
+    Arguments:
+        paths: The files and directories specified by the user.
+        srcFilter: The criteria to select source files in directories.
+        threads: The number of threads used to scan each directory. If
+        less than 2, directories are scanned in a deterministic order.
+    """
+    srcFilter = srcFilter or SourceFilter()
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+        elif threads > 1:
+            yield from walkThreaded(path, srcFilter, threads)
+        else:
+            yield from walk(path, srcFilter)
+
+# End of source code
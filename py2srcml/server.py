@@ -0,0 +1,271 @@
+#!/usr/bin/python3
+
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains a long-running server that converts
+# Python source files (or source code) to srcML.  The interpreter and
+# the converter modules are loaded once and the caches stay warm, so
+# a request for a small file costs far less than running py2srcml.
+#
+# The protocol is JSON lines: each request is a JSON object on a line
+#    {"id": 1, "path": "/abs/path/a.py", "filename": "a.py"}
+#    {"id": 2, "source": "x = 1\n", "filename": "snippet.py"}
+# and the server responds with one line per request (in the same order)
+#    {"id": 1, "filename": "a.py", "xml": "<unit ...>...", "error": null,
+#     "info": {...}}
+# The "xml" is the srcML unit (as generated by cli.py) or null if
+# the conversion failed, in which case "error" is the reason.
+#
+# The server listens on a Unix domain socket (for any number of
+# concurrent clients, see client.py) or reads requests from
+# stdin and writes responses to stdout (--stdio).  For example:
+#    $ python3 -m py2srcml.server --socket /tmp/py2srcml.sock -j 4 &
+#    $ python3 -m py2srcml.client --socket /tmp/py2srcml.sock tests/*.py
+
+import argparse
+import concurrent.futures
+import json
+import os
+import queue
+import signal
+import socketserver
+import sys
+import threading
+import typing
+
+from . import batch
+from . import cli
+from . import client
+
+# The type of a request or response
+Message = typing.Dict[str, typing.Any]
+
+def handleRequest(request: Message) -> Message:
+    """Converts the file (or source code) in a request to srcML.
+
+    Arguments:
+        request: The request with the "path" to a file or the "source"
+        code to be converted, and optionally, the "filename" to be used
+        in the unit.
+
+    Returns:
+        The response with the srcML unit (or the error).
+    """
+    filename = request.get("filename") or request.get("path") or "<source>"
+    try:
+        source = request["source"] if "source" in request \
+            else cli.readSource(request["path"])
+        result = cli.convertUnit(filename, source)
+    except Exception as exp:
+        result = batch.UnitResult(filename, None, batch.describe(exp), {})
+    return {"id": request.get("id"), "filename": filename,
+            "xml": result.xml.decode("utf-8") if result.xml is not None else None,
+            "error": result.error, "info": result.info}
+
+
+class ConversionService:
+    """Converts the requests from all the clients using either a single
+    thread or a pool of processes (with -j).
+    """
+
+    def __init__(self, options: argparse.Namespace):
+        """Configures the converter and starts the workers.
+
+        Arguments:
+            options: The command-line options (see cli.setup).
+        """
+        cli.setup(options)
+        self.window = 4 * max(1, options.jobs)
+        if options.jobs > 1:
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                options.jobs, initializer=cli.setup, initargs=(options,))
+        else:
+            # The converters use module-level state (eg: caches). So
+            # all requests are converted by one thread.
+            self.executor = concurrent.futures.ThreadPoolExecutor(1)
+        self.totals: typing.Dict[str, typing.Any] = {}
+        self.lock = threading.Lock()
+
+    def submit(self, line: bytes) -> typing.Tuple[typing.Any, concurrent.futures.Future]:
+        """Starts converting the request on a line.
+
+        Returns:
+            The id of the request and the future for the response.
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict) or \
+                    not ("path" in request or "source" in request):
+                raise ValueError("expected an object with a path or source")
+        except ValueError as exp:
+            future: concurrent.futures.Future = concurrent.futures.Future()
+            future.set_result({"id": None, "filename": None, "xml": None,
+                "error": "Invalid request: {}".format(exp), "info": {}})
+            return None, future
+        return request.get("id"), self.executor.submit(handleRequest, request)
+
+    def serve(self, lines: typing.Iterable[bytes],
+              write: typing.Callable[[bytes], None]) -> None:
+        """Converts the requests read from a client and writes the
+        responses in the same order. Requests are read while earlier
+        ones are being converted (up to a window of requests).
+
+        Arguments:
+            lines: The lines with the requests from the client.
+            write: Writes a line with a response to the client.
+        """
+        pending: queue.Queue = queue.Queue(self.window)
+        writer = threading.Thread(target=self.writeResponses,
+                                  args=(pending, write), daemon=True)
+        writer.start()
+        try:
+            for line in lines:
+                if line.strip():
+                    pending.put(self.submit(line))
+        finally:
+            pending.put(None)
+            writer.join()
+
+    def writeResponses(self, pending: queue.Queue,
+                       write: typing.Callable[[bytes], None]) -> None:
+        """Writes the responses for the pending requests, in order, until
+        the None marking the end of the requests.
+        """
+        connected = True
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            reqId, future = item
+            try:
+                response = future.result()
+            except Exception as exp:
+                response = {"id": reqId, "filename": None, "xml": None,
+                            "error": batch.describe(exp), "info": {}}
+            with self.lock:
+                cli.mergeInfo(self.totals, response["info"])
+            if connected:
+                try:
+                    write(json.dumps(response).encode("utf-8") + b"\n")
+                except (OSError, ValueError):
+                    # The client is gone. Keep draining the requests.
+                    connected = False
+
+    def close(self) -> None:
+        """Stops the workers."""
+        self.executor.shutdown(cancel_futures=True)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handles the requests from a client connected to the socket."""
+
+    def handle(self) -> None:
+        self.server.service.serve(self.rfile, self.writeLine)
+
+    def writeLine(self, data: bytes) -> None:
+        self.wfile.write(data)
+        self.wfile.flush()
+
+
+class SocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """A server with a thread for each connected client."""
+    daemon_threads = True
+
+    def __init__(self, socketPath: str, service: ConversionService):
+        self.service = service
+        super().__init__(socketPath, RequestHandler)
+
+
+def serveSocket(socketPath: str, service: ConversionService) -> None:
+    """Serves requests on a Unix domain socket until interrupted."""
+    if os.path.exists(socketPath):
+        conn = client.connect(socketPath)
+        if conn is not None:
+            conn.close()
+            raise OSError("A server is already listening on " + socketPath)
+        os.remove(socketPath)  # Left behind by a server that was killed
+    oldMask = os.umask(0o077)
+    try:
+        server = SocketServer(socketPath, service)
+    finally:
+        os.umask(oldMask)
+    print("py2srcml server listening on {}".format(socketPath), file=sys.stderr)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.remove(socketPath)
+
+def serveStdio(service: ConversionService) -> None:
+    """Serves the requests read from stdin (until EOF) on stdout."""
+    def writeLine(data: bytes) -> None:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    service.serve(sys.stdin.buffer, writeLine)
+
+def parseArgs(argv: typing.List[str]) -> argparse.Namespace:
+    """Helper method to parse the command-line arguments."""
+    parser = argparse.ArgumentParser(description="Serves requests to "
+        "convert Python source to srcML")
+    parser.add_argument("--socket", default=client.defaultSocket(),
+        metavar="PATH", help="The Unix domain socket to listen on "
+        "(default: {})".format(client.defaultSocket()))
+    parser.add_argument("--stdio", action="store_true",
+        help="Read requests from stdin and write responses to stdout")
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+        help="Number of processes used to convert files in parallel")
+    cli.addConverterOptions(parser)
+    return parser.parse_args(argv)
+
+def main():
+    args = parseArgs(sys.argv[1:])
+    # Stop cleanly (removing the socket) when terminated
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    service = ConversionService(args)
+    try:
+        if args.stdio:
+            serveStdio(service)
+        else:
+            serveSocket(args.socket, service)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        cli.printStats(args, service.totals)
+
+# The top-level script.
+if __name__ == "__main__":
+    main()
+
+# End of source code
@@ -0,0 +1,117 @@
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the output sinks to which srcML is
+# written: standard output, a plain file, or a file compressed with
+# gzip, bz2, or lzma (xz) from the standard library.  The codec is
+# selected by the extension of the output file (eg: out.xml.gz) or
+# explicitly.  The emitter (see emitter.py) writes encoded chunks to
+# the sink as units are produced, so the output is compressed
+# incrementally rather than after the whole archive is generated.
+
+import bz2
+import gzip
+import lzma
+import os
+import sys
+import typing
+import zlib
+
+# The supported codecs ("none" writes plain XML)
+CODECS = ("none", "gzip", "bz2", "lzma")
+
+# The codec used for each file extension when the codec is "auto"
+EXTENSIONS: typing.Dict[str, str] = {
+    ".gz": "gzip", ".gzip": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"
+}
+
+# The compression levels used if a level is not specified. The gzip
+# level is that of the gzip tool (rather than gzip.open's 9).
+DEFAULT_LEVELS: typing.Dict[str, int] = {"gzip": 6, "bz2": 9, "lzma": 6}
+
+
+class GzipSink(gzip.GzipFile):
+    """A gzip file whose flush only flushes the underlying file. The
+    emitter flushes after each unit and a sync flush of the compressor
+    (as done by GzipFile.flush) would end the deflate block each time,
+    costing both time and compression.
+    """
+
+    def flush(self, zlib_mode: int = zlib.Z_NO_FLUSH) -> None:
+        super().flush(zlib_mode)
+
+
+def codecFor(path: typing.Optional[str], codec: str = "auto") -> str:
+    """Returns the codec to be used for an output file.
+
+    Arguments:
+        path: The output file or None for standard output.
+        codec: One of CODECS or "auto" to select the codec based on
+        the extension of the file.
+    """
+    if codec != "auto":
+        if codec not in CODECS:
+            raise ValueError("Unknown codec {}".format(codec))
+        return codec
+    if path is None:
+        return "none"
+    return EXTENSIONS.get(os.path.splitext(path)[1].lower(), "none")
+
+
+def openSink(path: typing.Optional[str], codec: str = "auto",
+             level: int = None) -> typing.BinaryIO:
+    """Opens the binary sink to which the srcML is to be written. The
+    caller must close the sink unless it is sys.stdout.buffer.
+
+    Arguments:
+        path: The output file or None for standard output.
+        codec: One of CODECS or "auto" (see codecFor).
+        level: The compression level. Defaults to DEFAULT_LEVELS.
+
+    Returns:
+        The sink (a file object) to which the XML is to be written.
+    """
+    codec = codecFor(path, codec)
+    if codec == "none":
+        return open(path, "wb") if path is not None else sys.stdout.buffer
+    if level is None:
+        level = DEFAULT_LEVELS[codec]
+    target = path if path is not None else sys.stdout.buffer
+    if codec == "gzip":
+        # A fixed modification time keeps the output reproducible
+        if path is not None:
+            return GzipSink(path, "wb", compresslevel=level, mtime=0)
+        return GzipSink(fileobj=target, mode="wb", compresslevel=level, mtime=0)
+    if codec == "bz2":
+        return bz2.BZ2File(target, "wb", compresslevel=level)
+    return lzma.LZMAFile(target, "wb", preset=level)
+
+# End of source code
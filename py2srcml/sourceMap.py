@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains helpers to locate AST nodes in the source
+# code from which they were parsed.  The positions in the AST are a
+# (1-based) line number and a column offset in bytes of the UTF-8
+# encoded line.  A table with the offset of the start of each line
+# converts these positions to offsets into the source bytes (or to
+# character columns, see SourceMap.column).  Sources in other
+# encodings (see PEP 263) are re-encoded to UTF-8 as the parser does.
+
+from __future__ import annotations
+
+import ast
+import io
+import typing
+
+def lineOffsets(source: bytes) -> typing.List[int]:
+    """Returns the offset of the start of each line in the source.
+    The offset of line n (1-based, as in the AST) is at index n - 1.
+    """
+    offsets = [0]
+    pos = source.find(b"\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = source.find(b"\n", pos + 1)
+    return offsets
+
+
+def utf8Source(source: typing.Union[str, bytes]) -> bytes:
+    """Returns the source code encoded in UTF-8, the encoding to which
+    the column offsets in the AST refer.
+
+    Arguments:
+        source: The source code as text or as the bytes of a file
+        (possibly memory-mapped) in the encoding declared by a coding
+        cookie or a BOM.
+    """
+    if isinstance(source, str):
+        return source.encode("utf-8")
+    if not isinstance(source, bytes):
+        source = bytes(source)
+    if source.isascii():
+        return source
+    # Only non-ASCII sources may be in another encoding.
+    import tokenize
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+    if encoding == "utf-8":
+        return source
+    return source.decode(encoding).encode("utf-8")
+
+
+class SourceMap:
+    """The source bytes of a module along with its line offsets."""
+
+    def __init__(self, source: typing.Union[str, bytes]):
+        """Creates the map for the given source code.
+
+        Arguments:
+            source: The source code from which the AST was parsed.
+        """
+        # AST column offsets are in bytes of the UTF-8 source
+        source = utf8Source(source)
+        self.source = source
+        self.offsets = lineOffsets(source)
+        # Byte and character columns are the same for ASCII sources
+        self.ascii = source.isascii()
+
+    def span(self, node: ast.AST) -> typing.Tuple[int, int]:
+        """Returns the start and end offsets of a node in the source."""
+        offsets = self.offsets
+        return (offsets[node.lineno - 1] + node.col_offset,
+                offsets[node.end_lineno - 1] + node.end_col_offset)
+
+    def column(self, line: int, byteCol: int) -> int:
+        """Returns the (0-based) character column for a column offset
+        in bytes (as in the AST) in a given line.
+
+        Arguments:
+            line: The 1-based line number.
+            byteCol: The offset in bytes from the start of the line.
+        """
+        if self.ascii:
+            return byteCol
+        start = self.offsets[line - 1]
+        prefix = self.source[start:start + byteCol]
+        return byteCol if prefix.isascii() else \
+            len(prefix.decode("utf-8", "replace"))
+
+    def longestLine(self) -> int:
+        """Returns the length (in bytes) of the longest line."""
+        offsets = self.offsets
+        longest = len(self.source) - offsets[-1]
+        for i in range(1, len(offsets)):
+            longest = max(longest, offsets[i] - offsets[i - 1])
+        return longest
+
+    def text(self, node: ast.AST) -> bytes:
+        """Returns the source text of a node."""
+        start, end = self.span(node)
+        return self.source[start:end]
+
+# End of source code
@@ -39,8 +39,23 @@ START_UNIT:str = '<unit xmlns="http://www.srcML.org/srcML/src" '\
                    'revision="1.0.0" language="Python3" '\
                    'filename="{}">'
 
+# The start of a unit with position attributes (see positions.py)
+START_UNIT_POSITIONS:str = '<unit xmlns="http://www.srcML.org/srcML/src" '\
+                             'xmlns:py="http://www.srcML.org/srcML/py" '\
+                             'xmlns:pos="http://www.srcML.org/srcML/position" '\
+                             'revision="1.0.0" language="Python3" '\
+                             'filename="{}">'
+
 END_UNIT:str = '</unit>  <!-- {} -->'
 
 PROLOG:str = "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
 
+# The root unit of a srcML archive that contains the units for
+# several source files.
+START_ARCHIVE:str = '<unit xmlns="http://www.srcML.org/srcML/src" '\
+                      'xmlns:py="http://www.srcML.org/srcML/py" '\
+                      'revision="1.0.0">'
+
+END_ARCHIVE:str = '</unit>'
+
 # End of source code
@@ -0,0 +1,302 @@
+#!/usr/bin/python3
+
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains methods that focus on converting
+# a statement node in the AST to srcML.  The statement node has
+# several subclasses and is involved.  Hence, they have been
+# placed in a separate source file to keep things organized.
+
+from __future__ import annotations
+
+import ast
+import collections
+import typing
+
+from . import expr2srcml
+from . import func2srcml
+from . import loops2srcml
+from . import import2srcml
+from . import op2srcml
+from . import if2srcml
+from . import xmlFormat as XML
+from . import registry
+from . import iterative
+from . import positions
+
+# The set of AST nodes that constitute a statement in Python.
+AST_StmtNodes = typing.Union[ast.FunctionDef, ast.AsyncFunctionDef,
+    ast.ClassDef, ast.Return, ast.Delete, ast.Assign, ast.AugAssign,
+    ast.AnnAssign, ast.For, ast.AsyncFor, ast.While, ast.If, 
+    ast.With, ast.AsyncWith, ast.Raise, ast.Try, ast.Assert, 
+    ast.Import, ast.ImportFrom, ast.Global, ast.Nonlocal, ast.Expr,
+    ast.Pass, ast.Break, ast.Continue]
+
+def convertBlock(block: AST_StmtNodes, content_only: bool = False) -> str:
+    """Helper method to convert a block of code such as body of
+    an if-statement, else-statement, for-loop etc. to srcML
+    
+    Arguments:
+        block: Any AST node for an statement can be passed-in.
+        content_only: Boolean flag to determine whether the surrounding block 
+            and block_content tags should be returned
+
+    Returns:
+        The srcML XML corresponding to the body.
+    """
+    # Collect the XML for each statement and join them just once to
+    # avoid repeatedly copying an ever-growing string.
+    blockXML = "".join([convertStmt(stmt) for stmt in block])
+    if content_only:
+        return blockXML
+    return "<block>:<block_content>" + blockXML + "</block_content></block>"
+
+
+@registry.STATEMENTS.register(ast.Assign)
+def convertAssignment(stmt: ast.Assign) -> str:
+    """Helper method to convert assignments of the form 'i = i + 1' to
+    corresponding srcML XML.
+    
+    Arguments:
+        stmt: The assignment statement to be converted to srcML
+
+    Returns:
+        The srcML XML corresponding to the given assignment statement
+    """
+    if len(stmt.targets) > 1: 
+        raise Exception("Unhandled many targets {}".format(ast.dump(stmt)))
+    rhsXML = XML.OPERATOR.form("=") + expr2srcml.convertExpr(stmt.value)
+    lhsXML = expr2srcml.convertExpr(stmt.targets[0])
+    return XML.EXPR_STMT.form(lhsXML + rhsXML)
+
+
+@registry.STATEMENTS.register(ast.AugAssign)
+def convertAugAssignment(stmt: ast.AugAssign) -> str:
+    """Helper method to convert augumented assignments of the form 
+    'i += 1' to corresponding srcML XML.
+    
+    Arguments:
+        stmt: The augumented assignment statement to be converted to srcML
+
+    Returns:
+        The srcML XML corresponding to the given statement
+    """
+    # Get the XML for the target expression
+    lhsXML = expr2srcml.convertExpr(stmt.target)
+    opXML  = op2srcml.convertOp(stmt.op)
+    rhsXML = expr2srcml.convertExpr(stmt.value)
+    return XML.EXPR_STMT.form(lhsXML + opXML + rhsXML)
+
+@registry.STATEMENTS.register(ast.Global, ast.Nonlocal)
+def convertDeclaration(stmt: typing.Union[ast.Nonlocal,ast.Global]) -> str:
+    """Helper method to convert non-local and global variable declarations
+    of the form 'global x' to corresponding srcML XML.
+
+    Arguments:
+        stmt: The declaration statement to be converted
+
+    Returns:
+        The srcML XML corresponding to the given statement
+    """
+
+    if isinstance(stmt, ast.Global):
+        specifier = "global"
+    else:
+        specifier = "nonlocal"
+
+    declXML = []
+    for i in range(len(stmt.names)):
+        if i == 0:
+            declXML.append(f"<decl><type><specifier>{specifier}</specifier></type>" \
+                           f"{expr2srcml.convertName(ast.Name(stmt.names[i]))}</decl>")
+        else:
+            declXML.append(f"<decl><type ref=\"prev\"/>{expr2srcml.convertName(ast.Name(stmt.names[i]))}</decl>")
+    # Separate the declarations with commas (no trailing comma)
+    return "<decl_stmt>" + "<operator>,</operator>".join(declXML) + "</decl_stmt>"
+
+
+@registry.STATEMENTS.register(ast.Return)
+def convertReturn(stmt: ast.Return) -> str:
+    """Helper method to convert a return statement to srcML XML."""
+    retXML = expr2srcml.convertExpr(stmt.value) if stmt.value else ""
+    return "<return>return{}</return>".format(retXML)
+
+
+@registry.STATEMENTS.register(ast.Raise)
+def convertRaise(stmt: ast.Raise) -> str:
+    """Helper method to convert a raise statement of the form
+    'raise ValueError() from e' to srcML XML.
+    """
+    raiseXML = "<throw>raise"
+    raiseXML += expr2srcml.convertExpr(stmt.exc)
+    if stmt.cause is not None:
+        raiseXML += "<name>from</name>"
+        raiseXML += expr2srcml.convertExpr(stmt.cause)
+    raiseXML += "</throw>"
+    return raiseXML
+
+
+@registry.STATEMENTS.register(ast.Assert)
+def convertAssert(stmt: ast.Assert) -> str:
+    """Helper method to convert an assert statement to srcML XML."""
+    assertXML = "<assert>"
+    assertXML += expr2srcml.convertExpr(stmt.test)
+    if stmt.msg is not None:
+        assertXML += "<operator>,</operator>"
+        assertXML += expr2srcml.convertExpr(stmt.msg)
+    assertXML += "</assert>"
+    return assertXML
+
+
+@registry.STATEMENTS.register(ast.Expr)
+def convertExprStmt(stmt: ast.Expr) -> str:
+    """Helper method to convert an expression statement to srcML XML."""
+    exprXML = expr2srcml.convertExpr(stmt)
+    return "<expr_stmt>{}</expr_stmt>".format(exprXML)
+
+
+@registry.STATEMENTS.register(ast.Pass)
+def convertPass(stmt: ast.Pass) -> str:
+    return "<empty_stmt>pass</empty_stmt>"
+
+
+@registry.STATEMENTS.register(ast.Break)
+def convertBreak(stmt: ast.Break) -> str:
+    return "<break>break</break>"
+
+
+@registry.STATEMENTS.register(ast.Continue)
+def convertContinue(stmt: ast.Continue) -> str:
+    return "<continue>continue</continue>"
+
+
+# The statements whose converters are imported when first needed.
+registry.STATEMENTS.addLazy(ast.ClassDef, "class2srcml")
+registry.STATEMENTS.addLazy(ast.Try, "try2srcml")
+
+# The statements that are not yet supported.
+registry.STATEMENTS.add(ast.AsyncFunctionDef, registry.unhandled("async func def"))
+registry.STATEMENTS.add(ast.Delete, registry.unhandled("delete"))
+registry.STATEMENTS.add(ast.AnnAssign, registry.unhandled("ann assign"))
+registry.STATEMENTS.add(ast.AsyncFor, registry.unhandled("async for loop"))
+registry.STATEMENTS.add(ast.With, registry.unhandled("with"))
+registry.STATEMENTS.add(ast.AsyncWith, registry.unhandled("async with"))
+
+
+# The engine used to convert statements (see iterative.ENGINES)
+ENGINE = "auto"
+
+# If True, a statement that cannot be converted is replaced by a
+# placeholder (see convertUnhandled) rather than failing the file.
+TOLERANT = False
+
+# The number of statements replaced by placeholders, by type of node.
+DEGRADED: typing.Counter[str] = collections.Counter()
+
+def convertUnhandled(stmt: AST_StmtNodes) -> str:
+    """Returns a placeholder for a statement that could not be converted.
+    The placeholder records the type of the statement and its lines.
+
+    Arguments:
+        stmt: The python statement that could not be converted.
+    """
+    typeName = type(stmt).__name__
+    DEGRADED[typeName] += 1
+    return '<py:unhandled type="{}" line="{}" end_line="{}"/>'.format(
+        typeName, getattr(stmt, "lineno", ""), getattr(stmt, "end_lineno", ""))
+
+
+def restoreDegraded(saved: typing.Counter[str]) -> None:
+    """Restores DEGRADED to a copy saved before a failed attempt to
+    convert a statement, so that the placeholders in the discarded XML
+    are not counted.
+    """
+    DEGRADED.clear()
+    DEGRADED.update(saved)
+
+
+def convertStmt(stmt: AST_StmtNodes) -> str:
+    """
+    This is a top-level method that can be used to convert any type of
+    python statement to corresponding srcML XML. The converter for the
+    statement is looked up in registry.STATEMENTS. A statement with
+    expressions nested too deeply for the recursive converters is
+    converted using the iterative engine (see ENGINE). In tolerant mode
+    (see TOLERANT), failures are isolated to the statement. Position
+    attributes are added if positions.SOURCE is set.
+
+    Arguments:
+        stmt: The python statement to converted to XML
+    Returns:
+        The XML fragment corresponding to the python statement.
+    """
+    if TOLERANT:
+        degraded = DEGRADED.copy()
+        try:
+            stmtXML = convertStmtWith(stmt)
+        except MemoryError:
+            raise
+        except Exception:
+            restoreDegraded(degraded)
+            stmtXML = convertUnhandled(stmt)
+    else:
+        stmtXML = convertStmtWith(stmt)
+    srcMap = positions.SOURCE
+    if srcMap is not None:
+        return positions.addPosition(stmtXML, stmt, srcMap)
+    return stmtXML
+
+
+def convertStmtWith(stmt: AST_StmtNodes) -> str:
+    """Helper method to convert a statement using the engine selected
+    via ENGINE.
+
+    Arguments:
+        stmt: The python statement to converted to XML
+    Returns:
+        The XML fragment corresponding to the python statement.
+    """
+    converter = registry.STATEMENTS.lookup(type(stmt))
+    if converter is None:
+        raise Exception("Unhandled statement {}".format(ast.dump(stmt)))
+    if ENGINE == "auto":
+        degraded = DEGRADED.copy() if TOLERANT else None
+        try:
+            return converter(stmt)
+        except RecursionError:
+            if degraded is not None:
+                restoreDegraded(degraded)
+            return iterative.convertStmt(stmt, converter)
+    elif ENGINE == "iterative":
+        return iterative.convertStmt(stmt, converter)
+    return converter(stmt)
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains an optional cache that reuses the srcML
+# for repeated expression subtrees.  Generated and competitive
+# programming code repeats identical expressions constantly, such as
+# "map(int, input().split())".  The srcML for an expression is cached
+# with the expression's source text as the key: identical text always
+# parses to an identical subtree (and hence identical srcML).  The
+# text is used rather than a structural hash of the subtree because
+# hashing the subtree costs more than rendering it.  The cache is a
+# size-bounded LRU cache and counts the number of nodes (and bytes
+# of XML) whose rendering was skipped.
+
+import ast
+import collections
+import typing
+
+from . import leafCache
+from . import sourceMap
+
+# Expressions whose source text is longer than this are not cached.
+# This bounds the cost of the keys for deeply nested expressions.
+MAX_TEXT_LENGTH: int = 256
+
+# Leaves are not cached here as they are handled by the leaf caches.
+LEAF_TYPES = {ast.Name, ast.Constant}
+
+class SubtreeCache:
+    """A size-bounded LRU cache of the srcML for expressions, keyed by
+    the source text of the expression.
+    """
+
+    def __init__(self, maxSize: int = leafCache.DEFAULT_SIZE,
+                 maxTextLength: int = MAX_TEXT_LENGTH):
+        """Creates an empty cache.
+
+        Arguments:
+            maxSize: The maximum number of expressions in the cache. A
+            value of zero disables caching.
+            maxTextLength: Expressions with longer source text are not
+            cached.
+        """
+        self.maxSize = maxSize
+        self.maxTextLength = maxTextLength
+        # The cached entries: source text -> (srcML, number of nodes)
+        self.entries: typing.OrderedDict[bytes, typing.Tuple[str, int]] = \
+            collections.OrderedDict()
+        # The source of the module being converted (see setSource)
+        self.srcMap: typing.Optional[sourceMap.SourceMap] = None
+        self.rendered = 0
+        self.hits = self.misses = self.evictions = 0
+        self.savedNodes = self.savedBytes = 0
+
+    def setSource(self, srcMap: typing.Optional[sourceMap.SourceMap]) -> None:
+        """Sets the source of the module whose expressions are being
+        converted. If it is None, expressions are not cached.
+        """
+        self.srcMap = srcMap
+
+    def convert(self, expr: ast.expr,
+                converter: typing.Callable[[ast.expr], str]) -> str:
+        """Returns the srcML for an expression, reusing the XML for an
+        identical expression if possible.
+
+        Arguments:
+            expr: The expression to be converted.
+            converter: The method that renders the expression (its
+            subexpressions are in turn converted via this cache).
+
+        Returns:
+            The srcML for the expression.
+        """
+        self.rendered += 1
+        srcMap = self.srcMap
+        if srcMap is None or type(expr) in LEAF_TYPES or self.maxSize <= 0:
+            return converter(expr)
+        start, end = srcMap.span(expr)
+        if end - start > self.maxTextLength:
+            return converter(expr)
+        key = srcMap.source[start:end]
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            self.savedNodes += entry[1]
+            self.savedBytes += len(entry[0])
+            return entry[0]
+        self.misses += 1
+        before = self.rendered
+        exprXML = converter(expr)
+        # The number of nodes rendered for this expression (inclusive)
+        self.entries[key] = (exprXML, self.rendered - before + 1)
+        if len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return exprXML
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        self.entries.clear()
+        self.rendered = 0
+        self.hits = self.misses = self.evictions = 0
+        self.savedNodes = self.savedBytes = 0
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Returns a dictionary with the counters for this cache."""
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "savedNodes": self.savedNodes,
+                "savedBytes": self.savedBytes}
+
+
+def counters(cache: SubtreeCache, since: typing.Dict[str, int] = None
+             ) -> typing.Dict[str, int]:
+    """Returns the counters of the cache (or the change in the counters
+    since an earlier call to this method).
+    """
+    stats = cache.stats()
+    return {name: value - (since or {}).get(name, 0)
+            for name, value in stats.items()}
+
+
+def report(stats: typing.Dict[str, int]) -> str:
+    """Returns a summary of the (possibly aggregated) cache counters."""
+    lookups = stats.get("hits", 0) + stats.get("misses", 0)
+    return "\n".join([
+        "Subtree lookups : {}".format(lookups),
+        "Hits            : {}".format(stats.get("hits", 0)),
+        "Misses          : {}".format(stats.get("misses", 0)),
+        "Hit rate        : {:.1f}%".format(
+            100 * stats.get("hits", 0) / lookups if lookups else 0.0),
+        "Evictions       : {}".format(stats.get("evictions", 0)),
+        "Nodes saved     : {}".format(stats.get("savedNodes", 0)),
+        "XML bytes saved : {}".format(stats.get("savedBytes", 0))])
+
+# End of source code
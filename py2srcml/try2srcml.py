@@ -28,11 +28,14 @@
 # Author(s):
 #     DJ Rao               raodm@miamioh.edu
 #------------------------------------------------------------------------
+from __future__ import annotations
+
 import ast
 
-import expr2srcml
-import XML
-import stmt2srcml
+from . import expr2srcml
+from . import xmlFormat as XML
+from . import stmt2srcml
+from . import registry
 
 
 # This source file contains methods that focus on converting
@@ -41,6 +44,7 @@ import stmt2srcml
 # This source file has been introduced to streamline the
 # overall script and keep things organized.
 
+@registry.STATEMENTS.register(ast.Try)
 def convertTry(tryStmt: ast.Try) -> str:
 
     """Helper method to convert try/except blocks into srcML.
@@ -55,14 +59,14 @@ def convertTry(tryStmt: ast.Try) -> str:
     Returns:
         the srcML XML corresponding to the given block
     """
-    tryXML = stmt2srcml.convertBlock(tryStmt.body)
+    tryXML = ["try", stmt2srcml.convertBlock(tryStmt.body)]
     for handler in tryStmt.handlers:
         exception = expr2srcml.convertExprValue(handler.type) if handler.type else ""
         name = expr2srcml.convertName(ast.Name(handler.name, ast.Store())) if handler.name else ""
         body = stmt2srcml.convertBlock(handler.body)
-        tryXML += XML.form("catch", "except" + exception + name + body)
+        tryXML.append(XML.CATCH.form("except" + exception + name + body))
     # should else be supported?
-    tryXML += XML.form("else", stmt2srcml.convertBlock(tryStmt.orelse)) if len(tryStmt.orelse) > 0 else ""
-    tryXML += XML.form("finally", stmt2srcml.convertBlock(tryStmt.finalbody)) if len(tryStmt.finalbody) > 0 else ""
+    tryXML.append(XML.ELSE.form(stmt2srcml.convertBlock(tryStmt.orelse)) if len(tryStmt.orelse) > 0 else "")
+    tryXML.append(XML.FINALLY.form(stmt2srcml.convertBlock(tryStmt.finalbody)) if len(tryStmt.finalbody) > 0 else "")
 
-    return XML.form("try","try" + tryXML)
+    return XML.TRY.form("".join(tryXML))
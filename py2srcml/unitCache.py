@@ -0,0 +1,251 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains a content-addressed on-disk cache of
+# converted srcML.  Each entry is keyed by a hash of the source bytes,
+# the version of the converter, the version of Python (whose ast
+# module is used), and any options that affect the output.  An entry
+# stores the body of the <unit> (without the start and end tags that
+# contain the file name) so that unchanged files are never parsed or
+# converted again, even if they are renamed.  Failures (such as the
+# "Unhandled ..." exceptions) are also cached so that known-bad files
+# are skipped cheaply.  The total size of the cache is bounded by
+# evicting the least recently used entries.
+
+import glob
+import hashlib
+import os
+import sys
+import tempfile
+import typing
+
+# The default limit on the size of the cache (1 GiB)
+DEFAULT_MAX_SIZE: int = 1 << 30
+
+# The file extensions for converted units and cached failures
+UNIT_EXT = ".xml"
+FAILURE_EXT = ".err"
+
+class CachedFailure(Exception):
+    """Exception raised when a source file is known (from the cache) to
+    fail conversion. The message is the reason for the original failure.
+    """
+    pass
+
+def converterVersion() -> str:
+    """Returns a version string for the converter. The version is a hash
+    of the converter's source files so that the cache is automatically
+    invalidated whenever the converter is changed.
+    """
+    digest = hashlib.sha256()
+    srcDir = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(srcDir, "*.py"))):
+        with open(path, "rb") as srcFile:
+            digest.update(srcFile.read())
+    return digest.hexdigest()[:16]
+
+
+class UnitCache:
+    """A directory of cached srcML unit bodies and failures."""
+
+    def __init__(self, directory: str, maxSize: int = DEFAULT_MAX_SIZE,
+                 variant: str = ""):
+        """Opens (creating if needed) the cache in the given directory.
+
+        Arguments:
+            directory: The directory in which entries are stored.
+            maxSize: The limit on the total size of entries in bytes.
+            variant: A string describing the options that affect the
+            generated srcML. It is included in the keys.
+        """
+        self.directory = directory
+        self.maxSize = maxSize
+        # The AST (and hence the srcML) depends on the Python version
+        self.prefix = "{}\0{}.{}\0{}\0".format(converterVersion(),
+            *sys.version_info[:2], variant).encode()
+        os.makedirs(directory, exist_ok=True)
+        # The total size of the entries. Computed when first needed.
+        self.size: typing.Optional[int] = None
+        self.hits = self.negativeHits = self.misses = 0
+        self.stores = self.evictions = 0
+
+    def key(self, source: typing.Union[str, bytes]) -> str:
+        """Returns the key for the given source bytes (or a memory-mapped
+        source file, or source code as text). The key is a hash of the
+        converter version, the Python version, the variant (options) and
+        the source only: the file name is not included, so that renamed
+        files are still found in the cache.
+        """
+        digest = hashlib.sha256(self.prefix)
+        if isinstance(source, str):
+            # The coding cookie (if any) of text is not used when it is
+            # parsed. So text is not keyed as the same bytes would be.
+            digest.update(b"\0text\0")
+            source = source.encode("utf-8")
+        digest.update(source)
+        return digest.hexdigest()
+
+    def entryPath(self, key: str, ext: str) -> str:
+        """Returns the path to the file for an entry."""
+        return os.path.join(self.directory, key[:2], key + ext)
+
+    def read(self, path: str) -> typing.Optional[bytes]:
+        """Returns the contents of an entry (marking it as recently
+        used) or None if the entry does not exist.
+        """
+        try:
+            with open(path, "rb") as entry:
+                data = entry.read()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def lookup(self, key: str) -> typing.Optional[bytes]:
+        """Returns the cached unit body for a key. Raises CachedFailure
+        if the source is known to fail conversion.
+
+        Arguments:
+            key: The key for the source (see key()).
+
+        Returns:
+            The cached body or None if there is no entry for the key.
+        """
+        body = self.read(self.entryPath(key, UNIT_EXT))
+        if body is not None:
+            self.hits += 1
+            return body
+        reason = self.read(self.entryPath(key, FAILURE_EXT))
+        if reason is not None:
+            self.negativeHits += 1
+            raise CachedFailure(reason.decode("utf-8", "replace"))
+        self.misses += 1
+        return None
+
+    def store(self, key: str, body: bytes) -> None:
+        """Caches the srcML unit body for a key."""
+        self.write(self.entryPath(key, UNIT_EXT), body)
+
+    def storeFailure(self, key: str, reason: str) -> None:
+        """Caches the reason that the source for a key failed conversion."""
+        self.write(self.entryPath(key, FAILURE_EXT), reason.encode("utf-8"))
+
+    def write(self, path: str, data: bytes) -> None:
+        """Atomically writes an entry and evicts entries if the cache
+        has become too large. Several processes may share a cache.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmpPath = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as entry:
+                entry.write(data)
+            os.replace(tmpPath, path)
+        except OSError:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+            return
+        self.stores += 1
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self.entries())
+        else:
+            self.size += len(data)
+        if self.size > self.maxSize:
+            self.evict()
+
+    def entries(self) -> typing.Iterator[typing.Tuple[str, int, float]]:
+        """Yields the path, size, and last-use time of each entry."""
+        for subDir in os.scandir(self.directory):
+            if not subDir.is_dir():
+                continue
+            for entry in os.scandir(subDir.path):
+                if entry.name.endswith((UNIT_EXT, FAILURE_EXT)):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, st.st_size, st.st_mtime
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache is
+        at most 90% of its maximum size.
+        """
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        self.size = sum(size for _, size, _ in entries)
+        target = self.maxSize * 9 // 10
+        for path, size, _ in entries:
+            if self.size <= target:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except OSError:
+                pass
+            self.size -= size
+
+    def trim(self) -> None:
+        """Evicts entries if the cache is larger than its maximum size.
+        The size is otherwise only checked when an entry is written.
+        Hence, this method is used once the files are converted so that
+        a cache that was only read (or was filled with a larger maximum
+        size) is also kept within the maximum size.
+        """
+        self.size = sum(size for _, size, _ in self.entries())
+        if self.size > self.maxSize:
+            self.evict()
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Returns the counters for this cache."""
+        return {"hits": self.hits, "negativeHits": self.negativeHits,
+                "misses": self.misses, "stores": self.stores,
+                "evictions": self.evictions}
+
+
+def report(stats: typing.Dict[str, int], cache: UnitCache) -> str:
+    """Returns a summary of the (possibly aggregated) cache statistics."""
+    entries = list(cache.entries())
+    lookups = stats["hits"] + stats["negativeHits"] + stats["misses"]
+    hitRate = (stats["hits"] + stats["negativeHits"]) / lookups if lookups else 0.0
+    return "\n".join([
+        "Cache directory : {}".format(cache.directory),
+        "Lookups         : {}".format(lookups),
+        "Hits            : {}".format(stats["hits"]),
+        "Negative hits   : {}".format(stats["negativeHits"]),
+        "Misses          : {}".format(stats["misses"]),
+        "Hit rate        : {:.1f}%".format(100 * hitRate),
+        "Stores          : {}".format(stats["stores"]),
+        "Evictions       : {}".format(stats["evictions"]),
+        "Entries         : {}".format(len(entries)),
+        "Size            : {} of {} bytes".format(
+            sum(size for _, size, _ in entries), cache.maxSize)])
+
+# End of source code
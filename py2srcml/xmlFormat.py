@@ -38,6 +38,8 @@
 # we generate XML here so that we can set a breakpoint and observe
 # stack traces and troubleshoot issues.
 
+from __future__ import annotations
+
 import ast
 import typing
 
@@ -49,7 +51,7 @@ AST_ExprNodes = typing.Union[ast.BoolOp, ast.BinOp,
     ast.Await, ast.Yield, ast.YieldFrom, ast.Compare, ast.Call,
     ast.FormattedValue, ast.JoinedStr, ast.Constant, ast.Attribute,
     ast.Subscript, ast.Starred, ast.Name, ast.List, ast.Tuple, 
-    ast.Slice, ast.Num, ast.Str, ast.Expr]
+    ast.Slice, ast.Expr]
 
 # The set of AST nodes that constitute a statement in Python.
 # These type aliases are used in different source files.
@@ -60,19 +62,91 @@ AST_StmtNodes = typing.Union[ast.FunctionDef, ast.AsyncFunctionDef,
     ast.Import, ast.ImportFrom, ast.Global, ast.Nonlocal, ast.Expr,
     ast.Pass, ast.Break, ast.Continue]
 
+class Tag:
+    """A compiled XML tag. The start and end strings of the tag are
+    computed once so that forming an element is just a concatenation.
+    """
+    __slots__ = ("open", "close")
+
+    def __init__(self, stTag: str):
+        """Creates a compiled tag.
+
+        Arguments:
+            stTag: The start tag, optionally with attributes. Eg:
+            'literal type="string"'
+        """
+        # XML tags may have attributes eg: 'literal type="string"'
+        # So we just always use just the 1st word for end tag.
+        self.open  = "<{}>".format(stTag)
+        self.close = "</{}>".format(stTag.split()[0])
+
+    def form(self, val: str) -> str:
+        """Returns the XML element with the given value as its content."""
+        return f"{self.open}{val}{self.close}"
+
+
+# The compiled tags created so far, keyed by the start tag string.
+TAGS: typing.Dict[str, Tag] = {}
+
+def tag(stTag: str) -> Tag:
+    """Returns the compiled tag for the given start tag (including any
+    attributes). Each distinct start tag is compiled only once.
+
+    Arguments:
+        stTag: The start tag, optionally with attributes.
+    """
+    compiled = TAGS.get(stTag)
+    if compiled is None:
+        compiled = TAGS[stTag] = Tag(stTag)
+    return compiled
+
+
+# The compiled tags that are frequently used by the converters.
+ANNOTATION      = tag("annotation")
+ARGUMENT        = tag("argument")
+BLOCK           = tag("block")
+CATCH           = tag("catch")
+CLASS           = tag("class")
+CONDITION       = tag("condition")
+DECL            = tag("decl")
+ELSE            = tag("else")
+EXPR            = tag("expr")
+EXPR_STMT       = tag("expr_stmt")
+FILE            = tag("file")
+FINALLY         = tag("finally")
+FUNCTION        = tag("function")
+INCLUDE         = tag("include")
+INDEX           = tag("index")
+LAMBDA          = tag("lambda")
+LITERAL_BOOLEAN = tag("literal type=\"boolean\"")
+LITERAL_COMPLEX = tag("literal type=\"complex\"")
+LITERAL_NONE    = tag("literal type=\"none\"")
+LITERAL_NUMBER  = tag("literal type=\"number\"")
+LITERAL_STRING  = tag("literal type=\"string\"")
+NAME            = tag("name")
+OPERATOR        = tag("operator")
+PARAMETER       = tag("parameter")
+SUPER           = tag("super")
+SUPER_LIST      = tag("super_list")
+TERNARY         = tag("ternary")
+THEN            = tag("then")
+TRY             = tag("try")
+TYPE            = tag("type")
+
 
 def form(*tagValPairs) -> str:
-    xmlStr = ""
-    for i in range(0, len(tagValPairs), 2):
-        # Get the start tag
-        stTag = tagValPairs[i]
-        if (stTag != None):
-            # XML tags may have attributes eg: 'literal type="string"'
-            # So we just always use just the 1st word for end tag.
-            endTag = stTag.split()[0]
-            val = tagValPairs[i + 1]
-            xmlStr += "<{}>{}</{}>".format(stTag, val, endTag)
-    return xmlStr
+    """Forms a sequence of XML elements from pairs of start tags and
+    values. Pairs whose start tag is None are skipped. For example,
+    form("name", "x", "operator", "=") returns
+    "<name>x</name><operator>=</operator>".
+    """
+    # Fast path for the most common case of a single element.
+    if len(tagValPairs) == 2:
+        stTag = tagValPairs[0]
+        return tag(stTag).form(tagValPairs[1]) if stTag is not None else ""
+    return "".join([tag(tagValPairs[i]).form(tagValPairs[i + 1])
+                    for i in range(0, len(tagValPairs), 2)
+                    if tagValPairs[i] is not None])
 
 def formComment(text: str) -> str:
     return "<!-- {} -->".format(escapeCommentContent(text))
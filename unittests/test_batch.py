@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of converting a batch of files
+# in a pool of processes (see py2srcml/batch.py).  The units must be
+# in the order of the input files and only a bounded number of files
+# may be in flight.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import api, batch, cli
+
+class BatchTest(unittest.TestCase):
+    """Converting several files with -j 2."""
+
+    def setUp(self):
+        api.configure()
+        self.srcDir = tempfile.TemporaryDirectory()
+        # The files are larger first so that later files tend to be
+        # converted before earlier ones.
+        self.paths = []
+        for i in range(12):
+            path = os.path.join(self.srcDir.name, "f{}.py".format(i))
+            with open(path, "w") as srcFile:
+                if i == 5:
+                    srcFile.write("def broken(:\n")
+                else:
+                    srcFile.write("x{} = [{}]\n".format(i, ", ".join(
+                        str(j) for j in range(2000 // (i + 1)))))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.srcDir.cleanup()
+
+    def convert(self, jobs: int, window: int = 0) -> list:
+        """Converts the files and checks that at most window files were
+        taken from the paths ahead of the results yielded.
+        """
+        consumed = [0]
+
+        def paths():
+            for path in self.paths:
+                consumed[0] += 1
+                yield path
+
+        results = []
+        for result in batch.convertFiles(paths(), cli.convertUnit, jobs,
+                window=window, initializer=cli.setup,
+                initargs=(api.OPTIONS,)):
+            results.append(result)
+            if window > 0:
+                self.assertLessEqual(consumed[0] - len(results), window)
+        return results
+
+    def testOrder(self):
+        results = self.convert(2, window=2)
+        self.assertEqual([result.path for result in results], self.paths)
+        self.assertIsNotNone(results[5].error)
+        # The units are the same as those converted in this process
+        expected = self.convert(1)
+        self.assertEqual([result.xml for result in results],
+                         [result.xml for result in expected])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of converting an already parsed
+# module (see cli.convertTree).  The tree belongs to the caller and
+# must not be changed by the conversion.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import ast
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import api, cli, emitter
+
+SOURCE = "import os\n\ndef f(a):\n    return a + 1\n\nx = f(2)\n"
+
+class ConvertTreeTest(unittest.TestCase):
+    """Converting a module parsed by the caller."""
+
+    def tearDown(self):
+        api.configure()
+
+    def convertTree(self, tree: ast.Module, source: str = None) -> str:
+        """Converts the tree (as a.py) and returns the unit."""
+        sink = io.BytesIO()
+        out = emitter.Emitter(sink)
+        cli.convertTree(tree, "a.py", out, source)
+        out.flush()
+        return sink.getvalue().decode("utf-8")
+
+    def assertTreeUnchanged(self, source: str = None) -> None:
+        tree = ast.parse(SOURCE)
+        before = ast.dump(tree)
+        unit = self.convertTree(tree, source)
+        self.assertEqual(ast.dump(tree), before)
+        # The tree can be converted again
+        self.assertEqual(self.convertTree(tree, source), unit)
+
+    def testTreeUnchanged(self):
+        api.configure()
+        self.assertTreeUnchanged()
+
+    def testTreeUnchangedWithPositions(self):
+        api.configure(positions=True)
+        self.assertTreeUnchanged(SOURCE)
+    def testTreeUnchangedIncremental(self):
+        with tempfile.TemporaryDirectory() as stateDir:
+            api.configure(incremental=stateDir)
+            self.assertTreeUnchanged(SOURCE)
+
+if __name__ == "__main__":
+    unittest.main()
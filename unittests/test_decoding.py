@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of reading and decoding source
+# files (see cli.readSource and sourceMap.utf8Source): files with a
+# UTF-8 BOM or a PEP 263 coding cookie, read into memory or
+# memory-mapped, must be converted as their decoded text is.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import api, cli
+
+# The text of the sources (with non-ASCII characters in names, strings
+# and comments so that the byte and character columns differ).
+TEXT = 'café = "naïve"  # déjà vu\nprint(café, "¿qué?")\n'
+
+class DecodingTest(unittest.TestCase):
+    """Converting source files in different encodings."""
+
+    def setUp(self):
+        self.srcDir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.srcDir.cleanup()
+        api.configure()
+
+    def write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.srcDir.name, name)
+        with open(path, "wb") as srcFile:
+            srcFile.write(data)
+        return path
+
+    def assertDecoded(self, path: str, text: str) -> None:
+        """Checks that the file is converted (read into memory and
+        memory-mapped) as its text is, with and without positions.
+        """
+        for options in ({}, {"positions": True},
+                        {"cache_dir": os.path.join(self.srcDir.name, "cache")}):
+            with self.subTest(**options):
+                api.configure(**options)
+                expected = api.convertSource(text, path)
+                self.assertIn("naïve", expected)
+                self.assertEqual(api.convertFile(path), expected)
+                # Memory-map the file however small it is
+                with mock.patch.object(cli, "MMAP_THRESHOLD", 1):
+                    self.assertEqual(api.convertFile(path), expected)
+
+    def testUTF8BOM(self):
+        path = self.write("bom.py", b"\xef\xbb\xbf" + TEXT.encode("utf-8"))
+        self.assertDecoded(path, TEXT)
+
+    def testLatin1Cookie(self):
+        text = "# -*- coding: latin-1 -*-\n" + TEXT.replace("¿qué?", "qué")
+        path = self.write("latin1.py", text.encode("latin-1"))
+        self.assertDecoded(path, text)
+
+    def testLargeFile(self):
+        # Over the (lowered) threshold. So memory-mapped by default.
+        text = TEXT * 200
+        path = self.write("large.py", text.encode("utf-8"))
+        with mock.patch.object(cli, "MMAP_THRESHOLD", 4096):
+            self.assertGreater(os.path.getsize(path), cli.MMAP_THRESHOLD)
+            self.assertDecoded(path, text)
+            api.configure()
+            mapped = api.convertFile(path)
+        # Not memory-mapped
+        with mock.patch.object(cli, "MMAP_THRESHOLD", 0):
+            self.assertEqual(api.convertFile(path), mapped)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of incremental conversion (see
+# py2srcml/incremental.py) with position attributes.  The units
+# converted incrementally must be the same as those converted from
+# scratch.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import api
+
+class IncrementalPositionsTest(unittest.TestCase):
+    """Incremental conversion with --positions."""
+
+    def setUp(self):
+        self.stateDir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.stateDir.cleanup()
+        api.configure()
+
+    def convert(self, source: str, incremental: bool) -> str:
+        """Converts the source (as a.py) with positions."""
+        api.configure(positions=True,
+                      incremental=self.stateDir.name if incremental else None)
+        return api.convertSource(source, "a.py")
+
+    def assertSameAsScratch(self, source: str) -> None:
+        self.assertEqual(self.convert(source, True), self.convert(source, False))
+
+    def testEditedColumn(self):
+        # The fragment for b must not be reused as it moved right
+        self.convert("a = 1; b = 2\n", True)
+        self.assertSameAsScratch("a = 100; b = 2\n")
+
+    def testRepeatedStatement(self):
+        self.assertSameAsScratch("x = 1; x = 1\n")
+
+    def testNonAsciiColumn(self):
+        # Same bytes before b, but a different number of characters
+        self.convert("s = 'ab'; b = 2\n", True)
+        self.assertSameAsScratch("s = 'é'; b = 2\n")
+
+if __name__ == "__main__":
+    unittest.main()
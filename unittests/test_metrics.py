@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of the per-file metrics (see
+# py2srcml/metrics.py) written by py2srcml --metrics.  Each line must
+# have the documented fields with values consistent with the files.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import metrics
+
+GOOD = "import os\n\ndef f(a):\n    return a + 1\n"
+BAD = "def broken(:\n"
+
+class MetricsTest(unittest.TestCase):
+    """The metrics written for converted and failing files."""
+
+    def setUp(self):
+        self.srcDir = tempfile.TemporaryDirectory()
+        self.good = self.write("good.py", GOOD)
+        self.bad = self.write("bad.py", BAD)
+
+    def tearDown(self):
+        self.srcDir.cleanup()
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.srcDir.name, name)
+        with open(path, "w", encoding="utf-8") as srcFile:
+            srcFile.write(text)
+        return path
+
+    def metrics(self, files: list, *options: str) -> tuple:
+        """Converts the files and returns the exit status and the
+        metrics written.
+        """
+        path = os.path.join(self.srcDir.name, "metrics.jsonl")
+        proc = subprocess.run([sys.executable, "py2srcml.py", "--metrics",
+            path, *options] + files, cwd=ROOT, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL)
+        with open(path, encoding="utf-8") as metricsFile:
+            records = [json.loads(line) for line in metricsFile]
+        os.remove(path)
+        return proc.returncode, records
+
+    def assertConverted(self, rec: dict) -> None:
+        self.assertEqual(list(rec), list(metrics.FIELDS))
+        self.assertEqual(rec["path"], self.good)
+        self.assertEqual(rec["bytes"], len(GOOD))
+        self.assertEqual(rec["lines"], GOOD.count("\n"))
+        self.assertGreater(rec["nodes"], 1)
+        self.assertGreater(rec["depth"], 1)
+        for name in ("readTime", "parseTime", "convertTime"):
+            self.assertGreaterEqual(rec[name], 0)
+        self.assertGreater(rec["outputBytes"], len(GOOD))
+        self.assertAlmostEqual(rec["ratio"], rec["outputBytes"] / rec["bytes"])
+        self.assertEqual(rec["degraded"], 0)
+        self.assertIsNone(rec["error"])
+
+    def assertFailed(self, rec: dict) -> None:
+        self.assertEqual(list(rec), list(metrics.FIELDS))
+        self.assertEqual(rec["path"], self.bad)
+        self.assertEqual(rec["bytes"], len(BAD))
+        self.assertEqual(rec["lines"], 1)
+        # The file could not be parsed
+        self.assertIsNone(rec["nodes"])
+        self.assertIsNone(rec["outputBytes"])
+        self.assertIsNone(rec["ratio"])
+        self.assertIn("SyntaxError", rec["error"])
+
+    def testSingleFile(self):
+        status, records = self.metrics([self.good])
+        self.assertEqual(status, 0)
+        self.assertEqual(len(records), 1)
+        self.assertConverted(records[0])
+
+    def testArchive(self):
+        for options in ([], ["-j", "2"]):
+            with self.subTest(options=options):
+                status, records = self.metrics([self.good, self.bad], *options)
+                self.assertEqual(status, 1)
+                self.assertEqual(len(records), 2)
+                self.assertConverted(records[0])
+                self.assertFailed(records[1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of the profiler by type of node
+# (see py2srcml/nodeProfiler.py).  Each node must be counted once,
+# whichever way its converter walks the tree.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import os
+import sys
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import api, nodeProfiler
+
+class NodeProfilerTest(unittest.TestCase):
+    """Node counts reported by --profile-nodes."""
+
+    def setUp(self):
+        api.configure(profile_nodes=True)
+        nodeProfiler.collect()
+
+    def tearDown(self):
+        api.configure()
+        nodeProfiler.collect()
+
+    def profile(self, source: str) -> dict:
+        """Converts the source and returns the measurements."""
+        api.convertSource(source, "a.py")
+        return nodeProfiler.collect()
+
+    def testChainedAdd(self):
+        stats = self.profile("x = a + b + c + d\n")
+        self.assertEqual(stats["BinOp"]["count"], 3)
+        self.assertEqual(stats["Name"]["count"], 5)
+        # The BinOps include the time of their operands
+        self.assertGreaterEqual(stats["BinOp"]["inclusive"],
+                                stats["BinOp"]["exclusive"])
+
+    def testSameOutputWhileProfiling(self):
+        source = "x = a + b * c - d + e\n"
+        profiledXML = api.convertSource(source, "a.py")
+        api.configure()
+        self.assertEqual(profiledXML, api.convertSource(source, "a.py"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of the asyncio pipeline (see
+# py2srcml/pipeline.py): the units are written in order, the reads in
+# flight are bounded by the read-ahead, and the statistics count the
+# files (not the end markers).
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import glob
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import cli, pipeline
+
+class SlowReader:
+    """Reads files slowly and records the most reads at a time."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = self.maxActive = 0
+
+    def __call__(self, path: str) -> bytes:
+        with self.lock:
+            self.active += 1
+            self.maxActive = max(self.maxActive, self.active)
+        try:
+            time.sleep(0.01)
+            return cli.readSource(path)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+class PipelineTest(unittest.TestCase):
+    """Conversion of a batch of files via pipeline.convertFiles."""
+
+    def setUp(self):
+        self.paths = sorted(glob.glob(os.path.join(ROOT, "tests", "*.py")))
+
+    def runPipeline(self, paths, readAhead: int):
+        reader, written, stats = SlowReader(), [], {}
+        success = pipeline.convertFiles(iter(paths), reader, cli.convertUnit,
+            lambda result: written.append(result) or result.error is None,
+            jobs=2, readAhead=readAhead, stats=stats)
+        return success, reader, written, stats
+
+    def testOrderAndBounds(self):
+        success, reader, written, stats = self.runPipeline(self.paths, 3)
+        self.assertTrue(success)
+        self.assertEqual([result.path for result in written], self.paths)
+        self.assertLessEqual(reader.maxActive, 3)
+        self.assertLessEqual(stats["read"]["maxDepth"], 3)
+        self.assertEqual(stats["read"]["items"], len(self.paths))
+        self.assertEqual(stats["convert"]["items"], len(self.paths))
+
+    def testUnreadableFile(self):
+        paths = [self.paths[0], os.path.join(ROOT, "missing.py")]
+        success, _, written, stats = self.runPipeline(paths, 2)
+        self.assertFalse(success)
+        self.assertIn("FileNotFoundError", written[1].error)
+        self.assertEqual(stats["read"]["items"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
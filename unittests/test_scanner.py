@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of finding the source files in
+# a directory tree (see py2srcml/scanner.py), sequentially and with
+# several threads, when some entries cannot be checked.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import scanner
+
+class FailingFilter(scanner.SourceFilter):
+    """A filter that fails for the entries with a given name, as if
+    they could not be checked.
+    """
+
+    def __init__(self, name: str, error: Exception):
+        super().__init__()
+        self.name, self.error = name, error
+
+    def isSource(self, entry: os.DirEntry, relPath: str) -> bool:
+        if entry.name == self.name:
+            raise self.error
+        return super().isSource(entry, relPath)
+
+    def isExcluded(self, name: str, relPath: str) -> bool:
+        if name == self.name:
+            raise self.error
+        return super().isExcluded(name, relPath)
+
+class ScannerTest(unittest.TestCase):
+    """Scanning a tree with entries that cannot be checked."""
+
+    def setUp(self):
+        self.rootDir = tempfile.TemporaryDirectory()
+        self.root = self.rootDir.name
+        os.mkdir(os.path.join(self.root, "sub"))
+        for relPath in ("a.py", "b.py", "c.py", "sub/d.py"):
+            with open(os.path.join(self.root, relPath), "w") as srcFile:
+                srcFile.write("x = 1\n")
+
+    def tearDown(self):
+        self.rootDir.cleanup()
+
+    def find(self, srcFilter: scanner.SourceFilter, threads: int) -> list:
+        paths = scanner.findSources([self.root], srcFilter, threads)
+        return sorted(os.path.relpath(path, self.root) for path in paths)
+
+    def testUncheckedEntrySkipped(self):
+        # Only the entry is skipped, not the rest of the directory
+        srcFilter = FailingFilter("b.py", PermissionError("b.py"))
+        expected = ["a.py", "c.py", os.path.join("sub", "d.py")]
+        self.assertEqual(self.find(srcFilter, 0), expected)
+        self.assertEqual(self.find(srcFilter, 4), expected)
+
+    def testThreadErrorRaised(self):
+        # The caller gets the exception instead of waiting forever
+        srcFilter = FailingFilter("sub", RuntimeError("sub"))
+        with self.assertRaises(RuntimeError):
+            self.find(srcFilter, 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of the server and its client
+# (see py2srcml/server.py and py2srcml/client.py).  A server is
+# started on a socket in a temporary directory and the output of the
+# client must be the same as converting the files with py2srcml.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import api, cli, client, emitter, srcMLFormats
+
+# The sample inputs that are converted
+FILES = [os.path.join(ROOT, "tests", name)
+         for name in ("simple.py", "simple_if.py")]
+
+class ServerTest(unittest.TestCase):
+    """Converting files via a running server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.socketDir = tempfile.TemporaryDirectory()
+        cls.socketPath = os.path.join(cls.socketDir.name, "py2srcml.sock")
+        cls.server = subprocess.Popen([sys.executable, "-m", "py2srcml.server",
+            "--socket", cls.socketPath], cwd=ROOT, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 30
+        while True:
+            conn = client.connect(cls.socketPath)
+            if conn is not None:
+                conn.close()
+                break
+            if time.monotonic() > deadline or cls.server.poll() is not None:
+                cls.tearDownClass()
+                raise RuntimeError("The server did not start")
+            time.sleep(0.05)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.terminate()
+        cls.server.wait()
+        cls.socketDir.cleanup()
+
+    def viaServer(self, files: list) -> bytes:
+        """Returns the output of the client for the files."""
+        conn = client.connect(self.socketPath)
+        self.assertIsNotNone(conn)
+        sink = io.BytesIO()
+        with conn:
+            self.assertTrue(client.convertFiles(conn, files, sink,
+                                                len(files) > 1))
+        return sink.getvalue()
+
+    def testSameAsConvertSource(self):
+        api.configure()
+        with open(FILES[0], "rb") as srcFile:
+            source = srcFile.read()
+        sink = io.BytesIO()
+        out = emitter.Emitter(sink)
+        cli.convertSource(source, FILES[0], out)
+        out.flush()
+        expected = srcMLFormats.PROLOG.encode() + b"\n" + sink.getvalue()
+        self.assertEqual(self.viaServer(FILES[:1]), expected)
+
+    def testArchiveSameAsConverter(self):
+        expected = subprocess.run([sys.executable, "py2srcml.py"] + FILES,
+            cwd=ROOT, check=True, stdout=subprocess.PIPE).stdout
+        self.assertEqual(self.viaServer(FILES), expected)
+
+if __name__ == "__main__":
+    unittest.main()
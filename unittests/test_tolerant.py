@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of the tolerant mode (see
+# stmt2srcml.convertUnhandled): the statements reported as degraded
+# must be the placeholders in the generated srcML, including when a
+# statement is converted again after a RecursionError.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import collections
+import os
+import re
+import sys
+import unittest
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import api
+
+# An expression nested too deeply for the recursive converters
+DEEP = "a" + "[0]" * 600
+
+# A statement that is not handled (replaced by a placeholder)
+UNHANDLED = "    with a:\n        pass\n"
+
+class TolerantTest(unittest.TestCase):
+    """The degraded statements reported in tolerant mode."""
+
+    def setUp(self):
+        api.configure(tolerant=True)
+
+    def tearDown(self):
+        api.configure()
+
+    def assertDegradedMatchesXML(self, source: str) -> dict:
+        info = {}
+        xml = api.convertSource(source, "a.py", info)
+        placeholders = collections.Counter(
+            re.findall(r'<py:unhandled type="(\w+)"', xml))
+        self.assertEqual(dict(placeholders), info.get("degraded", {}))
+        return info["degraded"]
+
+    def testRetryAfterRecursionError(self):
+        # The try statement is converted again (iteratively) as its
+        # handler is too deep; the with statement is counted once.
+        degraded = self.assertDegradedMatchesXML(
+            "try:\n" + UNHANDLED + "except " + DEEP + ":\n    pass\n")
+        self.assertEqual(degraded, {"With": 1})
+
+    def testPlaceholderForOuterStatement(self):
+        # The placeholders within a statement replaced by a placeholder
+        # are not counted.
+        self.assertDegradedMatchesXML(
+            "if a:\n" + UNHANDLED + "elif " + DEEP + ":\n    pass\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+
+#-----------------------------------------------------------------------
+#  This file is part of Python to srcML (py2srcm)
+#
+#  Py2srcML is free software:  you can  redistribute it and/or  modify it
+#  under the terms of the GNU  General Public License  (GPL) as published
+#  by  the   Free  Software Foundation, either version 3 (GPL v3), or (at
+#  your option) a later version.
+#
+#  Py2srcML is being distributed in the hope that it will  be useful, but
+#  WITHOUT  ANY  WARRANTY;  without  even  the IMPLIED WARRANTY of  MERC-
+#  HANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  Miami University  and  our development team make no representations or
+#  warranties  about the suitability  of the software, either express  or
+#  implied, including but not limited to the implied warranties of merch-
+#  antability, fitness  for a  particular  purpose,  or non-infringement.
+#  Miami  University  and  its  affiliates  shall  not  be liable for any
+#  damages suffered by the  licensee as a result of using, modifying,  or
+#  distributing this software  or its derivatives.
+#
+#  By using or  copying  this  Software,  Licensee  agree to abide  by the 
+#  intellectual property laws, and all other applicable laws of  the U.S.,
+#  and the terms of the   GNU  General  Public  License  (version 3).  You  
+#  should  have  received a  copy of the  GNU General Public License along
+#  with Py2srcML.  If not, you  may  download  copies  of the GPL V3  from
+#  <http://www.gnu.org/licenses/>.
+#
+# Author(s):   
+#     DJ Rao               raodm@miamioh.edu
+#------------------------------------------------------------------------
+
+# This source file contains the tests of the on-disk cache of
+# converted units (see py2srcml/unitCache.py): hits, cached failures,
+# keys that change with the converter, Python version or options,
+# and eviction of entries beyond the maximum size.
+#
+# The tests are meant to be run in the following manner:
+#    $ python3 -m unittest discover -s unittests
+
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+# Setup path to the py2srcml modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from py2srcml import unitCache
+
+SOURCE = b"x = 1\n"
+BODY = b"<expr_stmt>...</expr_stmt>\n"
+
+class UnitCacheTest(unittest.TestCase):
+    """Looking up, storing, and evicting cached units."""
+
+    def setUp(self):
+        self.cacheDir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cacheDir.cleanup()
+
+    def open(self, maxSize: int = unitCache.DEFAULT_MAX_SIZE,
+             variant: str = "") -> unitCache.UnitCache:
+        return unitCache.UnitCache(self.cacheDir.name, maxSize, variant)
+
+    def testHit(self):
+        cache = self.open()
+        cache.store(cache.key(SOURCE), BODY)
+        # Found by another process using the same directory
+        cache = self.open()
+        self.assertEqual(cache.lookup(cache.key(SOURCE)), BODY)
+        self.assertEqual(cache.lookup(cache.key(b"x = 2\n")), None)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def testNegativeHit(self):
+        cache = self.open()
+        cache.storeFailure(cache.key(SOURCE), "Exception: Unhandled")
+        with self.assertRaisesRegex(unitCache.CachedFailure, "Unhandled"):
+            cache.lookup(cache.key(SOURCE))
+        self.assertEqual(cache.negativeHits, 1)
+
+    def testVariantMiss(self):
+        cache = self.open()
+        cache.store(cache.key(SOURCE), BODY)
+        cache = self.open(variant="positions")
+        self.assertIsNone(cache.lookup(cache.key(SOURCE)))
+
+    def testConverterVersionMiss(self):
+        cache = self.open()
+        cache.store(cache.key(SOURCE), BODY)
+        with mock.patch.object(unitCache, "converterVersion", lambda: "0" * 16):
+            cache = self.open()
+        self.assertIsNone(cache.lookup(cache.key(SOURCE)))
+
+    def testPythonVersionMiss(self):
+        cache = self.open()
+        cache.store(cache.key(SOURCE), BODY)
+        other = types.SimpleNamespace(version_info=(3, 0, 0, "final", 0))
+        with mock.patch.object(unitCache, "sys", other):
+            cache = self.open()
+        self.assertIsNone(cache.lookup(cache.key(SOURCE)))
+
+    def totalSize(self, cache: unitCache.UnitCache) -> int:
+        return sum(size for _, size, _ in cache.entries())
+
+    def testEvictionOnStore(self):
+        cache = self.open(maxSize=1000)
+        for i in range(10):
+            cache.store(cache.key(b"x = %d\n" % i), b"." * 300)
+        self.assertGreater(cache.evictions, 0)
+        self.assertLessEqual(self.totalSize(cache), 1000)
+
+    def testTrimWarmCache(self):
+        # A cache filled with a larger limit is trimmed even if no
+        # entries are stored.
+        cache = self.open()
+        for i in range(10):
+            cache.store(cache.key(b"x = %d\n" % i), b"." * 300)
+        cache = self.open(maxSize=1000)
+        for i in range(10):
+            cache.lookup(cache.key(b"x = %d\n" % i))
+        cache.trim()
+        self.assertGreater(cache.evictions, 0)
+        self.assertLessEqual(self.totalSize(cache), 1000)
+
+if __name__ == "__main__":
+    unittest.main()